@@ -0,0 +1,146 @@
+"""
+Deterministic synthetic graph generators for benchmarks
+
+Every generator takes a target number of edges and a seed and yields
+(u, v, weight) tuples, so graphs of 10^7 edges can be streamed to a file
+without building them in memory first. Vertices are named v0, v1, ...
+"""
+
+import math
+import random
+
+
+def grid_edges(num_edges, seed=0):
+    """Road-like grid: each vertex is joined to its right and lower neighbor
+    
+    A square grid of side n has 2 * n * (n - 1) edges. Weights are random
+    travel times between 1 and 10.
+    """
+    rng = random.Random(seed)
+    side = max(2, int(math.sqrt(num_edges / 2)) + 1)
+    
+    for row in range(side):
+        for col in range(side):
+            vertex = row * side + col
+            if col + 1 < side:
+                yield f"v{vertex}", f"v{vertex + 1}", rng.randint(1, 10)
+            if row + 1 < side:
+                yield f"v{vertex}", f"v{vertex + side}", rng.randint(1, 10)
+
+
+def random_geometric_points(num_edges, seed=0, average_degree=8):
+    """Points of the random geometric graph with num_edges edges
+    
+    Returns:
+        List of (x, y) coordinates in the unit square, and the radius
+    """
+    rng = random.Random(seed)
+    num_vertices = max(2, 2 * num_edges // average_degree)
+    
+    # Expected degree is n * pi * r^2
+    radius = math.sqrt(average_degree / (num_vertices * math.pi))
+    points = [(rng.random(), rng.random()) for _ in range(num_vertices)]
+    
+    return points, radius
+
+
+def random_geometric_edges(num_edges, seed=0, average_degree=8):
+    """Random geometric graph: points closer than a radius are joined
+    
+    Weights are the Euclidean distances. Neighbors are found with a grid
+    of cells of the radius size, so generation stays linear.
+    """
+    points, radius = random_geometric_points(num_edges, seed, average_degree)
+    
+    cells = {}
+    for index, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(index)
+    
+    for (cx, cy), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                others = cells.get((cx + dx, cy + dy), ())
+                for i in members:
+                    xi, yi = points[i]
+                    for j in others:
+                        if j <= i:
+                            continue
+                        distance = math.hypot(xi - points[j][0], yi - points[j][1])
+                        if distance <= radius:
+                            yield f"v{i}", f"v{j}", round(distance, 6)
+
+
+def erdos_renyi_edges(num_edges, seed=0, average_degree=8):
+    """Erdős–Rényi G(n, m) graph with uniformly random edges and weights"""
+    rng = random.Random(seed)
+    num_vertices = max(2, 2 * num_edges // average_degree)
+    
+    for _ in range(num_edges):
+        u = rng.randrange(num_vertices)
+        v = rng.randrange(num_vertices - 1)
+        if v >= u:
+            v += 1
+        yield f"v{u}", f"v{v}", rng.randint(1, 100)
+
+
+def scale_free_edges(num_edges, seed=0, edges_per_vertex=4):
+    """Scale-free Barabási–Albert graph built by preferential attachment"""
+    rng = random.Random(seed)
+    m = edges_per_vertex
+    num_vertices = max(m + 1, num_edges // m)
+    
+    # Every edge endpoint is listed once, so picking uniformly from this
+    # list picks vertices proportionally to their degree
+    endpoints = []
+    
+    for u in range(m + 1):
+        for v in range(u + 1, m + 1):
+            endpoints.extend((u, v))
+            yield f"v{u}", f"v{v}", rng.randint(1, 100)
+    
+    for u in range(m + 1, num_vertices):
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(endpoints))
+        for v in targets:
+            endpoints.extend((u, v))
+            yield f"v{u}", f"v{v}", rng.randint(1, 100)
+
+
+def chain_edges(num_edges, seed=0):
+    """Long chain v0 - v1 - ... - vn, the deepest possible shortest path tree"""
+    rng = random.Random(seed)
+    
+    for vertex in range(num_edges):
+        yield f"v{vertex}", f"v{vertex + 1}", rng.randint(1, 10)
+
+
+GENERATORS = {
+    'grid': grid_edges,
+    'geometric': random_geometric_edges,
+    'erdos_renyi': erdos_renyi_edges,
+    'scale_free': scale_free_edges,
+    'chain': chain_edges,
+}
+
+
+def write_edge_list(edges, filename, directed=False):
+    """Write generated edges in the edge list format
+    
+    Args:
+        edges: Iterable of (u, v, weight) tuples
+        filename: Output filename
+        directed: Write a 'directed' header instead of 'undirected'
+        
+    Returns:
+        Number of edges written
+    """
+    count = 0
+    
+    with open(filename, 'w') as f:
+        f.write('directed\n' if directed else 'undirected\n')
+        for u, v, weight in edges:
+            f.write(f"{u} {v} {weight}\n")
+            count += 1
+    
+    return count
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark of vertex orderings (src/reorder.py)
+
+For every ordering the generated graph is laid out as CSR arrays in that
+order and rebuilt from them, as load_graph_from_file does for binary
+files, so the Python objects of the adjacency lists are also allocated in
+that order. The script reports how far apart the endpoints of edges are
+numbered, the time of dijkstra() on the rebuilt graph, the time of the
+compiled search kernel on the CSR arrays (with Numba) and the size of
+the compressed adjacency lists. A random order shows the cost of no
+locality.
+
+Examples:
+    python benchmarks/ordering_benchmark.py
+    python benchmarks/ordering_benchmark.py --sizes 1000000 --generators geometric
+"""
+
+import argparse
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.generators import GENERATORS, random_geometric_points
+from benchmarks.run_benchmarks import time_call
+from src.compressed import CompressedGraph
+from src.csr import CSRGraph
+from src.dijkstra import dijkstra
+from src.engines import NUMBA_AVAILABLE
+from src.graph import Graph
+from src.memory import format_bytes
+from src.reorder import edge_locality, vertex_order
+
+
+def build_graph(generator, size, seed):
+    """Build a generated graph in memory, with coordinates where known"""
+    graph = Graph()
+    for u, v, weight in GENERATORS[generator](size, seed):
+        graph.add_edge(u, v, weight)
+    
+    if generator == 'geometric':
+        points, _ = random_geometric_points(size, seed)
+        graph.coordinates = {f"v{i}": point for i, point in enumerate(points)
+                             if f"v{i}" in graph.vertices}
+    
+    return graph
+
+
+def benchmark_ordering(graph, order, start, repeat):
+    """Measure one vertex ordering
+    
+    Returns:
+        Dictionary with locality, timings in seconds and compressed size
+    """
+    csr = CSRGraph.from_graph(graph, order)
+    laid_out = csr.to_graph()
+    
+    result = edge_locality(csr)
+    result['dijkstra'], _ = time_call(lambda: dijkstra(laid_out, start), repeat)
+    
+    # Only the compiled search itself, without converting its results to dictionaries
+    if NUMBA_AVAILABLE:
+        from src.numba_engine import _compile
+        
+        kernel = _compile()
+        source = csr.index[start]
+        
+        # An untimed run first, so the first ordering does not include the
+        # compilation (or cache loading) of the kernel even with --repeat 1
+        kernel(csr.indptr, csr.indices, csr.weights, source)
+        result['numba'], _ = time_call(
+            lambda: kernel(csr.indptr, csr.indices, csr.weights, source), repeat)
+    
+    result['compressed_bytes'] = CompressedGraph.from_graph(graph, order=order).memory_bytes()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare vertex orderings on synthetic graphs")
+    parser.add_argument('--generators', '-g', nargs='+', choices=sorted(GENERATORS),
+                        default=['grid', 'geometric'], help='Graph generators to run')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[100000],
+                        help='Target numbers of edges')
+    parser.add_argument('--repeat', '-r', type=int, default=3,
+                        help='Repetitions per search, the best time is kept')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the generators')
+    args = parser.parse_args()
+    
+    columns = ['mean gap', 'bandwidth', 'dijkstra'] + (['numba'] if NUMBA_AVAILABLE else [])
+    print(f"{'Graph':<20} {'Order':<9} " + " ".join(f"{name:>11}" for name in columns) +
+          f" {'compressed':>11}")
+    print("-" * (31 + 12 * (len(columns) + 1)))
+    
+    for generator in args.generators:
+        for size in args.sizes:
+            graph = build_graph(generator, size, args.seed)
+            start = min(graph.vertices, key=lambda vertex: int(vertex[1:]))
+            
+            orders = {'random': sorted(graph.vertices, key=str)}
+            random.Random(args.seed).shuffle(orders['random'])
+            for method in ['sorted', 'bfs', 'rcm'] + (['hilbert'] if graph.coordinates else []):
+                orders[method] = vertex_order(graph, method)
+            
+            for method, order in orders.items():
+                result = benchmark_ordering(graph, order, start, args.repeat)
+                timings = [f"{result['dijkstra'] * 1000:>9.1f}ms"]
+                if NUMBA_AVAILABLE:
+                    timings.append(f"{result['numba'] * 1000:>9.1f}ms")
+                
+                print(f"{f'{generator} {size}':<20} {method:<9} {result['mean_gap']:>11.1f} "
+                      f"{result['bandwidth']:>11} " + " ".join(timings) +
+                      f" {format_bytes(result['compressed_bytes']):>11}")
+
+
+if __name__ == '__main__':
+    main()
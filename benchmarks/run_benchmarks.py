@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for graph loading, search, statistics and export
+
+Generates deterministic synthetic graphs, times the main operations on
+each of them and writes the results as JSON, so that runs from different
+commits can be compared with --compare.
+
+Examples:
+    python benchmarks/run_benchmarks.py -o benchmarks/results/before.json
+    python benchmarks/run_benchmarks.py --sizes 1000 100000 --generators grid chain
+    python benchmarks/run_benchmarks.py -o after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.generators import GENERATORS, write_edge_list
+from src.compressed import CompressedGraph
+from src.dijkstra import dijkstra, dijkstra_path
+from src.engines import NUMBA_AVAILABLE
+from src.file_handler import export_graph_to_json, load_graph_from_file
+from src.memory import format_bytes, measure_graph_memory, profile_search_memory
+
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Slowdowns above this ratio are reported as regressions
+REGRESSION_THRESHOLD = 1.10
+
+
+def time_call(function, repeat):
+    """Call a function repeatedly and return the best time and last result
+    
+    Args:
+        function: Function without arguments
+        repeat: Number of calls
+        
+    Returns:
+        Tuple of (seconds, result)
+    """
+    best = float('inf')
+    result = None
+    
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start_time)
+    
+    return best, result
+
+
+def benchmark_graph(filename, repeat, workdir, memory=False):
+    """Time all operations on one generated graph file
+    
+    Args:
+        filename: Edge list file
+        repeat: Number of repetitions per operation (best time is kept)
+        workdir: Directory for exported files
+        memory: Also measure memory of loading and searching, in separate
+                runs so that tracing does not slow down the timed ones
+                
+    Returns:
+        Dictionary with graph size, timings in seconds and optional memory report
+    """
+    timings = {}
+    
+    timings['load'], graph = time_call(lambda: load_graph_from_file(filename), repeat)
+    
+    # Generated vertices are named v0 .. vN, search from the first to the last
+    vertex_ids = sorted(int(vertex[1:]) for vertex in graph.vertices)
+    start, end = f"v{vertex_ids[0]}", f"v{vertex_ids[-1]}"
+    
+    timings['dijkstra'], (distances, _) = time_call(lambda: dijkstra(graph, start), repeat)
+    timings['dijkstra_path'], _ = time_call(lambda: dijkstra_path(graph, start, end), repeat)
+    timings['stats'], stats = time_call(graph.get_graph_stats, repeat)
+    
+    export_file = os.path.join(workdir, 'export.json')
+    timings['export'], _ = time_call(lambda: export_graph_to_json(graph, export_file), repeat)
+    
+    result = {
+        'vertices': stats['num_vertices'],
+        'edges': stats['num_edges'],
+        'timings': timings
+    }
+    
+    if NUMBA_AVAILABLE:
+        from src.csr import CSRGraph
+        from src.numba_engine import numba_dijkstra
+        
+        # The first call compiles (or loads the cached code) and builds the CSR arrays
+        timings['csr'], _ = time_call(lambda: CSRGraph.from_graph(graph), repeat)
+        numba_dijkstra(graph, start)
+        timings['numba'], (numba_distances, _) = time_call(lambda: numba_dijkstra(graph, start),
+                                                           repeat)
+        
+        # Results must match the pure-Python search
+        result['numba_matches'] = distances.keys() == numba_distances.keys() and all(
+            abs(distances[vertex] - numba_distances[vertex]) <= 1e-9 * max(1.0, distances[vertex])
+            or distances[vertex] == numba_distances[vertex] for vertex in distances)
+    
+    if memory:
+        del graph
+        graph, load_report = measure_graph_memory(lambda: load_graph_from_file(filename))
+        _, _, search_report = profile_search_memory(graph, start)
+        result['memory'] = {**load_report, **search_report}
+        
+        # Compressed adjacency: size and cost of searching it directly
+        compressed = CompressedGraph.from_graph(graph)
+        search_time, (compressed_distances, _) = time_call(lambda: dijkstra(compressed, start), 1)
+        result['memory']['compressed'] = {
+            'total_bytes': compressed.memory_bytes(),
+            'bytes_per_edge': compressed.memory_bytes() / max(1, compressed.num_edges),
+            'dijkstra': search_time,
+            'max_error': max((abs(distances[vertex] - compressed_distances[vertex])
+                              for vertex in distances if distances[vertex] != float('inf')),
+                             default=0.0)
+        }
+    
+    return result
+
+
+def git_commit():
+    """Get the current git commit hash, or None outside a git checkout"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(current, baseline):
+    """Print timing ratios against a baseline run
+    
+    Args:
+        current: Results dictionary of this run
+        baseline: Results dictionary of an earlier run
+        
+    Returns:
+        Number of regressions found
+    """
+    previous = {(r['generator'], r['size']): r for r in baseline['results']}
+    regressions = 0
+    
+    print(f"\nComparison with {baseline.get('commit') or 'baseline'}:")
+    print(f"{'Graph':<24} {'Operation':<15} {'Before':>10} {'After':>10} {'Ratio':>7}")
+    print("-" * 70)
+    
+    for result in current['results']:
+        key = (result['generator'], result['size'])
+        if key not in previous:
+            continue
+        
+        for operation, seconds in result['timings'].items():
+            before = previous[key]['timings'].get(operation)
+            if not before:
+                continue
+            
+            ratio = seconds / before
+            marker = ""
+            if ratio > REGRESSION_THRESHOLD:
+                marker = "  ⚠️ slower"
+                regressions += 1
+            
+            name = f"{key[0]} {key[1]}"
+            print(f"{name:<24} {operation:<15} {before * 1000:>8.1f}ms "
+                  f"{seconds * 1000:>8.1f}ms {ratio:>6.2f}x{marker}")
+    
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Dijkstra's algorithm on synthetic graphs")
+    parser.add_argument('--generators', '-g', nargs='+', choices=sorted(GENERATORS),
+                        default=sorted(GENERATORS), help='Graph generators to run')
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES,
+                        help='Target numbers of edges (10^3 to 10^7)')
+    parser.add_argument('--repeat', '-r', type=int, default=3,
+                        help='Repetitions per operation, the best time is kept')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the generators')
+    parser.add_argument('--output', '-o', help='Write results as JSON to this file')
+    parser.add_argument('--compare', '-c', help='JSON results of an earlier run to compare with')
+    parser.add_argument('--memory', '-m', action='store_true',
+                        help='Also measure memory per vertex, per edge and during search')
+    args = parser.parse_args()
+    
+    run = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'results': []
+    }
+    
+    operations = ['load', 'dijkstra', 'dijkstra_path', 'stats', 'export']
+    if NUMBA_AVAILABLE:
+        operations += ['csr', 'numba']
+    
+    print(f"{'Graph':<24} {'V':>9} {'E':>9} " + " ".join(f"{name:>13}" for name in operations))
+    print("-" * (44 + 14 * len(operations)))
+    
+    mismatches = 0
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        for generator in args.generators:
+            for size in args.sizes:
+                filename = os.path.join(workdir, f"{generator}_{size}.txt")
+                write_edge_list(GENERATORS[generator](size, args.seed), filename)
+                
+                result = benchmark_graph(filename, args.repeat, workdir, args.memory)
+                result = {'generator': generator, 'size': size, **result}
+                run['results'].append(result)
+                
+                os.remove(filename)
+                
+                name = f"{generator} {size}"
+                print(f"{name:<24} {result['vertices']:>9} {result['edges']:>9} " +
+                      " ".join(f"{seconds * 1000:>11.1f}ms" for seconds in result['timings'].values()))
+                
+                if result.get('numba_matches') is False:
+                    print(f"{'':<24} ⚠️  Numba distances differ from dijkstra()")
+                    mismatches += 1
+                
+                if args.memory:
+                    memory = result['memory']
+                    adjacency = memory['adjacency']
+                    print(f"{'':<24} memory: {adjacency['bytes_per_vertex']:.1f} B/vertex, "
+                          f"{adjacency['bytes_per_edge']:.1f} B/edge, "
+                          f"search peak {format_bytes(memory['search_peak_bytes'])}")
+                    compressed = memory['compressed']
+                    print(f"{'':<24} compressed: {compressed['bytes_per_edge']:.1f} B/edge "
+                          f"({format_bytes(compressed['total_bytes'])}), "
+                          f"dijkstra {compressed['dijkstra'] * 1000:.1f}ms, "
+                          f"max distance error {compressed['max_error']:.2g}")
+    
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"\nResults saved to '{args.output}'")
+    
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        if compare_results(run, baseline):
+            sys.exit(1)
+    
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
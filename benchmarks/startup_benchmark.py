@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Startup time benchmark for the command line application
+
+Runs main.py without --visualize several times and reports how long each
+process takes, and checks that the plotting libraries are not imported.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs main.py in-process and prints which plotting modules got imported
+IMPORT_CHECK = """
+import runpy, sys
+sys.argv = ['main.py'] + sys.argv[1:]
+runpy.run_path('main.py', run_name='__main__')
+loaded = [m for m in ('matplotlib', 'matplotlib.pyplot', 'networkx') if m in sys.modules]
+print('PLOTTING_MODULES=' + ','.join(loaded))
+"""
+
+
+def time_cli(cli_args, runs):
+    """Run main.py as a new process and measure wall time
+    
+    Args:
+        cli_args: Arguments passed to main.py
+        runs: Number of runs
+        
+    Returns:
+        List of run times in milliseconds
+    """
+    times = []
+    
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, 'main.py'] + cli_args, cwd=ROOT,
+                       stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start_time) * 1000)
+    
+    return times
+
+
+def plotting_modules_loaded(cli_args):
+    """Return the plotting modules imported by a headless run of main.py"""
+    result = subprocess.run([sys.executable, '-c', IMPORT_CHECK] + cli_args, cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    
+    for line in result.stdout.splitlines():
+        if line.startswith('PLOTTING_MODULES='):
+            value = line.split('=', 1)[1]
+            return value.split(',') if value else []
+    
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup time of main.py")
+    parser.add_argument('--runs', '-n', type=int, default=10, help='Number of runs')
+    parser.add_argument('--input', default='tests/image_graph.txt', help='Graph file to load')
+    parser.add_argument('--start', '-s', default='1', help='Start vertex')
+    args = parser.parse_args()
+    
+    cli_args = [args.input, '-s', args.start]
+    
+    # Baseline: bare interpreter startup
+    baseline = []
+    for _ in range(args.runs):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        baseline.append((time.perf_counter() - start_time) * 1000)
+    
+    times = time_cli(cli_args, args.runs)
+    
+    print(f"Headless run: python main.py {' '.join(cli_args)}")
+    print(f"  Runs: {args.runs}")
+    print(f"  Interpreter only: {statistics.median(baseline):.1f} ms (median)")
+    print(f"  main.py:          {statistics.median(times):.1f} ms (median), "
+          f"{min(times):.1f} ms (min)")
+    print(f"  Overhead:         {statistics.median(times) - statistics.median(baseline):.1f} ms")
+    
+    loaded = plotting_modules_loaded(cli_args)
+    if loaded:
+        print(f"  ❌ Plotting modules imported without --visualize: {', '.join(loaded)}")
+        sys.exit(1)
+    
+    print("  Plotting modules imported: none")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,36 +5,53 @@ Main application for finding shortest paths using Dijkstra's algorithm
 """
 
 import argparse
+import json
 import os
 import sys
 from src.graph import Graph
-from src.dijkstra import dijkstra
-from src.visualization import visualize_dijkstra_complete, visualize_path_with_info
-from src.file_handler import load_graph_from_file, save_results
+from src.engines import ENGINES, SCIPY_AVAILABLE, choose_engine, shortest_paths
+from src.file_handler import load_graph_from_file, load_queries_from_file, save_results
+from src.instrumentation import SearchStats
+from src.reorder import ORDERINGS
 
 
-def build_results_text(graph, start, distances, predecessors, end=None):
+def graph_info_lines(stats):
+    """Build the graph information lines of the results text"""
+    return [
+        "Graph Information:",
+        f"  Vertices: {stats['num_vertices']}",
+        f"  Edges: {stats['num_edges']}",
+        f"  Type: {'Directed' if stats['directed'] else 'Undirected'}",
+        f"  Total weight: {stats['total_weight']}",
+        f"  Average weight: {stats['average_weight']:.2f}"
+    ]
+
+
+def build_results_text(graph, start, distances, predecessors, end=None, engine='dijkstra'):
     """Build formatted results text for display"""
     results = []
     
     # Header
     results.append("=" * 50)
-    results.append("Dijkstra's Shortest Path Algorithm")
+    if engine == 'bellman_ford':
+        results.append("Bellman-Ford Shortest Path Algorithm")
+    else:
+        results.append("Dijkstra's Shortest Path Algorithm")
     results.append("=" * 50)
     results.append("")
     
     # Graph info
     stats = graph.get_graph_stats()
-    results.append("Graph Information:")
-    results.append(f"  Vertices: {stats['num_vertices']}")
-    results.append(f"  Edges: {stats['num_edges']}")
-    results.append(f"  Type: {'Directed' if stats['directed'] else 'Undirected'}")
-    results.append(f"  Total weight: {stats['total_weight']}")
-    results.append(f"  Average weight: {stats['average_weight']:.2f}")
+    results.extend(graph_info_lines(stats))
     
     if stats['has_negative_edges']:
         results.append("\n⚠️  WARNING: Graph contains negative edges!")
-        results.append("Dijkstra may not produce correct results.")
+        if engine == 'bellman_ford':
+            results.append("Distances were computed with the Bellman-Ford algorithm.")
+        elif engine == 'scipy':
+            results.append("Distances were computed with Johnson's algorithm (SciPy).")
+        else:
+            results.append("Dijkstra may not produce correct results.")
     
     results.append("")
     results.append(f"Start vertex: {start}")
@@ -44,6 +61,10 @@ def build_results_text(graph, start, distances, predecessors, end=None):
     if end:
         if end not in graph.vertices:
             results.append(f"❌ Error: End vertex '{end}' not found!")
+        elif graph.cannot_reach(start, end):
+            results.append(f"No path exists from {start} to {end}")
+        elif end not in distances:
+            results.append(f"{end} was not reached within the search limits")
         else:
             path = graph.reconstruct_path(predecessors, start, end)
             if path is None or distances[end] == float('inf'):
@@ -69,17 +90,132 @@ def build_results_text(graph, start, distances, predecessors, end=None):
         results.append("Shortest distances from start:")
         results.append("-" * 40)
         
-        for vertex in sorted(graph.vertices):
+        # Bounded searches return only the vertices they reached
+        if len(distances) < len(graph.vertices):
+            results.append(f"Vertices within the search limits: {len(distances)}")
+        
+        # Collect short paths in one walk of the shortest path tree
+        short_paths = {
+            vertex: ' -> '.join(path)
+            for vertex, path in graph.iter_tree_paths(predecessors, start, max_length=5)
+        }
+        
+        for vertex in sorted(distances):
             if distances[vertex] == float('inf'):
                 results.append(f"{start} → {vertex}: No path")
             else:
                 results.append(f"{start} → {vertex}: {distances[vertex]}")
                 
                 # Show path for close vertices (optional)
-                if distances[vertex] > 0 and distances[vertex] < float('inf'):
-                    path = graph.reconstruct_path(predecessors, start, vertex)
-                    if path and len(path) <= 5:  # Only show short paths
-                        results.append(f"   Path: {' -> '.join(path)}")
+                if distances[vertex] > 0 and vertex in short_paths:
+                    results.append(f"   Path: {short_paths[vertex]}")
+    
+    return "\n".join(results)
+
+
+def build_voronoi_text(graph, sources, distances, predecessors, owners, end=None):
+    """Build formatted multi-source results text for display"""
+    results = []
+    
+    # Header
+    results.append("=" * 50)
+    results.append("Multi-Source Dijkstra (Voronoi Partition)")
+    results.append("=" * 50)
+    results.append("")
+    results.extend(graph_info_lines(graph.get_graph_stats()))
+    results.append("")
+    results.append(f"Start vertices: {', '.join(sources)}")
+    results.append("")
+    
+    # If specific end vertex is requested
+    if end:
+        if end not in graph.vertices:
+            results.append(f"❌ Error: End vertex '{end}' not found!")
+        elif owners[end] is None:
+            results.append(f"No start vertex can reach {end}")
+        else:
+            path = graph.reconstruct_path(predecessors, owners[end], end)
+            results.append(f"Nearest start vertex to {end}: {owners[end]}")
+            results.append(f"Path: {' -> '.join(map(str, path))}")
+            results.append(f"Total distance: {distances[end]}")
+        return "\n".join(results)
+    
+    # Cell sizes
+    cell_sizes = {source: 0 for source in sources}
+    for owner in owners.values():
+        if owner is not None:
+            cell_sizes[owner] += 1
+    
+    results.append("Vertices per start vertex:")
+    for source in sources:
+        results.append(f"  {source}: {cell_sizes[source]}")
+    results.append("")
+    
+    results.append("Nearest start vertex and distance:")
+    results.append("-" * 40)
+    
+    # Every source is the root of its own tree
+    short_paths = {}
+    for source in sources:
+        for vertex, path in graph.iter_tree_paths(predecessors, source, max_length=5):
+            short_paths[vertex] = ' -> '.join(path)
+    
+    for vertex in sorted(graph.vertices):
+        if owners[vertex] is None:
+            results.append(f"{vertex}: No path")
+        else:
+            results.append(f"{owners[vertex]} → {vertex}: {distances[vertex]}")
+            
+            if distances[vertex] > 0 and vertex in short_paths:
+                results.append(f"   Path: {short_paths[vertex]}")
+    
+    return "\n".join(results)
+
+
+def build_arrival_text(graph, start, departure, arrivals, predecessors, end=None):
+    """Build formatted time-dependent results text for display"""
+    results = []
+    
+    # Header
+    results.append("=" * 50)
+    results.append("Time-Dependent Dijkstra's Algorithm Results")
+    results.append("=" * 50)
+    results.append("")
+    results.extend(graph_info_lines(graph.get_graph_stats()))
+    results.append(f"  Travel time functions: {len(graph.profiles)}")
+    results.append("")
+    results.append(f"Start vertex: {start}, departure time: {departure}")
+    results.append("")
+    
+    # If specific end vertex is requested
+    if end:
+        if end not in graph.vertices:
+            results.append(f"❌ Error: End vertex '{end}' not found!")
+        elif end not in arrivals:
+            results.append(f"No path exists from {start} to {end}")
+        else:
+            path = graph.reconstruct_path(predecessors, start, end)
+            results.append(f"Fastest path from {start} to {end}:")
+            results.append(f"Path: {' -> '.join(map(str, path))}")
+            results.append(f"Arrival time: {arrivals[end]}")
+            results.append(f"Travel time: {arrivals[end] - departure}")
+            
+            # Departure and travel time of every edge along the path
+            results.append("\nPath details:")
+            for i in range(len(path) - 1):
+                u, v = path[i], path[i + 1]
+                results.append(f"  {u} → {v}: depart {arrivals[u]}, "
+                               f"travel time {arrivals[v] - arrivals[u]}")
+        return "\n".join(results)
+    
+    results.append("Earliest arrival times:")
+    results.append("-" * 40)
+    
+    for vertex in sorted(graph.vertices):
+        if vertex in arrivals:
+            results.append(f"{start} → {vertex}: {arrivals[vertex]}")
+        else:
+            results.append(f"{start} → {vertex}: No path")
     
     return "\n".join(results)
 
@@ -87,56 +223,432 @@ def build_results_text(graph, start, distances, predecessors, end=None):
 def main():
     parser = argparse.ArgumentParser(description="Find shortest paths using Dijkstra's algorithm")
     parser.add_argument('input_file', help='Input file containing graph data')
-    parser.add_argument('--start', '-s', required=True, help='Start vertex')
+    parser.add_argument('--start', '-s', action='append',
+                       help='Start vertex (required unless serving or batching); repeat it '
+                            '(-s A -s D) to assign every vertex to the nearest start')
     parser.add_argument('--end', '-e', help='End vertex (optional, shows all if not specified)')
     parser.add_argument('--output', '-o', help='Output file for results')
     parser.add_argument('--visualize', '-v', action='store_true', 
                        help='Show graph visualization')
+    parser.add_argument('--figure', '-f',
+                       help='Save the visualization to this file without opening a window')
+    parser.add_argument('--dpi', type=int, default=300, help='Resolution of saved figures')
+    parser.add_argument('--format', dest='fig_format',
+                       help='Format of saved figures (default: from file extension, png for --render-dir)')
+    parser.add_argument('--subgraph', choices=['full', 'tree', 'neighborhood'],
+                       help='Part of the graph to draw (default: full for small graphs)')
+    parser.add_argument('--hops', type=int, default=1,
+                       help='Neighborhood size in edges for --subgraph neighborhood')
+    parser.add_argument('--serve', action='store_true',
+                       help='Load the graph once and answer JSON-lines queries')
+    parser.add_argument('--host', default='127.0.0.1', help='Host for --serve over TCP')
+    parser.add_argument('--port', type=int,
+                       help='TCP port for --serve (stdin/stdout if not specified)')
+    parser.add_argument('--workers', type=int, help='Worker processes for --serve')
+    parser.add_argument('--threads', action='store_true',
+                       help='Answer --serve queries on threads sharing an immutable graph snapshot')
+    parser.add_argument('--batch', '-b',
+                       help='File of queries (start [end] per line), answered as JSONL')
+    parser.add_argument('--render-dir',
+                       help='Render a figure of every path found by --batch into this directory')
+    parser.add_argument('--stats', action='store_true',
+                       help='Print search counters and timings')
+    parser.add_argument('--paths', type=int, dest='k_paths',
+                       help='Also list this many shortest alternative paths to --end')
+    parser.add_argument('--engine', choices=['auto'] + ENGINES, default='auto',
+                       help='Shortest path engine (default: bellman_ford for negative edges, else dijkstra)')
+    parser.add_argument('--max-distance', type=float,
+                       help='Only search vertices at most this far from the start')
+    parser.add_argument('--nearest', type=int, dest='k_nearest',
+                       help='Only search until this many nearest vertices are found')
+    parser.add_argument('--targets',
+                       help='Comma-separated vertices counted by --nearest (default: all)')
+    parser.add_argument('--memory', action='store_true',
+                       help='Print memory used by the graph and the search (tracemalloc)')
+    parser.add_argument('--build-shards', type=int, metavar='K',
+                       help='Split the graph into K shards stored in --shard-dir and exit')
+    parser.add_argument('--shard-dir',
+                       help='Directory for --build-shards; pass it as input_file to query the shards')
+    parser.add_argument('--depart', type=float,
+                       help='Departure time for graphs with time-dependent travel times')
+    parser.add_argument('--weight',
+                       help='Edge attribute used as weight (e.g. time) or a weighted sum '
+                            'of attributes (e.g. time=1,toll=0.5)')
+    
+    parser.add_argument('--load-workers', type=int,
+                       help='Parse edge list files in this many processes')
+    parser.add_argument('--save-binary',
+                       help='Save the graph in the binary format (.npz) and exit')
+    parser.add_argument('--order', choices=ORDERINGS, default='rcm',
+                       help='Vertex order stored by --save-binary (default: rcm)')
     
     args = parser.parse_args()
     
+    if not (args.serve or args.batch or args.build_shards or args.save_binary) and args.start is None:
+        parser.error("the following arguments are required: --start/-s")
+    
+    if args.save_binary and not args.save_binary.endswith('.npz'):
+        parser.error("--save-binary needs a file name ending in .npz")
+    
+    if args.build_shards and not args.shard_dir:
+        parser.error("--build-shards requires --shard-dir")
+    
+    if args.k_paths and not args.end:
+        parser.error("--paths requires --end")
+    
+    if args.weight and (args.k_paths or args.depart is not None):
+        parser.error("--weight cannot be combined with --paths or --depart")
+    
+    # Batch and server answers use the stored weights
+    if args.weight and (args.serve or args.batch):
+        parser.error("--weight cannot be combined with --serve or --batch")
+    
+    if args.start and len(args.start) > 1:
+        for option, value in [('--paths', args.k_paths), ('--max-distance', args.max_distance),
+                              ('--nearest', args.k_nearest), ('--visualize', args.visualize),
+                              ('--figure', args.figure), ('--memory', args.memory),
+                              ('--depart', args.depart is not None), ('--weight', args.weight)]:
+            if value:
+                parser.error(f"{option} needs a single --start vertex")
+    
+    # When answering on stdout, status messages must not mix with responses
+    if (args.serve and args.port is None) or (args.batch and not args.output):
+        status_out = sys.stderr
+    else:
+        status_out = sys.stdout
+    
     # Check if input file exists
     if not os.path.exists(args.input_file):
         print(f"Error: Input file '{args.input_file}' not found!")
         sys.exit(1)
     
+    # A directory of shards answers single path queries from worker processes
+    if os.path.isdir(args.input_file):
+        if not (args.start and len(args.start) == 1 and args.end):
+            print("Error: Sharded graphs answer queries with one --start and --end vertex")
+            sys.exit(1)
+        
+        from src.shards import ShardCoordinator
+        
+        start = args.start[0]
+        print(f"Searching shards in '{args.input_file}' from '{start}' to '{args.end}'...")
+        with ShardCoordinator(args.input_file) as coordinator:
+            path, distance = coordinator.shortest_path(start, args.end)
+        
+        if path is None:
+            print(f"No path exists from {start} to {args.end}")
+        else:
+            print(f"Shortest path from {start} to {args.end}:")
+            print(f"Path: {' -> '.join(map(str, path))}")
+            print(f"Total distance: {distance}")
+        return
+    
     # Load graph from file
+    if args.load_workers:
+        from src.parallel_loader import load_graph_parallel
+        
+        def load():
+            return load_graph_parallel(args.input_file, args.load_workers)
+    else:
+        def load():
+            return load_graph_from_file(args.input_file)
+    
     try:
-        graph = load_graph_from_file(args.input_file)
-        print(f"Graph loaded successfully from '{args.input_file}'")
+        if args.memory:
+            from src.memory import measure_graph_memory
+            
+            # Memory of worker processes is not traced, only the merged graph
+            graph, load_report = measure_graph_memory(load)
+        else:
+            graph = load()
+        print(f"Graph loaded successfully from '{args.input_file}'", file=status_out)
     except Exception as e:
         print(f"Error loading graph: {e}")
         sys.exit(1)
     
+    # Store the graph with a cache-friendly vertex layout
+    if args.save_binary:
+        from src.file_handler import export_graph_to_binary
+        from src.reorder import vertex_order
+        
+        try:
+            order = vertex_order(graph, args.order)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        
+        export_graph_to_binary(graph, args.save_binary, order)
+        print(f"Saved graph to '{args.save_binary}' in {args.order} vertex order")
+        return
+    
+    # Partition the graph for sharded queries
+    if args.build_shards:
+        if graph.has_negative_edges():
+            print("Error: Shards need non-negative edge weights")
+            sys.exit(1)
+        
+        from src.partition import build_shards
+        
+        print(f"Splitting graph into {args.build_shards} shards...")
+        summary = build_shards(graph, args.build_shards, args.shard_dir, args.workers)
+        print(f"Wrote {summary['num_parts']} shards to '{args.shard_dir}' "
+              f"({summary['boundary_vertices']} boundary vertices, "
+              f"{summary['overlay_edges']} overlay edges)")
+        return
+    
+    # Search counters are collected only on request
+    stats = SearchStats() if args.stats else None
+    
+    engine = choose_engine(graph) if args.engine == 'auto' else args.engine
+    
+    if engine == 'scipy' and not SCIPY_AVAILABLE:
+        print("Error: The scipy engine needs SciPy (pip install scipy)")
+        sys.exit(1)
+    
+    # Answer queries until stopped
+    if args.serve:
+        from src.server import run_server
+        
+        if args.memory:
+            from src.memory import format_memory_report
+            
+            print(format_memory_report(load_report), file=status_out)
+        
+        run_server(graph, args.host, args.port, args.workers, engine, args.threads)
+        return
+    
+    # Answer a whole file of queries in this process
+    if args.batch:
+        from src.queries import iter_batch_answers
+        
+        try:
+            queries = load_queries_from_file(args.batch)
+        except OSError as e:
+            print(f"Error loading queries: {e}")
+            sys.exit(1)
+        
+        render_jobs = []
+        
+        out = open(args.output, 'w') if args.output else sys.stdout
+        try:
+            for answer in iter_batch_answers(graph, queries, stats, engine):
+                out.write(json.dumps(answer) + '\n')
+                
+                if args.render_dir and answer.get('path'):
+                    render_jobs.append((graph, answer['path'], f"query_{answer['query']:06d}"))
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        
+        print(f"Answered {len(queries)} queries", file=status_out)
+        
+        if args.memory:
+            from src.memory import format_memory_report
+            
+            print(format_memory_report(load_report), file=status_out)
+        
+        if stats:
+            print(stats.format(), file=status_out)
+        
+        if render_jobs:
+            from src.rendering import render_path_jobs
+            
+            files = render_path_jobs(render_jobs, args.render_dir, dpi=args.dpi,
+                                     fmt=args.fig_format or 'png', workers=args.workers,
+                                     subgraph=args.subgraph, hops=args.hops)
+            print(f"Rendered {len(files)} figures to '{args.render_dir}'", file=status_out)
+        return
+    
+    # Several start vertices: assign every vertex to the nearest one
+    if len(args.start) > 1:
+        from src.dijkstra import multi_source_dijkstra
+        
+        missing = [vertex for vertex in args.start if vertex not in graph.vertices]
+        if missing:
+            print(f"Error: Start vertices not found in graph: {', '.join(missing)}")
+            sys.exit(1)
+        
+        if engine == 'bellman_ford':
+            print("Error: Several start vertices need non-negative edge weights")
+            sys.exit(1)
+        
+        print(f"Running multi-source Dijkstra from {len(args.start)} vertices...")
+        if engine == 'scipy':
+            from src.scipy_backend import scipy_multi_source
+            
+            distances, predecessors, owners = scipy_multi_source(graph, args.start, stats)
+        else:
+            distances, predecessors, owners = multi_source_dijkstra(graph, args.start, stats)
+        
+        print(build_voronoi_text(graph, args.start, distances, predecessors, owners, args.end))
+        
+        if args.output:
+            paths = {}
+            for source in args.start:
+                for vertex, path in graph.iter_tree_paths(predecessors, source):
+                    paths[vertex] = list(path)
+            
+            results = {
+                'start': ', '.join(args.start),
+                'distances': {vertex: distances[vertex] if owners[vertex] is not None else 'No path'
+                              for vertex in graph.vertices},
+                'paths': paths,
+                'owners': owners
+            }
+            
+            save_results(results, args.output, graph)
+            print(f"\nResults saved to '{args.output}'")
+        
+        if stats:
+            print("\n" + stats.format())
+        
+        print("\nDone!")
+        return
+    
+    args.start = args.start[0]
+    
     # Validate start vertex
     if args.start not in graph.vertices:
         print(f"Error: Start vertex '{args.start}' not found in graph!")
         print(f"Available vertices: {sorted(graph.vertices)}")
         sys.exit(1)
     
-    # Run Dijkstra's algorithm
-    print(f"Running Dijkstra's algorithm from vertex '{args.start}'...")
-    distances, predecessors = dijkstra(graph, args.start)
+    # Earliest arrival times for a departure time
+    if args.depart is not None:
+        from src.time_dependent import TimeDependentGraph, time_dependent_dijkstra
+        
+        if not isinstance(graph, TimeDependentGraph):
+            print("Error: --depart needs a graph with travel time profiles (JSON \"profile\")")
+            sys.exit(1)
+        
+        print(f"Running time-dependent Dijkstra from vertex '{args.start}' "
+              f"departing at {args.depart}...")
+        arrivals, predecessors = time_dependent_dijkstra(graph, args.start, args.depart, stats)
+        
+        print(build_arrival_text(graph, args.start, args.depart, arrivals, predecessors, args.end))
+        
+        if args.output:
+            results = {
+                'start': f"{args.start} (departure {args.depart})",
+                'distances': {vertex: arrivals[vertex] - args.depart if vertex in arrivals
+                              else 'No path' for vertex in graph.vertices},
+                'paths': {vertex: list(path) for vertex, path
+                          in graph.iter_tree_paths(predecessors, args.start)}
+            }
+            
+            save_results(results, args.output, graph)
+            print(f"\nResults saved to '{args.output}'")
+        
+        if stats:
+            print("\n" + stats.format())
+        
+        print("\nDone!")
+        return
+    
+    # Optional limits of the search
+    search_options = {
+        'max_distance': args.max_distance,
+        'k_nearest': args.k_nearest,
+        'targets': args.targets.split(',') if args.targets else None
+    }
+    
+    # Costs taken from edge attributes instead of the stored weights
+    results_graph = graph
+    if args.weight:
+        from src.edge_attributes import parse_weight_selector
+        
+        search_options['weight'] = parse_weight_selector(args.weight)
+        if args.engine == 'auto':
+            engine = 'dijkstra'
+        try:
+            results_graph = graph.weighted_by(search_options['weight'])
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    
+    # Run the search
+    if engine == 'bellman_ford':
+        print(f"Running Bellman-Ford algorithm from vertex '{args.start}'...")
+    elif args.weight:
+        print(f"Running Dijkstra's algorithm from vertex '{args.start}' (weight: {args.weight})...")
+    elif engine == 'numba' and not (args.max_distance is not None or args.k_nearest):
+        print(f"Running Dijkstra's algorithm (Numba) from vertex '{args.start}'...")
+    elif engine == 'scipy' and not args.k_nearest:
+        print(f"Running scipy.sparse.csgraph from vertex '{args.start}'...")
+    else:
+        print(f"Running Dijkstra's algorithm from vertex '{args.start}'...")
+    try:
+        if args.end in graph.vertices and graph.cannot_reach(args.start, args.end):
+            # The component index already shows there is no path
+            distances, predecessors = {args.start: 0}, {args.start: None}
+            search_report = None
+        elif args.memory:
+            from src.memory import profile_search_memory
+            
+            distances, predecessors, search_report = profile_search_memory(
+                graph, args.start, stats, engine, **search_options)
+        else:
+            distances, predecessors = shortest_paths(graph, args.start, engine, stats,
+                                                     **search_options)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
     # Build results text
-    results_text = build_results_text(graph, args.start, distances, predecessors, args.end)
+    results_text = build_results_text(results_graph, args.start, distances, predecessors,
+                                      args.end, engine)
+    
+    # Alternative routes
+    if args.k_paths and args.end in graph.vertices:
+        if engine == 'bellman_ford':
+            print("Error: --paths needs non-negative edge weights")
+            sys.exit(1)
+        
+        from src.k_shortest import k_shortest_paths
+        
+        alternatives = ["", f"{args.k_paths} shortest paths from {args.start} to {args.end}:"]
+        for i, (path, distance) in enumerate(k_shortest_paths(graph, args.start, args.end,
+                                                              args.k_paths, stats), 1):
+            alternatives.append(f"  {i}. {' -> '.join(map(str, path))} (distance: {distance})")
+        
+        results_text += "\n" + "\n".join(alternatives)
     
     # Show visualization if requested
-    if args.visualize:
-        if args.end and args.end in graph.vertices and distances[args.end] != float('inf'):
+    if args.visualize or args.figure:
+        # Imported here so that plotting libraries load only when needed
+        from src.visualization import (
+            use_headless_backend, visualize_dijkstra_complete, visualize_path_with_info
+        )
+        
+        if not args.visualize:
+            use_headless_backend()
+        
+        figure_options = {
+            'save_path': args.figure,
+            'subgraph': args.subgraph,
+            'hops': args.hops,
+            'show': args.visualize,
+            'dpi': args.dpi,
+            'fmt': args.fig_format
+        }
+        
+        if args.end and args.end in graph.vertices and distances.get(args.end, float('inf')) != float('inf'):
             # Show specific path visualization
             path = graph.reconstruct_path(predecessors, args.start, args.end)
             if path:
                 visualize_path_with_info(
                     graph, path, results_text,
-                    title=f"Dijkstra: {args.start} to {args.end}"
+                    title=f"Dijkstra: {args.start} to {args.end}",
+                    **figure_options
                 )
         else:
             # Show complete Dijkstra results
             visualize_dijkstra_complete(
-                graph, args.start, distances, predecessors, results_text
+                graph, args.start, distances, predecessors, results_text,
+                **figure_options
             )
-    else:
+    
+    if not args.visualize:
         # Just print to console if no visualization requested
         print(results_text)
     
@@ -149,17 +661,29 @@ def main():
             'paths': {}
         }
         
-        for vertex in graph.vertices:
+        paths = {
+            vertex: list(path)
+            for vertex, path in graph.iter_tree_paths(predecessors, args.start)
+        }
+        
+        for vertex in distances:
             if distances[vertex] == float('inf'):
                 results['distances'][vertex] = 'No path'
             else:
                 results['distances'][vertex] = distances[vertex]
-                path = graph.reconstruct_path(predecessors, args.start, vertex)
-                results['paths'][vertex] = path
+                results['paths'][vertex] = paths[vertex]
         
         save_results(results, args.output, graph)
         print(f"\nResults saved to '{args.output}'")
     
+    if stats:
+        print("\n" + stats.format())
+    
+    if args.memory:
+        from src.memory import format_memory_report
+        
+        print("\n" + format_memory_report(load_report, search_report))
+    
     print("\nDone!")
 
 
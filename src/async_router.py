@@ -0,0 +1,245 @@
+"""
+Asyncio interface to the shortest path engines
+
+AsyncRouter answers queries from coroutines without blocking the event
+loop: searches run on an executor, and the router avoids repeating work
+for queries that arrive together.
+
+- Queries with the same start vertex that arrive within the batch window
+  are answered by one search; with the dijkstra engine the search stops
+  as soon as all requested end vertices are settled.
+- A query whose answer is already being computed by a running search
+  (same start, end among its targets, or a full search) waits for that
+  search instead of starting a new one.
+- A cancelled query stops waiting. When every query of a batch has been
+  cancelled, the batch is dropped before it starts; a search that is
+  already running finishes in the executor and its result is discarded.
+
+Searches run on an immutable GraphSnapshot (src/snapshot.py), so the
+threads of the executor can share it. A VersionedGraph can be given
+instead of a graph; every search then uses the snapshot published when
+it starts.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from src.engines import choose_engine, shortest_paths
+from src.queries import check_query, format_answer, prepare_for_queries
+from src.snapshot import VersionedGraph
+
+
+class _Batch:
+    """Queries of one start vertex answered by a single search"""
+    
+    def __init__(self, start):
+        self.start = start
+        self.ends = set()
+        self.full = False
+        self.waiters = []
+        self.handle = None
+        self.future = None
+    
+    def covers(self, end):
+        """Check whether the search of this batch answers a query"""
+        return self.full or (end is not None and end in self.ends)
+
+
+class AsyncRouter:
+    """Answers shortest path queries from asyncio code"""
+    
+    def __init__(self, graph, executor=None, engine='auto', batch_window=0.0):
+        """Initialize router
+        
+        Args:
+            graph: Graph object (searched through a snapshot) or VersionedGraph
+            executor: Thread pool for the searches (default: a new one owned
+                      by the router)
+            engine: Shortest path engine, see shortest_paths
+            batch_window: Seconds to collect queries of one start vertex
+                          before searching (default: until the event loop
+                          has run the other ready tasks)
+        """
+        self.versions = graph if isinstance(graph, VersionedGraph) else VersionedGraph(graph)
+        
+        snapshot = self.versions.snapshot
+        if engine == 'auto':
+            engine = choose_engine(snapshot)
+        self.engine = engine
+        
+        prepare_for_queries(snapshot)
+        
+        self._own_executor = executor is None
+        self.executor = executor if executor is not None else ThreadPoolExecutor()
+        self.batch_window = batch_window
+        
+        # Batches collecting queries, and batches whose search has started
+        self._pending = {}
+        self._running = {}
+        
+        # Number of queries, searches run and queries that joined a running search
+        self.counters = {'queries': 0, 'searches': 0, 'coalesced': 0}
+    
+    async def query(self, start, end=None):
+        """Answer a shortest path query
+        
+        Args:
+            start: Start vertex
+            end: End vertex (optional, all distances from start if not given)
+            
+        Returns:
+            Dictionary with the answer, the same as answer_query
+        """
+        self.counters['queries'] += 1
+        
+        # Unknown vertices and impossible queries need no search
+        answer = check_query(self.versions.snapshot, start, end)
+        if answer is not None:
+            return answer
+        
+        loop = asyncio.get_running_loop()
+        batch = self._join(start, end)
+        waiter = loop.create_future()
+        batch.waiters.append(waiter)
+        
+        try:
+            result = await waiter
+        except asyncio.CancelledError:
+            self._leave(batch, waiter)
+            raise
+        
+        if isinstance(result, ValueError):
+            return {'start': start, 'end': end, 'error': str(result)}
+        
+        # Answers are built as answer_query builds them, off the event loop
+        graph, distances, predecessors = result
+        return await loop.run_in_executor(self.executor, format_answer, graph, start, end,
+                                          distances, predecessors)
+    
+    async def shortest_path(self, start, end):
+        """Find the shortest path between two vertices
+        
+        Returns:
+            Tuple of (path, distance), or (None, inf) if end is unreachable
+            
+        Raises:
+            ValueError: If a vertex does not exist or the search fails
+        """
+        answer = await self.query(start, end)
+        if 'error' in answer:
+            raise ValueError(answer['error'])
+        if answer['path'] is None:
+            return None, float('inf')
+        return answer['path'], answer['distance']
+    
+    def _join(self, start, end):
+        """Get the batch that will answer a query, creating one if needed"""
+        for batch in self._running.get(start, ()):
+            if batch.covers(end):
+                self.counters['coalesced'] += 1
+                return batch
+        
+        batch = self._pending.get(start)
+        if batch is None:
+            batch = self._pending[start] = _Batch(start)
+            loop = asyncio.get_running_loop()
+            if self.batch_window > 0:
+                batch.handle = loop.call_later(self.batch_window, self._dispatch, batch)
+            else:
+                batch.handle = loop.call_soon(self._dispatch, batch)
+        
+        if end is None:
+            batch.full = True
+        else:
+            batch.ends.add(end)
+        return batch
+    
+    def _leave(self, batch, waiter):
+        """Remove a cancelled query, dropping its batch if no query is left"""
+        if waiter in batch.waiters:
+            batch.waiters.remove(waiter)
+        if batch.waiters:
+            return
+        
+        if batch.future is None:
+            batch.handle.cancel()
+            if self._pending.get(batch.start) is batch:
+                del self._pending[batch.start]
+        else:
+            # The executor drops the search only if it has not started yet.
+            # The batch stops taking queries now, not when _finish runs, or
+            # a query arriving in between would wait for a cancelled future
+            batch.future.cancel()
+            self._discard(batch)
+    
+    def _dispatch(self, batch):
+        """Start the search of a batch on the executor"""
+        del self._pending[batch.start]
+        self._running.setdefault(batch.start, []).append(batch)
+        self.counters['searches'] += 1
+        
+        targets = None if batch.full else list(batch.ends)
+        loop = asyncio.get_running_loop()
+        batch.future = loop.run_in_executor(self.executor, self._search, batch.start, targets)
+        batch.future.add_done_callback(lambda future: self._finish(batch, future))
+    
+    def _search(self, start, targets):
+        """Run one search in the executor
+        
+        Returns:
+            Tuple of (snapshot, distances, predecessors), or the ValueError
+            raised by the search (NegativeCycleError is a ValueError)
+        """
+        snapshot = self.versions.snapshot
+        
+        # Stop once every target is settled; negative edges and the compiled
+        # engines need the full search
+        bounds = {}
+        others = [vertex for vertex in targets or () if vertex != start]
+        if self.engine == 'dijkstra' and targets is not None:
+            bounds = {'k_nearest': len(others), 'targets': others}
+        
+        try:
+            distances, predecessors = shortest_paths(snapshot, start, self.engine, **bounds)
+        except ValueError as e:
+            return e
+        
+        # A bounded search with no other targets returns nothing, not even start
+        distances.setdefault(start, 0)
+        predecessors.setdefault(start, None)
+        return snapshot, distances, predecessors
+    
+    def _discard(self, batch):
+        """Remove a batch from the running ones, if it is still there"""
+        running = self._running.get(batch.start, [])
+        if batch in running:
+            running.remove(batch)
+            if not running:
+                del self._running[batch.start]
+    
+    def _finish(self, batch, future):
+        """Hand the result of a search to the queries waiting for it"""
+        self._discard(batch)
+        
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        for waiter in batch.waiters:
+            if waiter.done():
+                continue
+            if error is not None:
+                waiter.set_exception(error)
+            else:
+                waiter.set_result(future.result())
+    
+    def close(self):
+        """Shut down the executor if the router created it"""
+        if self._own_executor:
+            self.executor.shutdown(cancel_futures=True)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.close()
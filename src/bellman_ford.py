@@ -0,0 +1,150 @@
+"""
+Bellman-Ford algorithm for graphs with negative edge weights
+
+All edges leaving vertices whose distance changed in the previous round
+are relaxed at once with NumPy (the SPFA rule), until no distance changes.
+"""
+
+import numpy as np
+
+from src.csr import CSRGraph
+
+
+class NegativeCycleError(ValueError):
+    """Raised when a negative cycle is reachable from the start vertex"""
+
+
+def bellman_ford(graph, start, stats=None, csr=None):
+    """
+    Bellman-Ford algorithm for finding shortest paths from a single source.
+    
+    Time Complexity: O(V * E) in the worst case, usually far fewer rounds
+    Space Complexity: O(V + E)
+    
+    Args:
+        graph: Graph object
+        start: Starting vertex
+        stats: SearchStats object to collect counters and timings (optional)
+        csr: CSRGraph of the graph, to reuse arrays between searches (optional)
+        
+    Returns:
+        distances: Dictionary mapping each vertex to its shortest distance from start
+        predecessors: Dictionary mapping each vertex to its predecessor in the shortest path
+        
+    Raises:
+        NegativeCycleError: If a negative cycle is reachable from start
+    """
+    if stats is not None:
+        with stats.phase('initialize'):
+            state = _initialize(graph, start, csr)
+        with stats.phase('search'):
+            dist, pred, scanned, relaxed = _relax_until_stable(*state)
+        stats.record(scanned=scanned, relaxed=relaxed)
+    else:
+        state = _initialize(graph, start, csr)
+        dist, pred, _, _ = _relax_until_stable(*state)
+    
+    return state[0].to_result(dist, pred, start)
+
+
+def potentials(graph, csr=None):
+    """Compute vertex potentials for Johnson's reweighting
+    
+    The potential of a vertex is its shortest distance from a virtual
+    source joined to every vertex by a zero-weight edge.
+    
+    Args:
+        graph: Graph object
+        csr: CSRGraph of the graph (optional)
+        
+    Returns:
+        Dictionary mapping each vertex to its potential (at most 0)
+        
+    Raises:
+        NegativeCycleError: If the graph contains any negative cycle
+    """
+    if csr is None:
+        csr = CSRGraph.from_graph(graph)
+    
+    n = csr.num_vertices
+    dist = np.zeros(n)
+    pred = np.full(n, -1, dtype=np.int64)
+    
+    dist, _, _, _ = _relax_until_stable(csr, dist, pred, np.arange(n, dtype=np.int64),
+                                        "Graph contains a negative cycle")
+    
+    return dict(zip(csr.vertices, dist.tolist()))
+
+
+def _initialize(graph, start, csr):
+    """Build CSR arrays and the initial search state"""
+    if csr is None:
+        csr = CSRGraph.from_graph(graph)
+    
+    source = csr.index[start]
+    dist = np.full(csr.num_vertices, np.inf)
+    dist[source] = 0.0
+    pred = np.full(csr.num_vertices, -1, dtype=np.int64)
+    
+    return (csr, dist, pred, np.array([source], dtype=np.int64),
+            f"Negative cycle reachable from '{start}'")
+
+
+def _relax_until_stable(csr, dist, pred, active, cycle_message):
+    """Relax edges in rounds until no distance improves
+    
+    Args:
+        csr: CSRGraph object
+        dist: Array of initial distances, updated in place
+        pred: Array of initial predecessor numbers, updated in place
+        active: Array of vertex numbers whose edges are relaxed first
+        cycle_message: Message of the NegativeCycleError
+        
+    Returns:
+        Tuple of (distances array, predecessors array, edges scanned, edges relaxed)
+    """
+    n = csr.num_vertices
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    
+    scanned = relaxed = 0
+    rounds = 0
+    
+    while len(active):
+        # A shortest path has at most n - 1 edges, a change in round n means a cycle
+        if rounds == n:
+            raise NegativeCycleError(cycle_message)
+        rounds += 1
+        
+        # Gather the edges leaving the active vertices
+        counts = indptr[active + 1] - indptr[active]
+        total = int(counts.sum())
+        if total == 0:
+            break
+        offsets = np.repeat(indptr[active] - np.cumsum(counts) + counts, counts)
+        edges = offsets + np.arange(total)
+        sources = np.repeat(active, counts)
+        scanned += total
+        
+        # Sort by target, so that each target is one contiguous group
+        order = np.argsort(indices[edges], kind='stable')
+        sources = sources[order]
+        targets = indices[edges][order]
+        candidates = dist[sources] + weights[edges][order]
+        
+        starts = np.flatnonzero(np.r_[True, targets[1:] != targets[:-1]])
+        group_targets = targets[starts]
+        best = np.minimum.reduceat(candidates, starts)
+        
+        improved = best < dist[group_targets]
+        
+        # First edge of each group reaching the minimum becomes the predecessor
+        group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, total]))
+        tight = np.flatnonzero(candidates == best[group])
+        first = tight[np.r_[True, group[tight][1:] != group[tight][:-1]]]
+        
+        active = group_targets[improved]
+        dist[active] = best[improved]
+        pred[active] = sources[first[improved]]
+        relaxed += len(active)
+    
+    return dist, pred, scanned, relaxed
@@ -0,0 +1,224 @@
+"""
+Compressed adjacency lists for keeping large graphs in memory
+
+Each adjacency list is stored as one block of a shared bytearray:
+
+    count (varint) | widths (1 byte) | first neighbor (zigzag varint)
+    | count - 1 neighbor gaps | count weights
+
+Neighbors are numbered in sorted vertex order or in a given vertex
+ordering, as in the CSR arrays (src/csr.py), and sorted within a list,
+so they are stored as the (usually small) gaps between consecutive
+numbers. Weights are quantized to integer multiples of a fixed
+precision. Gaps and weights are bit-packed at byte granularity: each
+list picks the smallest of 1, 2, 4 or 8 bytes that fits all its gaps
+and, separately, all its weights. Fixed widths let a whole list be
+decoded in C by memoryview.cast and itertools.accumulate instead of
+byte by byte in Python.
+
+CompressedGraph offers get_neighbors and the other read methods used by
+dijkstra() and dijkstra_path(), so the searches run on it directly.
+"""
+
+import sys
+from array import array
+from itertools import accumulate
+
+from src.graph import Graph
+
+# Width in bytes of a width code, and the memoryview formats of gaps and weights
+_WIDTHS = (1, 2, 4, 8)
+_GAP_FORMATS = ('B', 'H', 'I', 'Q')
+_WEIGHT_FORMATS = ('b', 'h', 'i', 'q')
+
+
+def _width_code(value, signed):
+    """Smallest width code whose integers hold value"""
+    for code, width in enumerate(_WIDTHS):
+        bits = 8 * width
+        if signed and -(1 << (bits - 1)) <= value < (1 << (bits - 1)):
+            return code
+        if not signed and value < (1 << bits):
+            return code
+    raise ValueError(f"Value {value} does not fit in 64 bits")
+
+
+def _write_varint(data, value):
+    """Append a non-negative integer as a varint (7 bits per byte)"""
+    while value >= 0x80:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def _read_varint(data, position):
+    """Read a varint
+    
+    Returns:
+        Tuple of (value, position after it)
+    """
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+class CompressedGraph:
+    """Read-only graph with delta-encoded, bit-packed adjacency lists"""
+    
+    def __init__(self, names, offsets, data, scale, directed=False, negative=False):
+        """Initialize from encoded lists, see from_graph
+        
+        Args:
+            names: List of vertex names, position is the vertex number
+            offsets: Array of n + 1 byte offsets of the lists in data
+            data: Encoded adjacency lists
+            scale: Quantized weight units per unit of weight (1 / precision)
+            directed (bool): Whether the original graph is directed
+            negative (bool): Whether any weight is negative
+        """
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.data = data
+        self.scale = scale
+        self.directed = directed
+        self.negative = negative
+        
+        # Whole lists are cast from this view without copying the data
+        self._view = memoryview(data)
+    
+    @classmethod
+    def from_graph(cls, graph, precision=0.001, order=None):
+        """Compress the adjacency lists of a graph
+        
+        Args:
+            graph: Graph object
+            precision: Weights are rounded to multiples of this; the error
+                       of a path is at most precision / 2 per edge
+            order: List of all vertex names in the order to number them;
+                   a locality-preserving order (src/reorder.py) gives
+                   smaller gaps (default: sorted by name)
+                       
+        Returns:
+            CompressedGraph object
+        """
+        names = sorted(graph.vertices, key=str) if order is None else list(order)
+        index = {name: i for i, name in enumerate(names)}
+        scale = 1 / precision
+        
+        data = bytearray()
+        offsets = array('q', [0])
+        negative = False
+        
+        for i, name in enumerate(names):
+            entries = sorted((index[neighbor], round(weight * scale))
+                             for neighbor, weight in graph.adj_list.get(name, ()))
+            if entries:
+                neighbors = [neighbor for neighbor, _ in entries]
+                weights = [weight for _, weight in entries]
+                gaps = [b - a for a, b in zip(neighbors, neighbors[1:])]
+                gap_code = _width_code(max(gaps, default=0), False)
+                # Signed ranges are asymmetric, so both ends must fit
+                lightest, heaviest = min(weights), max(weights)
+                weight_code = max(_width_code(lightest, True), _width_code(heaviest, True))
+                negative = negative or lightest < 0
+                
+                first = neighbors[0] - i
+                _write_varint(data, len(entries))
+                data.append(gap_code << 2 | weight_code)
+                _write_varint(data, 2 * first if first >= 0 else -2 * first - 1)
+                data += array(_GAP_FORMATS[gap_code], gaps).tobytes()
+                data += array(_WEIGHT_FORMATS[weight_code], weights).tobytes()
+            offsets.append(len(data))
+        
+        # 4-byte offsets suffice below 4 GiB of encoded lists
+        if len(data) < 1 << 32:
+            offsets = array('I', offsets)
+        
+        return cls(names, offsets, data, scale, graph.directed, negative)
+    
+    @property
+    def vertices(self):
+        """Vertex names (a view of the name index)"""
+        return self.index.keys()
+    
+    @property
+    def num_edges(self):
+        """Number of stored (directed) adjacency entries"""
+        return sum(_read_varint(self.data, offset)[0]
+                   for offset, end in zip(self.offsets, self.offsets[1:]) if end > offset)
+    
+    def decode(self, number):
+        """Decode the adjacency list of a vertex number
+        
+        Returns:
+            Tuple of (list of neighbor numbers, list of quantized weights)
+        """
+        position = self.offsets[number]
+        if position == self.offsets[number + 1]:
+            return [], []
+        
+        data = self.data
+        count, position = _read_varint(data, position)
+        codes = data[position]
+        gap_code, weight_code = codes >> 2, codes & 3
+        first, position = _read_varint(data, position + 1)
+        first = number + (first >> 1 if first & 1 == 0 else -(first >> 1) - 1)
+        
+        gaps_end = position + (count - 1) * _WIDTHS[gap_code]
+        gaps = self._view[position:gaps_end].cast(_GAP_FORMATS[gap_code])
+        weights = self._view[gaps_end:gaps_end + count * _WIDTHS[weight_code]].cast(
+            _WEIGHT_FORMATS[weight_code])
+        
+        return list(accumulate(gaps, initial=first)), weights.tolist()
+    
+    def get_neighbors(self, vertex):
+        """Get all neighbors of a vertex
+        
+        Returns:
+            Iterator of (neighbor, weight) tuples, empty for unknown vertices
+        """
+        number = self.index.get(vertex)
+        if number is None:
+            return ()
+        
+        neighbors, weights = self.decode(number)
+        return zip(map(self.names.__getitem__, neighbors),
+                   map(self.scale.__rtruediv__, weights))
+    
+    def has_negative_edges(self):
+        """Check if graph has negative edges"""
+        return self.negative
+    
+    def cannot_reach(self, u, v):
+        """Compressed graphs keep no component index, so a path may always exist"""
+        return False
+    
+    def get_edge_weight(self, u, v):
+        """Get the weight of the lightest edge from u to v, or None"""
+        weights = [weight for neighbor, weight in self.get_neighbors(u) if neighbor == v]
+        return min(weights) if weights else None
+    
+    def memory_bytes(self):
+        """Bytes held by the encoded lists, their offsets and the vertex names
+        
+        The names count the name list, the name -> number index with its
+        number objects and the name strings themselves.
+        """
+        name_bytes = sys.getsizeof(self.names) + sys.getsizeof(self.index)
+        name_bytes += sum(map(sys.getsizeof, self.names))
+        
+        # Python caches the ints up to 256; larger numbers are separate objects
+        name_bytes += sum(map(sys.getsizeof, range(257, len(self.names))))
+        
+        return len(self.data) + self.offsets.itemsize * len(self.offsets) + name_bytes
+    
+    # Read-only methods shared with Graph
+    reconstruct_path = Graph.reconstruct_path
+    build_path_tree = Graph.build_path_tree
+    iter_tree_paths = Graph.iter_tree_paths
@@ -0,0 +1,186 @@
+"""
+Compressed sparse row (CSR) arrays of a graph for vectorized engines
+"""
+
+import gc
+from contextlib import contextmanager
+
+import numpy as np
+
+
+@contextmanager
+def gc_paused():
+    """Pause the cyclic garbage collector while building many objects
+    
+    Adjacency tuples and parsed lines form no reference cycles, but
+    allocating millions of them triggers collections that scan all objects
+    built so far, which took longer than the building itself.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class CSRGraph:
+    """Adjacency of a Graph stored as NumPy arrays
+    
+    Vertices are numbered 0 .. n-1; the neighbors of vertex i are
+    indices[indptr[i]:indptr[i + 1]] with the matching weights.
+    """
+    
+    def __init__(self, vertices, indptr, indices, weights, directed=False):
+        """Initialize CSR arrays
+        
+        Args:
+            vertices: List of vertex names, position is the vertex number
+            indptr: Array of n + 1 offsets into indices and weights
+            indices: Array of neighbor numbers
+            weights: Array of edge weights
+            directed (bool): Whether the original graph is directed
+        """
+        self.vertices = vertices
+        self.index = {vertex: i for i, vertex in enumerate(vertices)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+    
+    @classmethod
+    def from_graph(cls, graph, order=None):
+        """Build CSR arrays from a Graph
+        
+        By default vertices are numbered in sorted order, so results do not
+        depend on set iteration order.
+        
+        Args:
+            graph: Graph object
+            order: List of all vertex names in the order to number them,
+                   see src/reorder.py (optional)
+                   
+        Returns:
+            CSRGraph object
+            
+        Raises:
+            ValueError: If order does not list every vertex exactly once
+        """
+        vertices = sorted(graph.vertices, key=str) if order is None else list(order)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        if len(index) != len(vertices) or index.keys() != graph.vertices:
+            raise ValueError("Vertex order must list every vertex exactly once")
+        
+        indptr = np.zeros(len(vertices) + 1, dtype=np.int64)
+        indices = []
+        weights = []
+        
+        for i, vertex in enumerate(vertices):
+            neighbors = graph.adj_list.get(vertex, ())
+            for neighbor, weight in neighbors:
+                indices.append(index[neighbor])
+                weights.append(weight)
+            indptr[i + 1] = len(indices)
+        
+        return cls(vertices, indptr, np.array(indices, dtype=np.int64),
+                   np.array(weights, dtype=np.float64), graph.directed)
+    
+    @classmethod
+    def load(cls, filename):
+        """Load CSR arrays saved by save
+        
+        Args:
+            filename: Path to the .npz file
+            
+        Returns:
+            CSRGraph object
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            return cls(data['vertices'].tolist(), data['indptr'], data['indices'],
+                       data['weights'], bool(data['directed']))
+    
+    def save(self, filename):
+        """Save the arrays in the binary graph format
+        
+        The file is a NumPy .npz archive with the vertex names (as strings)
+        in numbering order, so the layout, including a reordering, is kept.
+        
+        Args:
+            filename: Path to the .npz file
+        """
+        np.savez(filename, vertices=np.array([str(vertex) for vertex in self.vertices]),
+                 indptr=self.indptr, indices=self.indices, weights=self.weights,
+                 directed=np.array(self.directed))
+    
+    def to_graph(self):
+        """Build a Graph whose adjacency lists are the rows of these arrays
+        
+        Rows are copied as they are (undirected graphs store every edge in
+        both rows), vertices are added in numbering order and the Graph
+        keeps these arrays as its CSR cache.
+        
+        Returns:
+            Graph object
+        """
+        from src.graph import Graph
+        
+        graph = Graph(directed=self.directed)
+        vertices = self.vertices
+        graph.vertices.update(vertices)
+        
+        indptr = self.indptr.tolist()
+        
+        with gc_paused():
+            # One list of all entries, cut into rows by slicing
+            entries = list(zip(map(vertices.__getitem__, self.indices.tolist()),
+                               self.weights.tolist()))
+            
+            adj_list = graph.adj_list
+            for i, u in enumerate(vertices):
+                first, last = indptr[i], indptr[i + 1]
+                if first < last:
+                    adj_list[u] = entries[first:last]
+        
+        graph._csr = self
+        return graph
+    
+    def to_result(self, dist, pred, start=None):
+        """Translate distance and predecessor arrays to vertex-name dictionaries
+        
+        Args:
+            dist: Array of distances by vertex number (inf if unreachable)
+            pred: Array of predecessor numbers, negative for none
+            start: Start vertex of the search; its distance becomes the int 0
+                   kept by the Python searches (optional)
+                   
+        Returns:
+            Tuple of (distances, predecessors) dictionaries, the same as dijkstra
+        """
+        vertices = self.vertices
+        distances = dict(zip(vertices, dist.tolist()))
+        predecessors = {vertex: vertices[p] if p >= 0 else None
+                        for vertex, p in zip(vertices, pred.tolist())}
+        
+        if start is not None:
+            distances[start] = 0
+        
+        return distances, predecessors
+    
+    @property
+    def num_vertices(self):
+        """Number of vertices"""
+        return len(self.vertices)
+    
+    @property
+    def num_edges(self):
+        """Number of stored (directed) adjacency entries"""
+        return len(self.indices)
+    
+    def edge_sources(self):
+        """Get the source vertex number of every adjacency entry
+        
+        Returns:
+            Array aligned with indices and weights
+        """
+        return np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(self.indptr))
@@ -5,21 +5,42 @@ Dijkstra's Shortest Path Algorithm Implementation
 import heapq
 
 
-def dijkstra(graph, start):
+def dijkstra(graph, start, stats=None, max_distance=None, k_nearest=None, targets=None,
+             weight=None):
     """
     Dijkstra's algorithm for finding shortest paths from a single source.
     
     Time Complexity: O((V + E) log V) with binary heap
     Space Complexity: O(V)
     
+    With max_distance or k_nearest the search stops early and only the
+    vertices it settled are returned, so its cost depends on the size of
+    the explored ball rather than on the whole graph.
+    
     Args:
         graph: Graph object
         start: Starting vertex
-        
+        stats: SearchStats object to collect counters and timings (optional)
+        max_distance: Settle only vertices at most this far from start (optional)
+        k_nearest: Stop after settling this many vertices other than start (optional)
+        targets: Count only these vertices towards k_nearest (optional)
+        weight: Edge attribute name or {name: coefficient} dictionary used
+                instead of the stored weights, see Graph.weighted_by (optional)
+                
     Returns:
         distances: Dictionary mapping each vertex to its shortest distance from start
         predecessors: Dictionary mapping each vertex to its predecessor in the shortest path
     """
+    if weight is not None:
+        graph = graph.weighted_by(weight)
+    
+    if max_distance is not None or k_nearest is not None:
+        return _dijkstra_bounded(graph, start, stats, max_distance, k_nearest, targets)
+    
+    # Instrumentation runs in a separate copy of the loop, so it costs nothing when off
+    if stats is not None:
+        return _dijkstra_instrumented(graph, start, stats)
+    
     # Initialize distances to infinity and predecessors to None
     distances = {vertex: float('inf') for vertex in graph.vertices}
     predecessors = {vertex: None for vertex in graph.vertices}
@@ -69,7 +90,295 @@ def dijkstra(graph, start):
     return distances, predecessors
 
 
-def dijkstra_path(graph, start, end):
+def _dijkstra_instrumented(graph, start, stats):
+    """Dijkstra's algorithm, counting its work into a SearchStats object"""
+    settled = scanned = relaxed = pushes = stale = 0
+    peak = 1
+    
+    with stats.phase('initialize'):
+        distances = {vertex: float('inf') for vertex in graph.vertices}
+        predecessors = {vertex: None for vertex in graph.vertices}
+        distances[start] = 0
+        priority_queue = [(0, start)]
+        pushes += 1
+        visited = set()
+    
+    with stats.phase('search'):
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            
+            if current_vertex in visited:
+                stale += 1
+                continue
+            
+            visited.add(current_vertex)
+            settled += 1
+            
+            if current_distance == float('inf'):
+                break
+            
+            for neighbor, edge_weight in graph.get_neighbors(current_vertex):
+                scanned += 1
+                if neighbor in visited:
+                    continue
+                
+                new_distance = current_distance + edge_weight
+                
+                if new_distance < distances[neighbor]:
+                    relaxed += 1
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current_vertex
+                    heapq.heappush(priority_queue, (new_distance, neighbor))
+                    pushes += 1
+                    if len(priority_queue) > peak:
+                        peak = len(priority_queue)
+    
+    stats.record(settled, scanned, relaxed, pushes, stale, peak)
+    
+    return distances, predecessors
+
+
+def _dijkstra_bounded(graph, start, stats, max_distance, k_nearest, targets):
+    """Dijkstra's algorithm stopped by a distance limit or a vertex count
+    
+    Distances and predecessors are kept only for reached vertices; the
+    returned dictionaries hold the settled ones.
+    """
+    if max_distance is None:
+        max_distance = float('inf')
+    if k_nearest is None:
+        k_nearest = float('inf')
+    if targets is not None:
+        targets = set(targets)
+    
+    if stats is not None:
+        return _dijkstra_bounded_instrumented(graph, start, stats, max_distance, k_nearest,
+                                              targets)
+    
+    distances = {start: 0}
+    predecessors = {start: None}
+    settled = {}
+    found = 0
+    
+    priority_queue = [(0, start)]
+    
+    while priority_queue and found < k_nearest:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        
+        if current_vertex in settled:
+            continue
+        
+        # Every remaining vertex is at least this far away
+        if current_distance > max_distance:
+            break
+        
+        settled[current_vertex] = current_distance
+        
+        if current_vertex != start and (targets is None or current_vertex in targets):
+            found += 1
+        
+        for neighbor, edge_weight in graph.get_neighbors(current_vertex):
+            if neighbor in settled:
+                continue
+            
+            new_distance = current_distance + edge_weight
+            
+            if new_distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (new_distance, neighbor))
+    
+    return settled, {vertex: predecessors[vertex] for vertex in settled}
+
+
+def _dijkstra_bounded_instrumented(graph, start, stats, max_distance, k_nearest, targets):
+    """_dijkstra_bounded, counting its work into a SearchStats object"""
+    with stats.phase('initialize'):
+        distances = {start: 0}
+        predecessors = {start: None}
+        settled = {}
+        found = 0
+        
+        scanned = relaxed = stale = 0
+        pushes = peak = 1
+        
+        priority_queue = [(0, start)]
+    
+    with stats.phase('search'):
+        while priority_queue and found < k_nearest:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            
+            if current_vertex in settled:
+                stale += 1
+                continue
+            
+            if current_distance > max_distance:
+                break
+            
+            settled[current_vertex] = current_distance
+            
+            if current_vertex != start and (targets is None or current_vertex in targets):
+                found += 1
+            
+            for neighbor, edge_weight in graph.get_neighbors(current_vertex):
+                scanned += 1
+                if neighbor in settled:
+                    continue
+                
+                new_distance = current_distance + edge_weight
+                
+                if new_distance < distances.get(neighbor, float('inf')):
+                    relaxed += 1
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current_vertex
+                    heapq.heappush(priority_queue, (new_distance, neighbor))
+                    pushes += 1
+                    if len(priority_queue) > peak:
+                        peak = len(priority_queue)
+    
+    stats.record(len(settled), scanned, relaxed, pushes, stale, peak)
+    
+    return settled, {vertex: predecessors[vertex] for vertex in settled}
+
+
+def multi_source_dijkstra(graph, sources, stats=None):
+    """
+    Dijkstra's algorithm from several sources at once.
+    
+    All sources enter the priority queue at distance 0, so every vertex is
+    settled from its nearest source and records it as its owner. One pass
+    gives the graph Voronoi partition of the sources.
+    
+    Time Complexity: O((V + E) log V) with binary heap
+    Space Complexity: O(V)
+    
+    Args:
+        graph: Graph object
+        sources: Iterable of source vertices
+        stats: SearchStats object to collect counters and timings (optional)
+        
+    Returns:
+        distances: Dictionary mapping each vertex to its distance from the nearest source
+        predecessors: Dictionary mapping each vertex to its predecessor (None for sources)
+        owners: Dictionary mapping each vertex to its nearest source (None if unreachable)
+    """
+    if stats is not None:
+        return _multi_source_instrumented(graph, sources, stats)
+    
+    distances = {vertex: float('inf') for vertex in graph.vertices}
+    predecessors = {vertex: None for vertex in graph.vertices}
+    owners = {vertex: None for vertex in graph.vertices}
+    
+    priority_queue = []
+    for source in sources:
+        distances[source] = 0
+        owners[source] = source
+        priority_queue.append((0, source))
+    heapq.heapify(priority_queue)
+    
+    visited = set()
+    
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        
+        if current_vertex in visited:
+            continue
+        
+        visited.add(current_vertex)
+        owner = owners[current_vertex]
+        
+        for neighbor, edge_weight in graph.get_neighbors(current_vertex):
+            if neighbor in visited:
+                continue
+            
+            new_distance = current_distance + edge_weight
+            
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = current_vertex
+                owners[neighbor] = owner
+                heapq.heappush(priority_queue, (new_distance, neighbor))
+    
+    return distances, predecessors, owners
+
+
+def _multi_source_instrumented(graph, sources, stats):
+    """multi_source_dijkstra, counting its work into a SearchStats object"""
+    with stats.phase('initialize'):
+        distances = {vertex: float('inf') for vertex in graph.vertices}
+        predecessors = {vertex: None for vertex in graph.vertices}
+        owners = {vertex: None for vertex in graph.vertices}
+        
+        priority_queue = []
+        for source in sources:
+            distances[source] = 0
+            owners[source] = source
+            priority_queue.append((0, source))
+        heapq.heapify(priority_queue)
+        
+        visited = set()
+        
+        scanned = relaxed = stale = 0
+        pushes = peak = len(priority_queue)
+    
+    with stats.phase('search'):
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            
+            if current_vertex in visited:
+                stale += 1
+                continue
+            
+            visited.add(current_vertex)
+            owner = owners[current_vertex]
+            
+            for neighbor, edge_weight in graph.get_neighbors(current_vertex):
+                scanned += 1
+                if neighbor in visited:
+                    continue
+                
+                new_distance = current_distance + edge_weight
+                
+                if new_distance < distances[neighbor]:
+                    relaxed += 1
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current_vertex
+                    owners[neighbor] = owner
+                    heapq.heappush(priority_queue, (new_distance, neighbor))
+                    pushes += 1
+                    if len(priority_queue) > peak:
+                        peak = len(priority_queue)
+    
+    stats.record(len(visited), scanned, relaxed, pushes, stale, peak)
+    
+    return distances, predecessors, owners
+
+
+def voronoi_partition(graph, sources, stats=None):
+    """
+    Assign every vertex to its nearest source.
+    
+    Args:
+        graph: Graph object
+        sources: Iterable of source vertices
+        stats: SearchStats object to collect counters and timings (optional)
+        
+    Returns:
+        Dictionary mapping each source to the list of vertices in its cell;
+        unreachable vertices belong to no cell
+    """
+    sources = list(sources)
+    _, _, owners = multi_source_dijkstra(graph, sources, stats)
+    
+    cells = {source: [] for source in sources}
+    for vertex, owner in owners.items():
+        if owner is not None:
+            cells[owner].append(vertex)
+    
+    return cells
+
+
+def dijkstra_path(graph, start, end, stats=None, heuristic=None, weight=None):
     """
     Find the shortest path between two vertices using Dijkstra's algorithm.
     
@@ -77,17 +386,36 @@ def dijkstra_path(graph, start, end):
         graph: Graph object
         start: Starting vertex
         end: Ending vertex
-        
+        stats: SearchStats object to collect counters and timings (optional)
+        heuristic: Dictionary of lower bounds of the distance from each vertex
+                   to end; the search then runs as A* (optional)
+        weight: Edge attribute name or {name: coefficient} dictionary used
+                instead of the stored weights (optional)
+                
     Returns:
         Tuple of (path, distance) where:
         - path is a list of vertices from start to end
         - distance is the total distance
         Returns (None, float('inf')) if no path exists
     """
-    distances, predecessors = dijkstra(graph, start)
+    if start == end:
+        return [start], 0
+    
+    # Vertices in different components are answered without a search
+    if graph.cannot_reach(start, end):
+        return None, float('inf')
+    
+    if weight is not None:
+        graph = graph.weighted_by(weight)
+    
+    if heuristic is not None:
+        return _astar_path(graph, start, end, stats, heuristic)
+    
+    # The search stops as soon as end is settled
+    distances, predecessors = dijkstra(graph, start, stats, k_nearest=1, targets=[end])
     
     # Check if end is reachable
-    if distances[end] == float('inf'):
+    if distances.get(end, float('inf')) == float('inf'):
         return None, float('inf')
     
     # Reconstruct path
@@ -96,6 +424,109 @@ def dijkstra_path(graph, start, end):
     return path, distances[end]
 
 
+def _astar_path(graph, start, end, stats, heuristic):
+    """A* search guided by lower bounds of the distance to end
+    
+    The bounds must be consistent (for example exact distances to end in a
+    graph with the same or fewer edges); vertices without a finite bound
+    cannot reach end and are skipped.
+    """
+    if stats is not None:
+        return _astar_path_instrumented(graph, start, end, stats, heuristic)
+    
+    distances = {start: 0}
+    predecessors = {start: None}
+    settled = set()
+    
+    priority_queue = [(heuristic.get(start, float('inf')), start)]
+    
+    while priority_queue:
+        _, current_vertex = heapq.heappop(priority_queue)
+        
+        if current_vertex in settled:
+            continue
+        
+        settled.add(current_vertex)
+        if current_vertex == end:
+            break
+        
+        current_distance = distances[current_vertex]
+        
+        for neighbor, edge_weight in graph.get_neighbors(current_vertex):
+            if neighbor in settled:
+                continue
+            
+            bound = heuristic.get(neighbor, float('inf'))
+            if bound == float('inf'):
+                continue
+            
+            new_distance = current_distance + edge_weight
+            
+            if new_distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (new_distance + bound, neighbor))
+    
+    if end not in settled:
+        return None, float('inf')
+    
+    return graph.reconstruct_path(predecessors, start, end), distances[end]
+
+
+def _astar_path_instrumented(graph, start, end, stats, heuristic):
+    """_astar_path, counting its work into a SearchStats object"""
+    with stats.phase('initialize'):
+        distances = {start: 0}
+        predecessors = {start: None}
+        settled = set()
+        
+        scanned = relaxed = stale = 0
+        pushes = peak = 1
+        
+        priority_queue = [(heuristic.get(start, float('inf')), start)]
+    
+    with stats.phase('search'):
+        while priority_queue:
+            _, current_vertex = heapq.heappop(priority_queue)
+            
+            if current_vertex in settled:
+                stale += 1
+                continue
+            
+            settled.add(current_vertex)
+            if current_vertex == end:
+                break
+            
+            current_distance = distances[current_vertex]
+            
+            for neighbor, edge_weight in graph.get_neighbors(current_vertex):
+                scanned += 1
+                if neighbor in settled:
+                    continue
+                
+                bound = heuristic.get(neighbor, float('inf'))
+                if bound == float('inf'):
+                    continue
+                
+                new_distance = current_distance + edge_weight
+                
+                if new_distance < distances.get(neighbor, float('inf')):
+                    relaxed += 1
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current_vertex
+                    heapq.heappush(priority_queue, (new_distance + bound, neighbor))
+                    pushes += 1
+                    if len(priority_queue) > peak:
+                        peak = len(priority_queue)
+    
+    stats.record(len(settled), scanned, relaxed, pushes, stale, peak)
+    
+    if end not in settled:
+        return None, float('inf')
+    
+    return graph.reconstruct_path(predecessors, start, end), distances[end]
+
+
 def validate_graph_for_dijkstra(graph):
     """
     Validate that the graph is suitable for Dijkstra's algorithm.
@@ -0,0 +1,187 @@
+"""
+Named edge attributes stored column-wise
+
+Every edge of a graph with attributes gets an id in the order it was
+added, and each attribute (distance, time, toll, ...) is one array of
+floats indexed by that id, next to a 'weight' column with the stored
+weight. The adjacency lists stay unchanged; Graph.edge_ids holds the id
+of every adjacency entry. A search picks its cost metric through a
+WeightedView, which reads the selected column instead of the stored
+weight, so switching metrics needs neither a reload nor a copy of the
+graph.
+
+A weight selector is either an attribute name or a dictionary of
+coefficients, for example {'time': 1.0, 'toll': 0.5}; combinations are
+computed once for all edges with NumPy.
+"""
+
+from array import array
+
+
+class EdgeAttributes:
+    """Columns of edge attribute values indexed by edge id"""
+    
+    def __init__(self):
+        """Initialize empty columns"""
+        self.columns = {'weight': array('d')}
+    
+    def __len__(self):
+        return len(self.columns['weight'])
+    
+    @property
+    def names(self):
+        """Names of all columns"""
+        return list(self.columns)
+    
+    def append(self, weight, attributes=None):
+        """Add the values of a new edge
+        
+        Args:
+            weight: Stored weight of the edge
+            attributes: Dictionary of attribute values (optional); attributes
+                        missing for an edge are 0
+                        
+        Returns:
+            Id of the edge
+        """
+        edge_id = len(self)
+        attributes = attributes or {}
+        
+        # A new attribute is 0 for all earlier edges
+        for name in attributes:
+            if name not in self.columns:
+                self.columns[name] = array('d', bytes(8 * edge_id))
+        
+        for name, column in self.columns.items():
+            column.append(weight if name == 'weight' else float(attributes.get(name, 0.0)))
+        
+        return edge_id
+    
+    def column(self, name):
+        """Get the values of one attribute
+        
+        Raises:
+            ValueError: If there is no such attribute
+        """
+        if name not in self.columns:
+            raise ValueError(f"Unknown edge attribute '{name}' (known: {', '.join(self.names)})")
+        return self.columns[name]
+    
+    def select(self, selector):
+        """Get the cost of every edge for a weight selector
+        
+        Args:
+            selector: Attribute name or dictionary of {name: coefficient}
+            
+        Returns:
+            Array of costs indexed by edge id (a stored column is not copied)
+            
+        Raises:
+            ValueError: If an attribute is unknown or a cost is negative
+        """
+        if isinstance(selector, str):
+            costs = self.column(selector)
+        else:
+            import numpy as np
+            
+            combined = np.zeros(len(self))
+            for name, coefficient in selector.items():
+                combined += coefficient * np.frombuffer(self.column(name), dtype=np.float64)
+            costs = array('d', combined.tobytes())
+        
+        if len(costs) and min(costs) < 0:
+            raise ValueError("Selected edge weights must be non-negative")
+        
+        return costs
+
+
+def parse_weight_selector(text):
+    """Parse a weight selector given on the command line
+    
+    Args:
+        text: Attribute name ('time') or weighted sum ('time=1,toll=0.5')
+        
+    Returns:
+        Attribute name or dictionary of {name: coefficient}
+    """
+    if '=' not in text:
+        return text.strip()
+    
+    selector = {}
+    for term in text.split(','):
+        name, _, coefficient = term.partition('=')
+        selector[name.strip()] = float(coefficient)
+    return selector
+
+
+class WeightedView:
+    """A graph seen through a selected edge weight
+    
+    Adjacency, edges, statistics and CSR arrays of the view use the
+    selected costs; everything else is the underlying graph. The
+    (neighbor, cost) list of a vertex is built on its first visit and kept,
+    so a search pays for the vertices it reaches, not for the whole graph.
+    """
+    
+    def __init__(self, graph, costs):
+        """Create the view
+        
+        Args:
+            graph: Graph object with edge attributes
+            costs: Cost of every edge, indexed by edge id
+        """
+        self.graph = graph
+        self.costs = costs
+        self._neighbors = {}
+        self._csr = None
+    
+    def __getattr__(self, name):
+        return getattr(self.graph, name)
+    
+    @property
+    def adj_list(self):
+        """Adjacency lists of all vertices with the selected weights"""
+        if len(self._neighbors) < len(self.graph.adj_list):
+            for vertex in self.graph.adj_list:
+                self.get_neighbors(vertex)
+        return self._neighbors
+    
+    def get_neighbors(self, vertex):
+        """Get all neighbors of a vertex with the selected weights"""
+        neighbors = self._neighbors.get(vertex)
+        if neighbors is None:
+            costs = self.costs
+            graph = self.graph
+            neighbors = [(neighbor, costs[edge_id]) for (neighbor, _), edge_id
+                         in zip(graph.adj_list.get(vertex, ()), graph.edge_ids.get(vertex, ()))]
+            self._neighbors[vertex] = neighbors
+        return neighbors
+    
+    def get_edges(self):
+        """Get all edges with the selected weights, see Graph.get_edges"""
+        from src.graph import Graph
+        
+        return Graph.get_edges(self)
+    
+    def get_graph_stats(self):
+        """Get basic statistics of the graph with the selected weights"""
+        from src.graph import Graph
+        
+        return Graph.get_graph_stats(self)
+    
+    def has_negative_edges(self):
+        """Selected weights are checked to be non-negative (EdgeAttributes.select)"""
+        return False
+    
+    def get_edge_weight(self, u, v):
+        """Get the smallest selected weight of the edges from u to v"""
+        weights = [weight for neighbor, weight in self.get_neighbors(u) if neighbor == v]
+        return min(weights) if weights else None
+    
+    def csr(self):
+        """Get the CSR arrays of the view, built once"""
+        if self._csr is None:
+            from src.csr import CSRGraph
+            
+            self._csr = CSRGraph.from_graph(self)
+        return self._csr
@@ -0,0 +1,103 @@
+"""
+Selection of the shortest path engine for a graph
+"""
+
+import importlib.util
+
+from src.dijkstra import dijkstra
+
+
+# Engines accepted by shortest_paths, besides 'auto'
+ENGINES = ['dijkstra', 'bellman_ford', 'numba', 'scipy']
+
+# Numba and SciPy are optional; checking for them does not import them
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+SCIPY_AVAILABLE = importlib.util.find_spec('scipy') is not None
+
+# Below this many adjacency entries the compiled engine does not pay for
+# building the CSR arrays and converting the results back
+NUMBA_MIN_EDGES = 100000
+
+
+def choose_engine(graph):
+    """Choose the engine that gives correct results for a graph
+    
+    Args:
+        graph: Graph object
+        
+    Returns:
+        'bellman_ford' if the graph has negative edges, 'numba' for large
+        graphs when Numba is installed, otherwise 'dijkstra'
+    """
+    if graph.has_negative_edges():
+        return 'bellman_ford'
+    if NUMBA_AVAILABLE and sum(map(len, graph.adj_list.values())) >= NUMBA_MIN_EDGES:
+        return 'numba'
+    return 'dijkstra'
+
+
+def shortest_paths(graph, start, engine='auto', stats=None, max_distance=None,
+                   k_nearest=None, targets=None, weight=None):
+    """Find shortest paths from a single source with the chosen engine
+    
+    Args:
+        graph: Graph object
+        start: Starting vertex
+        engine: Name from ENGINES, or 'auto' to use choose_engine
+        stats: SearchStats object to collect counters and timings (optional)
+        max_distance: Bound of the search, see dijkstra (optional)
+        k_nearest: Number of nearest vertices to find, see dijkstra (optional)
+        targets: Vertices counted by k_nearest, see dijkstra (optional)
+        weight: Edge attribute selector, see dijkstra (optional)
+        
+    Returns:
+        Tuple of (distances, predecessors) dictionaries
+        
+    Raises:
+        NegativeCycleError: If Bellman-Ford finds a negative cycle
+        ValueError: If a bounded search or an edge attribute selector is
+                    requested from Bellman-Ford
+    """
+    # Selected attribute weights are checked to be non-negative
+    if engine == 'auto':
+        engine = 'dijkstra' if weight is not None else choose_engine(graph)
+    
+    bounded = max_distance is not None or k_nearest is not None
+    
+    # The compiled engines search with the stored weights; csgraph supports
+    # a distance limit but not a vertex count
+    if engine == 'numba' and (bounded or weight is not None):
+        engine = 'dijkstra'
+    if engine == 'scipy' and (k_nearest is not None or weight is not None):
+        engine = 'dijkstra'
+    
+    if engine == 'scipy':
+        if not SCIPY_AVAILABLE:
+            raise ValueError("The scipy engine needs SciPy (pip install scipy)")
+        
+        from src.scipy_backend import scipy_dijkstra
+        
+        return scipy_dijkstra(graph, start, stats, max_distance)
+    
+    if engine == 'dijkstra':
+        return dijkstra(graph, start, stats, max_distance, k_nearest, targets, weight)
+    
+    if engine == 'numba':
+        from src.numba_engine import numba_dijkstra
+        
+        return numba_dijkstra(graph, start, stats)
+    
+    if weight is not None:
+        raise ValueError("Edge attribute weights are supported by the dijkstra engine only")
+    
+    # With negative edges a vertex beyond the bound can still lead back closer
+    if bounded:
+        raise ValueError("Bounded searches need non-negative edge weights")
+    
+    if engine == 'bellman_ford':
+        # Imported here so that NumPy loads only for graphs that need it
+        from src.bellman_ford import bellman_ford
+        
+        return bellman_ford(graph, start, stats)
+    
+    raise ValueError(f"Unknown engine '{engine}'")
@@ -13,6 +13,7 @@ def load_graph_from_file(filename):
     Supported formats:
     - Edge list: u v weight (one edge per line)
     - JSON format
+    - Binary format (.npz), see export_graph_to_binary
     
     Args:
         filename: Path to input file
@@ -20,6 +21,9 @@ def load_graph_from_file(filename):
     Returns:
         Graph object
     """
+    if filename.endswith('.npz'):
+        return load_from_binary(filename)
+    
     with open(filename, 'r') as f:
         content = f.read().strip()
     
@@ -40,11 +44,68 @@ def load_from_json(data):
         "directed": true/false,
         "edges": [
             {"from": "A", "to": "B", "weight": 5},
+            {"from": "B", "to": "C", "profile": [[0, 4], [28800, 9], [36000, 4]]},
             ...
         ]
     }
+    
+    An edge with "profile" has a travel time depending on the departure
+    time, given as [time, travel time] breakpoints; such files load as a
+    TimeDependentGraph.
+    
+    Any other numeric field of an edge ("toll", "distance", ...) becomes a
+    named edge attribute column, see Graph.weighted_by.
+    
+    An optional "coordinates" object maps vertices to [x, y] positions,
+    used by the Hilbert vertex ordering (src/reorder.py).
     """
-    graph = Graph(directed=data.get('directed', False))
+    graph = _load_edges_from_json(data)
+    graph.coordinates = {vertex: tuple(position)
+                         for vertex, position in data.get('coordinates', {}).items()}
+    return graph
+
+
+# Fields of a JSON edge that are not attributes
+_STRUCTURAL_FIELDS = {'from', 'to', 'weight', 'profile'}
+
+
+def _edge_attributes(edge):
+    """Numeric fields of a JSON edge, which become attribute columns
+    
+    Other fields (labels, road numbers, flags) are ignored, as they were
+    before edges had attributes.
+    """
+    return {key: value for key, value in edge.items()
+            if key not in _STRUCTURAL_FIELDS and isinstance(value, (int, float))
+            and not isinstance(value, bool)}
+
+
+def _load_edges_from_json(data):
+    """Build the graph of the edges of JSON data, see load_from_json"""
+    directed = data.get('directed', False)
+    has_attributes = any(_edge_attributes(edge) for edge in data['edges'])
+    
+    if any('profile' in edge for edge in data['edges']):
+        from src.time_dependent import TimeDependentGraph
+        
+        graph = TimeDependentGraph(directed=directed, edge_attributes=has_attributes)
+        for edge in data['edges']:
+            attributes = _edge_attributes(edge)
+            if 'profile' in edge:
+                times, travel_times = zip(*edge['profile'])
+                graph.add_profile_edge(edge['from'], edge['to'], times, travel_times,
+                                       attributes)
+            else:
+                graph.add_edge(edge['from'], edge['to'], edge['weight'], attributes)
+        return graph
+    
+    graph = Graph(directed=directed, edge_attributes=has_attributes)
+    
+    if has_attributes:
+        for edge in data['edges']:
+            attributes = _edge_attributes(edge)
+            graph.add_edge(edge['from'], edge['to'], edge['weight'], attributes)
+        return graph
     
     for edge in data['edges']:
         graph.add_edge(edge['from'], edge['to'], edge['weight'])
@@ -52,6 +113,18 @@ def load_from_json(data):
     return graph
 
 
+def load_from_binary(filename):
+    """Load graph from the binary format written by export_graph_to_binary
+    
+    Vertices and edges are created in the stored order, and the stored
+    arrays become the CSR cache of the graph, so the compiled engines keep
+    the saved vertex layout.
+    """
+    from src.csr import CSRGraph
+    
+    return CSRGraph.load(filename).to_graph()
+
+
 def load_from_edge_list(content):
     """Load graph from edge list format
     
@@ -84,6 +157,33 @@ def load_from_edge_list(content):
     return graph
 
 
+def load_queries_from_file(filename):
+    """Load shortest path queries from file
+    
+    Format: start [end] (one query per line)
+    Lines with only a start vertex ask for distances to all vertices.
+    
+    Args:
+        filename: Path to query file
+        
+    Returns:
+        List of (start, end) tuples, end is None for start-only queries
+    """
+    queries = []
+    
+    with open(filename, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):  # Skip empty lines and comments
+                continue
+            
+            parts = line.split()
+            end = parts[1] if len(parts) >= 2 else None
+            queries.append((parts[0], end))
+    
+    return queries
+
+
 def save_results(results, filename, graph):
     """Save Dijkstra algorithm results to file
     
@@ -112,12 +212,16 @@ def save_results(results, filename, graph):
         f.write("Shortest distances:\n")
         f.write("-" * 30 + "\n")
         
+        # Multi-source results name the nearest start vertex of each vertex
+        owners = results.get('owners', {})
+        
         for vertex in sorted(results['distances'].keys()):
             distance = results['distances'][vertex]
+            source = owners.get(vertex, results['start'])
             if distance == 'No path':
-                f.write(f"{results['start']} -> {vertex}: No path\n")
+                f.write(f"{source} -> {vertex}: No path\n" if source else f"{vertex}: No path\n")
             else:
-                f.write(f"{results['start']} -> {vertex}: {distance}\n")
+                f.write(f"{source} -> {vertex}: {distance}\n")
                 
                 # Write path if available
                 if vertex in results['paths'] and results['paths'][vertex]:
@@ -151,6 +255,37 @@ def export_graph_to_json(graph, filename):
         json.dump(data, f, indent=2)
 
 
+def export_graph_to_edge_list(graph, filename):
+    """Export graph to the edge list format read by load_graph_from_file
+    
+    Args:
+        graph: Graph object
+        filename: Output filename
+    """
+    with open(filename, 'w') as f:
+        f.write('directed\n' if graph.directed else 'undirected\n')
+        # Unlike get_edges, keep parallel edges of undirected graphs
+        for u, v, weight in graph.iter_stored_edges():
+            f.write(f"{u} {v} {weight}\n")
+
+
+def export_graph_to_binary(graph, filename, order=None):
+    """Export graph to the binary format (NumPy .npz of its CSR arrays)
+    
+    Vertex names are stored as strings. Edge attributes, time-dependent
+    profiles and coordinates are not stored.
+    
+    Args:
+        graph: Graph object
+        filename: Output filename (.npz)
+        order: List of all vertex names in the order to store them, see
+               src/reorder.py (default: sorted by name)
+    """
+    from src.csr import CSRGraph
+    
+    CSRGraph.from_graph(graph, order).save(filename)
+
+
 def create_example_files():
     """Create example test files for Dijkstra's algorithm"""
     
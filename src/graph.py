@@ -3,28 +3,100 @@ Graph data structure for Dijkstra's algorithm
 """
 
 from collections import defaultdict
+from contextlib import contextmanager
+
+from src.edge_attributes import EdgeAttributes, WeightedView
+
+
+class ComponentIndex:
+    """Union-find over vertices, merged as edges are added"""
+    
+    def __init__(self):
+        """Initialize an index where every vertex is its own component"""
+        self.parent = {}
+        self.size = {}
+    
+    def find(self, vertex):
+        """Get the representative vertex of the component of a vertex"""
+        parent = self.parent
+        
+        # Roots have no parent entry; most vertices are at most one step away
+        root = parent.get(vertex)
+        if root is None:
+            return vertex
+        if root not in parent:
+            return root
+        
+        while root in parent:
+            root = parent[root]
+        
+        # Path compression
+        while vertex != root:
+            parent[vertex], vertex = root, parent[vertex]
+        
+        return root
+    
+    def union(self, u, v):
+        """Merge the components of two vertices"""
+        root_u, root_v = self.find(u), self.find(v)
+        if root_u == root_v:
+            return
+        
+        size_u, size_v = self.size.get(root_u, 1), self.size.get(root_v, 1)
+        if size_u < size_v:
+            root_u, root_v = root_v, root_u
+        
+        self.parent[root_v] = root_u
+        self.size[root_u] = size_u + size_v
+        self.size.pop(root_v, None)
+    
+    def copy(self):
+        """Get an independent copy of the index"""
+        index = ComponentIndex()
+        index.parent = dict(self.parent)
+        index.size = dict(self.size)
+        return index
 
 
 class Graph:
     """Graph class for Dijkstra's shortest path algorithm"""
     
-    def __init__(self, directed=False):
+    def __init__(self, directed=False, edge_attributes=False):
         """Initialize graph
         
         Args:
             directed (bool): True for directed graph, False for undirected
+            edge_attributes (bool): Keep edge ids and named attribute columns
         """
         self.adj_list = defaultdict(list)
         self.vertices = set()
         self.directed = directed
+        
+        # Edge id of every adjacency entry, aligned with adj_list
+        self.edge_attributes = EdgeAttributes() if edge_attributes else None
+        self.edge_ids = defaultdict(list) if edge_attributes else None
+        
+        # Vertex positions (x, y) given by the input file, if any
+        self.coordinates = {}
+        
+        # Connected (for directed graphs weakly connected) components, built
+        # on first use and then kept up to date by add_edge; strong
+        # components are computed on request
+        self._components = None
+        self._strong_components = None
+        
+        # CSR arrays for compiled and vectorized engines, built on request
+        self._csr = None
     
-    def add_edge(self, u, v, weight):
+    def add_edge(self, u, v, weight, attributes=None):
         """Add an edge to the graph
         
         Args:
             u: Start vertex
             v: End vertex
             weight: Edge weight (should be non-negative for Dijkstra)
+            attributes: Dictionary of named edge attributes (needs a graph
+                        created with edge_attributes=True)
         """
         self.adj_list[u].append((v, weight))
         self.vertices.add(u)
@@ -32,6 +104,173 @@ class Graph:
         
         if not self.directed:
             self.adj_list[v].append((u, weight))
+        
+        if self.edge_attributes is not None:
+            edge_id = self.edge_attributes.append(weight, attributes)
+            self.edge_ids[u].append(edge_id)
+            if not self.directed:
+                self.edge_ids[v].append(edge_id)
+        elif attributes:
+            raise ValueError("Graph was created without edge attributes")
+        
+        if self._components is not None:
+            self._components.union(u, v)
+        self._strong_components = None
+        self._csr = None
+    
+    @property
+    def components(self):
+        """ComponentIndex of the (weakly) connected components
+        
+        Loading a graph does not pay for the index: it is built from the
+        adjacency lists on first use, in O(V + E) time, and from then on
+        add_edge merges components as edges arrive.
+        """
+        if self._components is None:
+            self._components = self._build_components()
+        return self._components
+    
+    @components.setter
+    def components(self, index):
+        self._components = index
+    
+    def _build_components(self):
+        """Find the (weakly) connected components of the adjacency lists"""
+        components = ComponentIndex()
+        adj_list = self.adj_list
+        
+        if self.directed:
+            for u, neighbors in adj_list.items():
+                for v, _ in neighbors:
+                    components.union(u, v)
+            return components
+        
+        # Lists hold both directions, so a search finds each component
+        # faster than one union per edge; members point to its root
+        for root in adj_list:
+            if root in components.parent or root in components.size:
+                continue
+            members = [root]
+            seen = {root}
+            for vertex in members:
+                for neighbor, _ in adj_list.get(vertex, ()):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        members.append(neighbor)
+            if len(members) > 1:
+                components.size[root] = len(members)
+                components.parent.update((member, root) for member in members[1:])
+        
+        return components
+    
+    def same_component(self, u, v):
+        """Check if two vertices are in the same (weakly) connected component"""
+        return self.components.find(u) == self.components.find(v)
+    
+    def strong_components(self):
+        """Get the strongly connected components of the graph
+        
+        Components are found with Tarjan's algorithm and numbered in reverse
+        topological order, so an edge never leads from a component to one
+        with a higher number. The result is cached until the next add_edge.
+        
+        Returns:
+            Dictionary mapping each vertex to its component number
+        """
+        if self._strong_components is not None:
+            return self._strong_components
+        
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        component = {}
+        counter = number = 0
+        
+        for root in self.vertices:
+            if root in index:
+                continue
+            
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.adj_list.get(root, ())))]
+            
+            while work:
+                vertex, neighbors = work[-1]
+                
+                # Descend into the first unvisited neighbor
+                descended = False
+                for neighbor, _ in neighbors:
+                    if neighbor not in index:
+                        index[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(self.adj_list.get(neighbor, ()))))
+                        descended = True
+                        break
+                    if neighbor in on_stack:
+                        low[vertex] = min(low[vertex], index[neighbor])
+                
+                if descended:
+                    continue
+                
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[vertex])
+                
+                # Vertex is the root of a component, pop the whole component
+                if low[vertex] == index[vertex]:
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = number
+                        if member == vertex:
+                            break
+                    number += 1
+        
+        self._strong_components = component
+        return component
+    
+    def csr(self):
+        """Get the CSR arrays of the graph (see src/csr.py)
+        
+        The arrays are built once and reused until the next add_edge.
+        
+        Returns:
+            CSRGraph object
+        """
+        if self._csr is None:
+            from src.csr import CSRGraph
+            
+            self._csr = CSRGraph.from_graph(self)
+        return self._csr
+    
+    def cannot_reach(self, u, v):
+        """Check in O(1) whether v is certainly unreachable from u
+        
+        Vertices in different components never reach each other. In directed
+        graphs whose strong components were computed, a vertex also cannot
+        reach a component with a higher number. False means a path may exist.
+        
+        Args:
+            u: Start vertex
+            v: End vertex
+            
+        Returns:
+            bool: True if there is no path from u to v
+        """
+        if not self.same_component(u, v):
+            return True
+        
+        components = self._strong_components
+        if self.directed and components is not None and u in components and v in components:
+            return components[u] < components[v]
+        
+        return False
     
     def get_neighbors(self, vertex):
         """Get all neighbors of a vertex
@@ -42,7 +281,9 @@ class Graph:
         Returns:
             List of (neighbor, weight) tuples
         """
-        return self.adj_list[vertex]
+        # get() does not insert missing vertices into the defaultdict, so
+        # concurrent searches never change the adjacency they read
+        return self.adj_list.get(vertex, ())
     
     def get_edges(self):
         """Get all edges in the graph
@@ -66,6 +307,27 @@ class Graph:
         
         return edges
     
+    def iter_stored_edges(self):
+        """Iterate over the stored edges, each added edge once
+        
+        Unlike get_edges, parallel edges of undirected graphs are kept. An
+        undirected edge appears in the lists of both ends and is yielded
+        from the end that sorts first; an undirected self-loop is stored
+        twice in a row in one list and is yielded once.
+        
+        Yields:
+            (u, v, weight) tuples
+        """
+        for u, neighbors in self.adj_list.items():
+            second_copy = False
+            for v, weight in neighbors:
+                if self.directed or u < v:
+                    yield u, v, weight
+                elif u == v:
+                    if not second_copy:
+                        yield u, v, weight
+                    second_copy = not second_copy
+    
     def has_negative_edges(self):
         """Check if graph has negative edges
         
@@ -78,6 +340,126 @@ class Graph:
                     return True
         return False
     
+    def get_edge_weight(self, u, v):
+        """Get the weight of the lightest edge from u to v
+        
+        Returns:
+            Edge weight, or None if there is no such edge
+        """
+        weights = [weight for neighbor, weight in self.adj_list.get(u, ()) if neighbor == v]
+        return min(weights) if weights else None
+    
+    def weighted_by(self, selector):
+        """Get a view of the graph with weights taken from edge attributes
+        
+        Args:
+            selector: Attribute name or dictionary of {name: coefficient}
+            
+        Returns:
+            WeightedView, or this graph for the stored 'weight'
+            
+        Raises:
+            ValueError: If the graph has no such attributes
+        """
+        if selector == 'weight':
+            return self
+        if self.edge_attributes is None:
+            raise ValueError("Graph has no edge attributes")
+        
+        return WeightedView(self, self.edge_attributes.select(selector))
+    
+    def snapshot(self):
+        """Get an immutable copy of the graph for concurrent searches
+        
+        Returns:
+            GraphSnapshot object (see src/snapshot.py)
+        """
+        from src.snapshot import GraphSnapshot
+        
+        return GraphSnapshot(self)
+    
+    def reversed(self):
+        """Get the graph with every edge reversed
+        
+        Returns:
+            New directed Graph, or this graph if it is undirected
+        """
+        if not self.directed:
+            return self
+        
+        reverse = Graph(directed=True)
+        reverse.vertices = set(self.vertices)
+        if self._components is not None:
+            reverse.components = self._components.copy()
+        for u, neighbors in self.adj_list.items():
+            for v, weight in neighbors:
+                reverse.adj_list[v].append((u, weight))
+        
+        # Reversed edges keep their ids and share the attribute columns
+        if self.edge_attributes is not None:
+            reverse.edge_attributes = self.edge_attributes
+            reverse.edge_ids = defaultdict(list)
+            for u, neighbors in self.adj_list.items():
+                for (v, _), edge_id in zip(neighbors, self.edge_ids[u]):
+                    reverse.edge_ids[v].append(edge_id)
+        
+        return reverse
+    
+    @contextmanager
+    def masked(self, edges=(), vertices=()):
+        """Temporarily hide edges and vertices from searches
+        
+        Only the adjacency lists of the affected vertices are replaced, so
+        masking costs O(degree) instead of a copy of the graph. A masked
+        vertex loses its outgoing edges: a search may still reach it but
+        cannot pass through it.
+        
+        Args:
+            edges: (u, v) pairs whose u -> v entries are hidden
+            vertices: Vertices whose outgoing edges are hidden
+        """
+        hidden_edges = defaultdict(set)
+        for u, v in edges:
+            hidden_edges[u].add(v)
+        
+        masked_vertices = set(vertices)
+        
+        # Hiding edges only removes paths, so the component index of the
+        # whole graph stays a valid (conservative) answer and is built
+        # before the lists change; strong components must not be
+        # computed from the masked lists, and cached CSR arrays of the
+        # whole graph must not be searched while the mask is on
+        self.components
+        strong_components = self._strong_components
+        csr = self._csr
+        self._csr = None
+        
+        saved = {}
+        saved_ids = {}
+        for u in masked_vertices | set(hidden_edges):
+            if u not in self.adj_list:
+                continue
+            saved[u] = self.adj_list[u]
+            if u in masked_vertices:
+                self.adj_list[u] = []
+            else:
+                self.adj_list[u] = [entry for entry in saved[u] if entry[0] not in hidden_edges[u]]
+            
+            # Edge ids must stay aligned with the adjacency list
+            if self.edge_ids is not None:
+                saved_ids[u] = self.edge_ids[u]
+                self.edge_ids[u] = [edge_id for entry, edge_id in zip(saved[u], saved_ids[u])
+                                    if u not in masked_vertices and entry[0] not in hidden_edges[u]]
+        
+        try:
+            yield self
+        finally:
+            self.adj_list.update(saved)
+            if self.edge_ids is not None:
+                self.edge_ids.update(saved_ids)
+            self._strong_components = strong_components
+            self._csr = csr
+    
     def reconstruct_path(self, predecessors, start, end):
         """Reconstruct path from predecessors dictionary
         
@@ -104,6 +486,64 @@ class Graph:
         path.reverse()
         return path
     
+    def build_path_tree(self, predecessors):
+        """Build children lists of the shortest path tree
+        
+        Args:
+            predecessors: Dictionary of predecessors from Dijkstra
+            
+        Returns:
+            Dictionary mapping each vertex to the list of its children
+        """
+        children = defaultdict(list)
+        
+        for vertex, parent in predecessors.items():
+            if parent is not None:
+                children[parent].append(vertex)
+        
+        return children
+    
+    def iter_tree_paths(self, predecessors, start, max_length=None):
+        """Yield the path to every vertex of the shortest path tree
+        
+        The tree is walked once with a single DFS, so all paths together
+        cost O(V) instead of one predecessor walk per vertex. The yielded
+        path is a shared prefix stack that changes as the walk continues;
+        copy it if it has to outlive the current iteration.
+        
+        Args:
+            predecessors: Dictionary of predecessors from Dijkstra
+            start: Start vertex (root of the tree)
+            max_length: Do not descend below paths of this many vertices (optional)
+            
+        Yields:
+            Tuples of (vertex, path), path being the list of vertices from start
+        """
+        children = self.build_path_tree(predecessors)
+        exhausted = object()
+        
+        path = [start]
+        yield start, path
+        
+        iterators = [iter(children.get(start, ()))]
+        
+        while iterators:
+            child = next(iterators[-1], exhausted)
+            
+            # All children done, step back up to the parent
+            if child is exhausted:
+                iterators.pop()
+                path.pop()
+                continue
+            
+            path.append(child)
+            yield child, path
+            
+            if max_length is None or len(path) < max_length:
+                iterators.append(iter(children.get(child, ())))
+            else:
+                path.pop()
+    
     def get_graph_stats(self):
         """Get basic statistics about the graph
         
@@ -0,0 +1,97 @@
+"""
+Instrumentation counters for shortest path searches
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class SearchStats:
+    """Counters and phase timings collected by an instrumented search
+    
+    Pass an instance as the stats argument of a search to collect them.
+    Counters add up over several searches, so one object can cover a batch.
+    Searches written in Python also time their phases ('initialize',
+    'search'); the Numba and SciPy engines record no phase times.
+    """
+    
+    def __init__(self):
+        """Initialize all counters to zero"""
+        self.searches = 0
+        self.vertices_settled = 0
+        self.edges_scanned = 0
+        self.edges_relaxed = 0
+        self.heap_pushes = 0
+        self.stale_pops = 0
+        self.peak_heap_size = 0
+        self.phase_times = {}
+    
+    def record(self, settled=0, scanned=0, relaxed=0, pushes=0, stale=0, peak=0):
+        """Add the counters of one finished search
+        
+        Args:
+            settled: Vertices settled
+            scanned: Edges scanned
+            relaxed: Edges relaxed
+            pushes: Heap pushes
+            stale: Stale heap entries popped and skipped
+            peak: Largest heap size of the search
+        """
+        self.searches += 1
+        self.vertices_settled += settled
+        self.edges_scanned += scanned
+        self.edges_relaxed += relaxed
+        self.heap_pushes += pushes
+        self.stale_pops += stale
+        self.peak_heap_size = max(self.peak_heap_size, peak)
+    
+    @contextmanager
+    def phase(self, name):
+        """Measure wall time of a phase, added up under its name"""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + elapsed
+    
+    def as_dict(self):
+        """Get the collected numbers as a dictionary
+        
+        Returns:
+            Dictionary with counters and phase times in seconds
+        """
+        return {
+            'searches': self.searches,
+            'vertices_settled': self.vertices_settled,
+            'edges_scanned': self.edges_scanned,
+            'edges_relaxed': self.edges_relaxed,
+            'heap_pushes': self.heap_pushes,
+            'stale_pops': self.stale_pops,
+            'peak_heap_size': self.peak_heap_size,
+            'phase_times': dict(self.phase_times)
+        }
+    
+    def format(self):
+        """Format the collected numbers for display
+        
+        Returns:
+            Multi-line text
+        """
+        lines = [
+            "Search statistics:",
+            f"  Searches: {self.searches}",
+            f"  Vertices settled: {self.vertices_settled}",
+            f"  Edges scanned: {self.edges_scanned}",
+            f"  Edges relaxed: {self.edges_relaxed}",
+            f"  Heap pushes: {self.heap_pushes}",
+            f"  Stale pops skipped: {self.stale_pops}",
+            f"  Peak heap size: {self.peak_heap_size}",
+        ]
+        
+        if self.phase_times:
+            lines.append("  Wall time per phase:")
+            for name, seconds in self.phase_times.items():
+                lines.append(f"    {name}: {seconds * 1000:.3f} ms")
+        
+        return "\n".join(lines)
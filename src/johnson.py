@@ -0,0 +1,111 @@
+"""
+Johnson's algorithm for shortest paths on graphs with negative edges
+
+One Bellman-Ford pass computes vertex potentials h, every edge (u, v) is
+reweighted to w + h(u) - h(v) >= 0, and Dijkstra's algorithm then runs on
+the reweighted graph. Distances are corrected back with h(v) - h(u).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from src.bellman_ford import potentials
+from src.dijkstra import dijkstra
+from src.graph import Graph
+
+
+# (reweighted graph, potentials) held by each worker process
+_worker_state = None
+
+
+def _init_worker(reweighted, vertex_potentials):
+    """Store the reweighted graph in a worker process"""
+    global _worker_state
+    _worker_state = (reweighted, vertex_potentials)
+
+
+def _run_source(start):
+    """Run one source inside a worker process"""
+    reweighted, vertex_potentials = _worker_state
+    return start, johnson_search(reweighted, vertex_potentials, start)
+
+
+def reweight_graph(graph):
+    """Reweight a graph so that all edge weights become non-negative
+    
+    Args:
+        graph: Graph object, may contain negative edges
+        
+    Returns:
+        Tuple of (reweighted Graph, potentials dictionary)
+        
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle
+    """
+    vertex_potentials = potentials(graph)
+    
+    reweighted = Graph(directed=True)
+    reweighted.vertices = set(graph.vertices)
+    if graph._components is not None:
+        reweighted.components = graph._components.copy()
+    
+    for u, neighbors in graph.adj_list.items():
+        h_u = vertex_potentials[u]
+        # Rounding errors must not make an edge negative again
+        reweighted.adj_list[u] = [
+            (v, max(0.0, weight + h_u - vertex_potentials[v])) for v, weight in neighbors
+        ]
+    
+    return reweighted, vertex_potentials
+
+
+def johnson_search(reweighted, vertex_potentials, start, stats=None):
+    """Find shortest paths from one source of a reweighted graph
+    
+    Args:
+        reweighted: Graph returned by reweight_graph
+        vertex_potentials: Potentials returned by reweight_graph
+        start: Starting vertex
+        stats: SearchStats object to collect counters and timings (optional)
+        
+    Returns:
+        Tuple of (distances, predecessors) in the original weights
+    """
+    distances, predecessors = dijkstra(reweighted, start, stats)
+    
+    h_start = vertex_potentials[start]
+    for vertex, distance in distances.items():
+        if distance != float('inf') and vertex != start:
+            distances[vertex] = distance + vertex_potentials[vertex] - h_start
+    
+    return distances, predecessors
+
+
+def johnson(graph, sources=None, workers=1):
+    """
+    Johnson's algorithm for shortest paths between all pairs of vertices.
+    
+    Time Complexity: O(V * E log V) after one O(V * E) Bellman-Ford pass
+    Space Complexity: O(V^2) for the results
+    
+    Args:
+        graph: Graph object, may contain negative edges
+        sources: Start vertices (default: all vertices)
+        workers: Number of worker processes for the Dijkstra runs
+        
+    Returns:
+        Dictionary mapping each source to its (distances, predecessors) tuple
+        
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle
+    """
+    if sources is None:
+        sources = sorted(graph.vertices, key=str)
+    
+    reweighted, vertex_potentials = reweight_graph(graph)
+    
+    if workers == 1:
+        return {start: johnson_search(reweighted, vertex_potentials, start) for start in sources}
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(reweighted, vertex_potentials)) as executor:
+        return dict(executor.map(_run_source, sources, chunksize=16))
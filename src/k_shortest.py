@@ -0,0 +1,112 @@
+"""
+K shortest simple paths (Yen's algorithm)
+
+Each path found is the source of spur searches: for every vertex of the
+path, the root part up to that vertex is kept and the rest is replaced by
+a shortest path that avoids the root and the edges already used by paths
+sharing that root. Instead of copying the graph, spur searches run on
+temporary masks of it (Graph.masked). The shortest path tree towards the
+end vertex is computed once: it gives the spur path directly when that
+path avoids the masks, and otherwise its distances guide the spur search
+as an A* heuristic, so only the area around the detour is explored.
+"""
+
+import heapq
+
+from src.dijkstra import dijkstra, dijkstra_path
+
+
+def path_distance(graph, path):
+    """Get the total weight of a path
+    
+    Args:
+        graph: Graph object
+        path: List of vertices
+        
+    Returns:
+        Sum of the weights of the lightest edges along the path
+    """
+    return sum(graph.get_edge_weight(u, v) for u, v in zip(path, path[1:]))
+
+
+def _tree_path(next_hop, spur, end, blocked):
+    """Follow the tree towards end from the spur vertex
+    
+    Returns:
+        The path, or None if it enters a blocked vertex
+    """
+    path = [spur]
+    current = spur
+    
+    while current != end:
+        current = next_hop[current]
+        if current is None or current in blocked:
+            return None
+        path.append(current)
+    
+    return path
+
+
+def k_shortest_paths(graph, start, end, k, stats=None):
+    """
+    Find the k shortest simple paths between two vertices.
+    
+    Time Complexity: O(k * V * (V + E) log V) in the worst case
+    Space Complexity: O(k * V + E)
+    
+    Args:
+        graph: Graph object with non-negative weights
+        start: Starting vertex
+        end: Ending vertex
+        k: Number of paths to find
+        stats: SearchStats object to collect counters and timings (optional)
+        
+    Returns:
+        List of up to k (path, distance) tuples ordered by distance
+    """
+    # Shortest path tree towards end: distances to end and the next vertex
+    # on the way there, computed once on the reversed graph
+    distances_to_end, next_hop = dijkstra(graph.reversed(), end, stats)
+    
+    if start not in distances_to_end or distances_to_end[start] == float('inf'):
+        return []
+    
+    paths = [(_tree_path(next_hop, start, end, ()), distances_to_end[start])]
+    seen = {tuple(paths[0][0])}
+    candidates = []
+    
+    while len(paths) < k:
+        previous = paths[-1][0]
+        root_distance = 0
+        
+        for i, spur in enumerate(previous[:-1]):
+            root = previous[:i + 1]
+            
+            # Next hops already taken from this root
+            used_edges = {(spur, path[i + 1]) for path, _ in paths if path[:i + 1] == root}
+            used_next = {v for _, v in used_edges}
+            blocked = set(root[:-1])
+            
+            spur_path = _tree_path(next_hop, spur, end, blocked)
+            if spur_path is not None and spur_path[1] not in used_next:
+                spur_distance = distances_to_end[spur]
+            else:
+                with graph.masked(edges=used_edges, vertices=blocked):
+                    spur_path, spur_distance = dijkstra_path(graph, spur, end, stats,
+                                                             heuristic=distances_to_end)
+            
+            if spur_path is not None:
+                path = root[:-1] + spur_path
+                if tuple(path) not in seen:
+                    seen.add(tuple(path))
+                    heapq.heappush(candidates, (root_distance + spur_distance, len(path), path))
+            
+            root_distance += graph.get_edge_weight(spur, previous[i + 1])
+        
+        if not candidates:
+            break
+        
+        distance, _, path = heapq.heappop(candidates)
+        paths.append((path, distance))
+    
+    return paths
@@ -0,0 +1,227 @@
+"""
+Memory profiling for graph loading and shortest path searches
+"""
+
+import sys
+import tracemalloc
+
+from src.engines import shortest_paths
+from src.instrumentation import SearchStats
+
+
+def _size_once(obj, seen):
+    """Size of an object in bytes, or 0 if it was already counted"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    return sys.getsizeof(obj)
+
+
+def adjacency_memory(graph):
+    """Measure the memory held by the adjacency structure of a graph
+    
+    Vertex bytes cover the adjacency dictionary, the vertex set, the vertex
+    names and the list headers; edge bytes cover the list slots, the
+    (neighbor, weight) tuples and the weight objects. Objects shared by
+    several entries are counted once.
+    
+    Args:
+        graph: Graph object
+        
+    Returns:
+        Dictionary with total bytes and bytes per vertex and per edge
+    """
+    seen = set()
+    empty_list = sys.getsizeof([])
+    
+    vertex_bytes = _size_once(graph.adj_list, seen) + _size_once(graph.vertices, seen)
+    edge_bytes = 0
+    num_edges = 0
+    
+    for vertex in graph.vertices:
+        vertex_bytes += _size_once(vertex, seen)
+    
+    for vertex, neighbors in graph.adj_list.items():
+        vertex_bytes += _size_once(vertex, seen)
+        vertex_bytes += empty_list
+        edge_bytes += _size_once(neighbors, seen) - empty_list
+        
+        for entry in neighbors:
+            edge_bytes += _size_once(entry, seen) + _size_once(entry[1], seen)
+            num_edges += 1
+    
+    num_vertices = len(graph.vertices)
+    
+    return {
+        'num_vertices': num_vertices,
+        'num_adjacency_entries': num_edges,
+        'vertex_bytes': vertex_bytes,
+        'edge_bytes': edge_bytes,
+        'total_bytes': vertex_bytes + edge_bytes,
+        'bytes_per_vertex': vertex_bytes / num_vertices if num_vertices else 0,
+        'bytes_per_edge': edge_bytes / num_edges if num_edges else 0
+    }
+
+
+def attribute_memory(graph):
+    """Measure the memory held by the edge attribute columns of a graph
+    
+    Args:
+        graph: Graph object
+        
+    Returns:
+        Bytes of the columns and of the per-vertex edge id lists, or 0 for
+        graphs without edge attributes
+    """
+    if graph.edge_attributes is None:
+        return 0
+    
+    seen = set()
+    total = sum(_size_once(column, seen) for column in graph.edge_attributes.columns.values())
+    total += _size_once(graph.edge_ids, seen)
+    for edge_ids in graph.edge_ids.values():
+        total += _size_once(edge_ids, seen)
+        for edge_id in edge_ids:
+            total += _size_once(edge_id, seen)
+    
+    return total
+
+
+def measure_graph_memory(load):
+    """Load a graph under tracemalloc and measure its memory
+    
+    Args:
+        load: Function without arguments returning a Graph
+        
+    Returns:
+        Tuple of (graph, report) where report holds the bytes retained and
+        the peak during loading, the adjacency_memory breakdown and the
+        bytes of the edge attribute columns
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    
+    before, _ = tracemalloc.get_traced_memory()
+    graph = load()
+    after, peak = tracemalloc.get_traced_memory()
+    
+    if not was_tracing:
+        tracemalloc.stop()
+    
+    report = {
+        'load_retained_bytes': after - before,
+        'load_peak_bytes': peak - before,
+        'adjacency': adjacency_memory(graph),
+        'attribute_bytes': attribute_memory(graph)
+    }
+    
+    return graph, report
+
+
+def profile_search_memory(graph, start, stats=None, engine='auto', **search_options):
+    """Run a shortest path search under tracemalloc and break down its memory
+    
+    The peak is measured by tracemalloc. The breakdown is computed from the
+    sizes of the search structures at their largest: the final distances,
+    predecessors and visited set, and the heap at its peak size.
+    
+    Args:
+        graph: Graph object
+        start: Starting vertex
+        stats: SearchStats object to collect counters and timings (optional)
+        engine: Shortest path engine, see shortest_paths
+        search_options: Limits of the search passed to shortest_paths
+        
+    Returns:
+        Tuple of (distances, predecessors, report)
+    """
+    if stats is None:
+        stats = SearchStats()
+    peak_heap_before = stats.peak_heap_size
+    stats.peak_heap_size = 0
+    
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    
+    before, _ = tracemalloc.get_traced_memory()
+    distances, predecessors = shortest_paths(graph, start, engine, stats, **search_options)
+    after, peak = tracemalloc.get_traced_memory()
+    
+    if not was_tracing:
+        tracemalloc.stop()
+    
+    peak_heap = stats.peak_heap_size
+    stats.peak_heap_size = max(peak_heap, peak_heap_before)
+    
+    # Distance values are new float objects, predecessors reference vertex names
+    seen = set()
+    distances_bytes = _size_once(distances, seen)
+    for distance in distances.values():
+        distances_bytes += _size_once(distance, seen)
+    
+    predecessors_bytes = sys.getsizeof(predecessors)
+    
+    settled = {vertex for vertex, distance in distances.items() if distance != float('inf')}
+    visited_bytes = sys.getsizeof(settled)
+    
+    # Each heap entry is a (distance, vertex) tuple holding a new float
+    entry_bytes = sys.getsizeof((0.0, start)) + sys.getsizeof(0.0)
+    heap_bytes = sys.getsizeof([None] * peak_heap) + peak_heap * entry_bytes
+    
+    report = {
+        'search_peak_bytes': peak - before,
+        'search_retained_bytes': after - before,
+        'peak_heap_size': peak_heap,
+        'heap_bytes': heap_bytes,
+        'distances_bytes': distances_bytes,
+        'predecessors_bytes': predecessors_bytes,
+        'visited_bytes': visited_bytes
+    }
+    
+    return distances, predecessors, report
+
+
+def format_bytes(num_bytes):
+    """Format a byte count with a binary unit"""
+    for unit in ['B', 'KiB', 'MiB']:
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GiB"
+
+
+def format_memory_report(load_report=None, search_report=None):
+    """Format memory reports for display
+    
+    Args:
+        load_report: Report from measure_graph_memory (optional)
+        search_report: Report from profile_search_memory (optional)
+        
+    Returns:
+        Multi-line text
+    """
+    lines = ["Memory usage:"]
+    
+    if load_report:
+        adjacency = load_report['adjacency']
+        lines.append(f"  Graph load retained: {format_bytes(load_report['load_retained_bytes'])}")
+        lines.append(f"  Graph load peak: {format_bytes(load_report['load_peak_bytes'])}")
+        lines.append(f"  Adjacency structure: {format_bytes(adjacency['total_bytes'])}")
+        lines.append(f"    Per vertex: {adjacency['bytes_per_vertex']:.1f} B")
+        lines.append(f"    Per edge (adjacency entry): {adjacency['bytes_per_edge']:.1f} B")
+        if load_report['attribute_bytes']:
+            lines.append(f"  Edge attribute columns: {format_bytes(load_report['attribute_bytes'])}")
+    
+    if search_report:
+        lines.append(f"  Search peak: {format_bytes(search_report['search_peak_bytes'])}")
+        lines.append(f"    Heap (peak {search_report['peak_heap_size']} entries): "
+                     f"{format_bytes(search_report['heap_bytes'])}")
+        lines.append(f"    Distances: {format_bytes(search_report['distances_bytes'])}")
+        lines.append(f"    Predecessors: {format_bytes(search_report['predecessors_bytes'])}")
+        lines.append(f"    Visited: {format_bytes(search_report['visited_bytes'])}")
+    
+    return "\n".join(lines)
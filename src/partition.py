@@ -0,0 +1,161 @@
+"""
+Graph partitioning into shards with a boundary overlay
+
+The graph is split into K regions, each stored as its own edge list file.
+Vertices with an edge to another region are boundary vertices; for every
+region the shortest distances between its boundary vertices (using only
+edges inside the region) are precomputed. Together with the edges between
+regions they form the overlay graph, on which a coordinator combines
+per-shard searches into exact shortest paths (see src/shards.py).
+
+Directory layout:
+    meta.json       parts of all vertices, boundary vertices, overlay edges
+    shard_0.txt     edges inside region 0 (edge list format)
+    shard_1.txt     ...
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.dijkstra import dijkstra, multi_source_dijkstra
+from src.file_handler import export_graph_to_edge_list, load_graph_from_file
+from src.graph import Graph
+
+
+def partition_graph(graph, num_parts):
+    """Split vertices into regions grown around well spread seeds
+    
+    Seeds are chosen one by one as the vertex farthest from the seeds so
+    far (unreachable vertices first, so every component gets a seed while
+    seeds are left); regions are the graph Voronoi cells of the seeds,
+    which keeps them compact and their boundaries small.
+    
+    Args:
+        graph: Graph object
+        num_parts: Number of regions
+        
+    Returns:
+        Dictionary mapping each vertex to its region number
+    """
+    vertices = sorted(graph.vertices, key=str)
+    if not vertices:
+        return {}
+    
+    seeds = [vertices[0]]
+    distances, _, owners = multi_source_dijkstra(graph, seeds)
+    
+    while len(seeds) < min(num_parts, len(vertices)):
+        farthest = max(vertices, key=lambda vertex: distances[vertex])
+        if distances[farthest] == 0:
+            break
+        seeds.append(farthest)
+        distances, _, owners = multi_source_dijkstra(graph, seeds)
+    
+    region = {seed: number for number, seed in enumerate(seeds)}
+    
+    # Vertices no seed reaches (more components than regions) join region 0
+    return {vertex: region[owner] if owner is not None else 0 for vertex, owner in owners.items()}
+
+
+def split_graph(graph, parts):
+    """Split a graph into region subgraphs and the edges between regions
+    
+    Args:
+        graph: Graph object
+        parts: Dictionary mapping each vertex to its region number
+        
+    Returns:
+        Tuple of (list of region Graphs, list of (u, v, weight) cut edges);
+        for undirected graphs cut edges are listed in both directions
+    """
+    num_parts = max(parts.values()) + 1 if parts else 0
+    shards = [Graph(directed=graph.directed) for _ in range(num_parts)]
+    cut_edges = []
+    
+    # Adjacency lists hold undirected edges in both directions; cut edges
+    # are kept that way, edges inside a region are added once
+    for u, neighbors in graph.adj_list.items():
+        for v, weight in neighbors:
+            if parts[u] != parts[v]:
+                cut_edges.append((u, v, weight))
+    
+    for u, v, weight in graph.iter_stored_edges():
+        if parts[u] == parts[v]:
+            shards[parts[u]].add_edge(u, v, weight)
+    
+    return shards, cut_edges
+
+
+def shard_filename(directory, part):
+    """Get the file name of one shard"""
+    return os.path.join(directory, f"shard_{part}.txt")
+
+
+def _region_overlay(filename, boundary):
+    """Compute boundary-to-boundary distances inside one region"""
+    shard = load_graph_from_file(filename)
+    edges = []
+    
+    for source in boundary:
+        if source not in shard.vertices:
+            continue
+        # Stop once every other boundary vertex of the region is settled
+        distances, _ = dijkstra(shard, source, k_nearest=len(boundary) - 1, targets=boundary)
+        for target in boundary:
+            if target != source and target in distances:
+                edges.append((source, target, distances[target]))
+    
+    return edges
+
+
+def build_shards(graph, num_parts, directory, workers=None):
+    """Partition a graph and store its shards and overlay in a directory
+    
+    Args:
+        graph: Graph object with non-negative weights
+        num_parts: Number of regions
+        directory: Output directory (created if missing)
+        workers: Number of worker processes computing the overlay
+        
+    Returns:
+        Dictionary with the number of regions, boundary vertices and overlay edges
+    """
+    os.makedirs(directory, exist_ok=True)
+    
+    parts = partition_graph(graph, num_parts)
+    shards, cut_edges = split_graph(graph, parts)
+    
+    boundary = [set() for _ in shards]
+    for u, v, _ in cut_edges:
+        boundary[parts[u]].add(u)
+        boundary[parts[v]].add(v)
+    
+    for part, shard in enumerate(shards):
+        export_graph_to_edge_list(shard, shard_filename(directory, part))
+    
+    # Each region is loaded back from its file, so workers stay small
+    overlay = [[u, v, weight, -1] for u, v, weight in cut_edges]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_region_overlay, shard_filename(directory, part),
+                                   sorted(boundary[part], key=str))
+                   for part in range(len(shards))]
+        for part, future in enumerate(futures):
+            overlay.extend([u, v, weight, part] for u, v, weight in future.result())
+    
+    meta = {
+        'directed': graph.directed,
+        'num_parts': len(shards),
+        'parts': parts,
+        'boundary': [sorted(vertices, key=str) for vertices in boundary],
+        'overlay': overlay
+    }
+    
+    with open(os.path.join(directory, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    
+    return {
+        'num_parts': len(shards),
+        'boundary_vertices': sum(len(vertices) for vertices in boundary),
+        'overlay_edges': len(overlay)
+    }
@@ -0,0 +1,211 @@
+"""
+Shortest path queries with JSON-friendly answers
+"""
+
+from collections import defaultdict
+
+from src.engines import choose_engine, shortest_paths
+from src.graph import Graph
+
+
+def format_distance(distance):
+    """Convert a distance for JSON output (unreachable becomes None)"""
+    if distance == float('inf'):
+        return None
+    return distance
+
+
+def prepare_for_queries(graph):
+    """Build the indexes that answer impossible queries without a search
+    
+    A Graph builds its component index on first use, here rather than in
+    the first query (snapshots freeze theirs when published). Directed
+    graphs also need their strong components, computed once here before a
+    graph answers many queries, so that cannot_reach catches more of them.
+    
+    Args:
+        graph: Graph or GraphSnapshot object
+    """
+    if isinstance(graph, Graph):
+        graph.components
+    if graph.directed:
+        graph.strong_components()
+
+
+def check_query(graph, start, end=None):
+    """Answer a query that needs no search
+    
+    Args:
+        graph: Graph object
+        start: Start vertex
+        end: End vertex (optional)
+        
+    Returns:
+        Answer dictionary for an unknown vertex (with an 'error' key) or for
+        an end vertex the component index shows to be unreachable, otherwise
+        None
+    """
+    if start not in graph.vertices:
+        return {'start': start, 'end': end, 'error': f"Start vertex '{start}' not found"}
+    
+    if end is not None and end not in graph.vertices:
+        return {'start': start, 'end': end, 'error': f"End vertex '{end}' not found"}
+    
+    # Impossible queries are answered from the component index
+    if end is not None and graph.cannot_reach(start, end):
+        return {'start': start, 'end': end, 'distance': None, 'path': None}
+    
+    return None
+
+
+def format_answer(graph, start, end, distances, predecessors):
+    """Build the answer to a query from a search from its start vertex
+    
+    Args:
+        graph: Graph object that was searched
+        start: Start vertex
+        end: End vertex (optional, all distances if not given)
+        distances: Distances found by the search
+        predecessors: Predecessors found by the search
+        
+    Returns:
+        Answer dictionary, the same as answer_query
+    """
+    if end is None:
+        return {
+            'start': start,
+            'distances': {vertex: format_distance(d) for vertex, d in distances.items()}
+        }
+    
+    # Bounded searches leave out the vertices they did not reach
+    distance = distances.get(end, float('inf'))
+    
+    path = None
+    if distance != float('inf'):
+        path = graph.reconstruct_path(predecessors, start, end)
+    
+    return {
+        'start': start,
+        'end': end,
+        'distance': format_distance(distance),
+        'path': path
+    }
+
+
+def answer_query(graph, start, end=None, engine='auto', max_distance=None,
+                 k_nearest=None, targets=None):
+    """Answer a single shortest path query
+    
+    Args:
+        graph: Graph object
+        start: Start vertex
+        end: End vertex (optional, all distances from start if not given)
+        engine: Shortest path engine, see shortest_paths
+        max_distance: Only search this far from start (optional)
+        k_nearest: Only search until this many vertices are found (optional)
+        targets: Vertices counted by k_nearest (optional)
+        
+    Returns:
+        Dictionary with the answer, or with an 'error' key if the query is invalid
+    """
+    answer = check_query(graph, start, end)
+    if answer is not None:
+        return answer
+    
+    # NegativeCycleError is a ValueError
+    try:
+        distances, predecessors = shortest_paths(graph, start, engine, None, max_distance,
+                                                 k_nearest, targets)
+    except ValueError as e:
+        return {'start': start, 'end': end, 'error': str(e)}
+    
+    return format_answer(graph, start, end, distances, predecessors)
+
+
+def group_queries_by_source(queries):
+    """Group queries by their start vertex
+    
+    Args:
+        queries: List of (start, end) tuples, end may be None
+        
+    Returns:
+        Dictionary mapping start vertex to a list of (query_index, end) tuples
+    """
+    groups = defaultdict(list)
+    
+    for index, (start, end) in enumerate(queries):
+        groups[start].append((index, end))
+    
+    return groups
+
+
+def iter_batch_answers(graph, queries, stats=None, engine='auto'):
+    """Answer many queries, running one search per distinct start vertex
+    
+    Answers are yielded as soon as the tree of their start vertex is
+    computed, so they come grouped by start vertex rather than in input
+    order; each answer carries the index of its query.
+    
+    Args:
+        graph: Graph object
+        queries: List of (start, end) tuples, end may be None
+        stats: SearchStats object to collect counters and timings (optional)
+        engine: Shortest path engine, see shortest_paths
+        
+    Yields:
+        Answer dictionaries with a 'query' key holding the query index
+    """
+    # The graph does not change, so the engine is chosen once for all searches
+    if engine == 'auto':
+        engine = choose_engine(graph)
+    
+    groups = group_queries_by_source(queries)
+    
+    prepare_for_queries(graph)
+    
+    def search(start):
+        return shortest_paths(graph, start, engine, stats)
+    
+    # Many sources with negative edges: reweight once and run Dijkstra (Johnson)
+    if engine == 'bellman_ford' and len(groups) > 1:
+        from src.bellman_ford import NegativeCycleError
+        from src.johnson import johnson_search, reweight_graph
+        
+        try:
+            reweighted, vertex_potentials = reweight_graph(graph)
+        except NegativeCycleError:
+            # Bellman-Ford then reports the cycle only for sources that reach it
+            pass
+        else:
+            def search(start):
+                return johnson_search(reweighted, vertex_potentials, start, stats)
+    
+    for start, group in groups.items():
+        if start not in graph.vertices:
+            for index, end in group:
+                yield {'query': index, 'start': start, 'end': end,
+                       'error': f"Start vertex '{start}' not found"}
+            continue
+        
+        # No search is needed if every end of the group is unreachable
+        if all(end is not None and end in graph.vertices and graph.cannot_reach(start, end)
+               for _, end in group):
+            for index, end in group:
+                yield {'query': index, 'start': start, 'end': end, 'distance': None, 'path': None}
+            continue
+        
+        # NegativeCycleError is a ValueError
+        try:
+            distances, predecessors = search(start)
+        except ValueError as e:
+            for index, end in group:
+                yield {'query': index, 'start': start, 'end': end, 'error': str(e)}
+            continue
+        
+        for index, end in group:
+            if end is not None and end not in graph.vertices:
+                yield {'query': index, 'start': start, 'end': end,
+                       'error': f"End vertex '{end}' not found"}
+            else:
+                yield {'query': index,
+                       **format_answer(graph, start, end, distances, predecessors)}
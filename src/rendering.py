@@ -0,0 +1,165 @@
+"""
+Headless batch rendering of shortest path figures
+"""
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from src.visualization import (
+    DEFAULT_LAYOUT_CACHE_DIR, LARGE_GRAPH_THRESHOLD, build_nx_graph, compute_layout,
+    k_hop_neighborhood, use_headless_backend, visualize_path_with_info
+)
+
+
+# Steps listed in the info panel of a rendered path
+MAX_SUMMARY_STEPS = 25
+
+# (graph, positions) pairs held by each worker process
+_contexts = None
+
+
+def _init_renderer(contexts):
+    """Prepare a worker process for rendering"""
+    global _contexts
+    use_headless_backend()
+    _contexts = contexts
+
+
+def _render_job(context_index, path, results_text, save_path, subgraph, hops, dpi, fmt):
+    """Render one path figure inside a worker process"""
+    graph, pos = _contexts[context_index]
+    
+    visualize_path_with_info(graph, path, results_text,
+                             title=f"Shortest Path: {path[0]} to {path[-1]}",
+                             save_path=save_path, subgraph=subgraph, hops=hops,
+                             pos=pos, show=False, dpi=dpi, fmt=fmt)
+    
+    return save_path
+
+
+def path_summary_text(graph, path):
+    """Build the info panel text for a path
+    
+    Args:
+        graph: Graph object
+        path: List of vertices representing the path
+        
+    Returns:
+        Text with the path and its step-by-step distances
+    """
+    lines = [f"From: {path[0]}", f"To: {path[-1]}", ""]
+    
+    # Long texts dominate the rendering time, so long paths are shortened
+    if len(path) <= MAX_SUMMARY_STEPS:
+        lines.append(f"Path: {' -> '.join(map(str, path))}")
+    else:
+        lines.append(f"Path: {path[0]} -> ... -> {path[-1]} ({len(path)} vertices)")
+    lines.append("")
+    lines.append("Step-by-step:")
+    
+    total = 0
+    for step, (u, v) in enumerate(zip(path, path[1:])):
+        for neighbor, weight in graph.get_neighbors(u):
+            if neighbor == v:
+                total += weight
+                if step < MAX_SUMMARY_STEPS:
+                    lines.append(f"  {u} → {v}: {weight} (total: {total})")
+                break
+    
+    if len(path) - 1 > MAX_SUMMARY_STEPS:
+        lines.append(f"  ... {len(path) - 1 - MAX_SUMMARY_STEPS} more steps")
+    
+    lines.append("")
+    lines.append(f"Distance: {total}")
+    
+    return "\n".join(lines)
+
+
+def shared_layout(graph, paths, subgraph=None, hops=1, layout_cache_dir=DEFAULT_LAYOUT_CACHE_DIR):
+    """Compute one layout covering every figure drawn for a graph
+    
+    Small graphs (or subgraph='full') are laid out whole. Otherwise the
+    layout covers the union of all paths, plus their k-hop neighborhoods
+    unless subgraph is 'tree'.
+    
+    Args:
+        graph: Graph object
+        paths: List of paths that will be drawn
+        subgraph: Subgraph mode used for drawing
+        hops: Number of hops for the neighborhood subgraph
+        layout_cache_dir: Directory for cached layouts (None disables caching)
+        
+    Returns:
+        Dictionary mapping node to (x, y) position
+    """
+    if subgraph == 'full' or (subgraph is None and len(graph.vertices) <= LARGE_GRAPH_THRESHOLD):
+        return compute_layout(build_nx_graph(graph), layout_cache_dir)
+    
+    vertices = set()
+    for path in paths:
+        vertices.update(path)
+    
+    if subgraph != 'tree':
+        vertices = k_hop_neighborhood(graph, vertices, hops)
+    
+    return compute_layout(build_nx_graph(graph, vertices=vertices), layout_cache_dir)
+
+
+def render_path_jobs(jobs, output_dir, dpi=100, fmt='png', workers=None,
+                     subgraph=None, hops=1, layout_cache_dir=DEFAULT_LAYOUT_CACHE_DIR):
+    """Render many path figures to files in parallel, without showing them
+    
+    The layout is computed once per distinct graph and reused by all of
+    its jobs; figures are drawn by a process pool on the Agg backend.
+    
+    Args:
+        jobs: List of (graph, path) or (graph, path, name) tuples; name is the
+              file name without extension (default: path_<index>)
+        output_dir: Directory for the rendered files
+        dpi: Resolution of the rendered files
+        fmt: File format (png, svg, pdf, ...)
+        workers: Number of worker processes (default: number of CPUs)
+        subgraph: Subgraph mode, see visualize_path_with_info
+        hops: Number of hops for the neighborhood subgraph
+        layout_cache_dir: Directory for cached layouts (None disables caching)
+        
+    Returns:
+        List of rendered file paths; paths with fewer than 2 vertices are skipped
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Group paths by graph so that each graph gets one shared layout
+    graphs = {}
+    paths_by_graph = defaultdict(list)
+    for job in jobs:
+        graph, path = job[0], job[1]
+        if path and len(path) >= 2:
+            graphs[id(graph)] = graph
+            paths_by_graph[id(graph)].append(path)
+    
+    contexts = []
+    context_index = {}
+    for key, graph in graphs.items():
+        pos = shared_layout(graph, paths_by_graph[key], subgraph, hops, layout_cache_dir)
+        context_index[key] = len(contexts)
+        contexts.append((graph, pos))
+    
+    tasks = []
+    for i, job in enumerate(jobs):
+        graph, path = job[0], job[1]
+        if not path or len(path) < 2:
+            continue
+        
+        name = job[2] if len(job) > 2 else f"path_{i:04d}"
+        save_path = os.path.join(output_dir, f"{name}.{fmt}")
+        tasks.append((context_index[id(graph)], path, path_summary_text(graph, path),
+                      save_path, subgraph, hops, dpi, fmt))
+    
+    if not tasks:
+        return []
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_renderer,
+                             initargs=(contexts,)) as executor:
+        futures = [executor.submit(_render_job, *task) for task in tasks]
+        return [future.result() for future in futures]
@@ -0,0 +1,209 @@
+"""
+SciPy sparse matrix conversions and scipy.sparse.csgraph engine
+
+A graph converts to a scipy.sparse.csr_matrix built on its cached CSR
+arrays (Graph.csr), so the weights are shared rather than copied. The
+search functions run scipy.sparse.csgraph in C and translate the arrays
+it returns to the vertex-name dictionaries used by the rest of the
+project. Parallel edges stay separate entries of the matrix; the
+Dijkstra, Johnson and Bellman-Ford methods of csgraph relax each of them,
+so the lightest one wins just as in dijkstra().
+"""
+
+import numpy as np
+from scipy.sparse import csgraph, csr_matrix
+
+from src.bellman_ford import NegativeCycleError
+from src.csr import CSRGraph
+from src.graph import Graph
+
+
+def to_csr_matrix(graph):
+    """Convert a graph to a SciPy sparse matrix
+    
+    Undirected edges are stored in both directions, so the matrix of an
+    undirected graph is symmetric.
+    
+    Args:
+        graph: Graph object
+        
+    Returns:
+        Tuple of (csr_matrix, list of vertex names in row order)
+    """
+    csr = graph.csr()
+    n = csr.num_vertices
+    
+    # The weights are shared; SciPy copies the index arrays if it needs
+    # a smaller integer type for them
+    matrix = csr_matrix((csr.weights, csr.indices, csr.indptr), shape=(n, n), copy=False)
+    return matrix, csr.vertices
+
+
+def from_csr_matrix(matrix, vertices=None, directed=True):
+    """Convert a SciPy sparse matrix to a graph
+    
+    Every stored entry (explicit zeros included) is an edge. For directed
+    graphs the matrix arrays are also kept as the graph's CSR arrays, so
+    converting back with to_csr_matrix needs no copy.
+    
+    Args:
+        matrix: Square SciPy sparse matrix (or anything csr_matrix accepts)
+        vertices: Vertex names in row order (default: 0 .. n-1)
+        directed (bool): False reads only the upper triangle of a
+                         symmetric matrix as undirected edges
+                         
+    Returns:
+        Graph object
+    """
+    matrix = csr_matrix(matrix)
+    n = matrix.shape[0]
+    if vertices is None:
+        vertices = list(range(n))
+    
+    graph = Graph(directed=directed)
+    graph.vertices.update(vertices)
+    
+    indptr, indices, weights = matrix.indptr, matrix.indices, matrix.data.tolist()
+    for i in range(n):
+        u = vertices[i]
+        for position in range(indptr[i], indptr[i + 1]):
+            j = indices[position]
+            if directed or i <= j:
+                graph.add_edge(u, vertices[j], weights[position])
+    
+    if directed:
+        graph._csr = CSRGraph(list(vertices), matrix.indptr, matrix.indices,
+                              matrix.data.astype(np.float64, copy=False), directed=True)
+    
+    return graph
+
+
+def _has_negative_edges(graph):
+    """Check the cached CSR weights for negative edges"""
+    weights = graph.csr().weights
+    return len(weights) > 0 and weights.min() < 0
+
+
+def _search(graph, sources, min_only=False, limit=np.inf):
+    """Run csgraph.shortest_path from the given source rows
+    
+    Returns:
+        The arrays returned by csgraph, rows in the order of graph.csr()
+        
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle
+    """
+    matrix, _ = to_csr_matrix(graph)
+    index = graph.csr().index
+    rows = [index[source] for source in sources]
+    
+    try:
+        if min_only:
+            return csgraph.dijkstra(matrix, directed=True, indices=rows, min_only=True,
+                                    return_predecessors=True, limit=limit)
+        if limit != np.inf:
+            return csgraph.dijkstra(matrix, directed=True, indices=rows,
+                                    return_predecessors=True, limit=limit)
+        # Johnson's algorithm reweights negative edges; Floyd-Warshall is
+        # never used, its dense matrix would add up parallel edges
+        method = 'J' if _has_negative_edges(graph) else 'D'
+        return csgraph.shortest_path(matrix, method=method, directed=True,
+                                         indices=rows, return_predecessors=True)
+    except csgraph.NegativeCycleError as e:
+        raise NegativeCycleError(f"Graph contains a negative cycle ({e})") from None
+
+
+def scipy_dijkstra(graph, start, stats=None, max_distance=None):
+    """
+    Shortest paths from a single source with scipy.sparse.csgraph.
+    
+    Graphs with negative edges are searched with Johnson's algorithm.
+    
+    Args:
+        graph: Graph object
+        start: Starting vertex
+        stats: SearchStats object; only searches are counted, csgraph does
+               not report its work (optional)
+        max_distance: Return only vertices at most this far from start (optional)
+        
+    Returns:
+        Tuple of (distances, predecessors) dictionaries, the same as dijkstra
+        
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle
+        ValueError: If max_distance is given for a graph with negative edges
+    """
+    if max_distance is not None and _has_negative_edges(graph):
+        raise ValueError("Bounded searches need non-negative edge weights")
+    
+    limit = np.inf if max_distance is None else max_distance
+    dist, pred = _search(graph, [start], limit=limit)
+    distances, predecessors = graph.csr().to_result(dist[0], pred[0], start)
+    
+    if stats is not None:
+        stats.record()
+    
+    # Bounded searches return only the vertices found, like dijkstra
+    if max_distance is not None:
+        reached = [vertex for vertex, distance in distances.items() if distance != float('inf')]
+        return ({vertex: distances[vertex] for vertex in reached},
+                {vertex: predecessors[vertex] for vertex in reached})
+    
+    return distances, predecessors
+
+
+def scipy_multi_source(graph, sources, stats=None):
+    """
+    Multi-source Dijkstra with scipy.sparse.csgraph, see multi_source_dijkstra.
+    
+    Args:
+        graph: Graph object with non-negative weights
+        sources: Start vertices
+        stats: SearchStats object, only searches are counted (optional)
+        
+    Returns:
+        Tuple of (distances, predecessors, owners) dictionaries
+    """
+    dist, pred, owner_rows = _search(graph, sources, min_only=True)
+    csr = graph.csr()
+    vertices = csr.vertices
+    distances, predecessors = csr.to_result(dist, pred)
+    owners = {vertex: vertices[row] if row >= 0 else None
+              for vertex, row in zip(vertices, owner_rows.tolist())}
+    
+    if stats is not None:
+        stats.record()
+    
+    return distances, predecessors, owners
+
+
+def scipy_all_pairs(graph, sources=None, block_size=256):
+    """
+    Shortest paths from many sources with scipy.sparse.csgraph.
+    
+    Sources are searched in blocks, so the result matrices stay small.
+    
+    Args:
+        graph: Graph object, may contain negative edges (Johnson's algorithm)
+        sources: Start vertices (default: all vertices)
+        block_size: Number of sources per csgraph call
+        
+    Returns:
+        Dictionary mapping each source to its (distances, predecessors) tuple,
+        the same as johnson
+        
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle
+    """
+    if sources is None:
+        sources = sorted(graph.vertices, key=str)
+    
+    csr = graph.csr()
+    results = {}
+    for first in range(0, len(sources), block_size):
+        block = sources[first:first + block_size]
+        dist, pred = _search(graph, block)
+        for row, source in enumerate(block):
+            results[source] = csr.to_result(dist[row], pred[row], source)
+    
+    return results
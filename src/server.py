@@ -0,0 +1,247 @@
+"""
+Long-running query server for Dijkstra's algorithm
+
+The graph is loaded once and shortest path queries are answered over a
+JSON-lines protocol, either on stdin/stdout or on a local TCP socket.
+
+Request (one JSON object per line):
+    {"id": 1, "start": "A", "end": "F"}
+    {"id": 2, "start": "A"}
+    {"id": 3, "start": "A", "max_distance": 5}
+    {"id": 4, "start": "A", "k_nearest": 2, "targets": ["D", "E", "F"]}
+    
+Response (one JSON object per line, "id" is echoed back):
+    {"id": 1, "start": "A", "end": "F", "distance": 13.0, "path": ["A", "C", "B", "D", "E", "F"]}
+    {"id": 2, "start": "A", "distances": {"A": 0, "B": 3.0, ...}}
+    {"id": 3, "start": "A", "distances": {"A": 0, "C": 2.0, "B": 3.0}}
+    {"id": 5, "error": "..."}
+    
+Searches run on a process pool, so slow queries do not block other clients.
+With threads=True they run on a thread pool instead, all reading one
+immutable GraphSnapshot; the graph is then not copied to every worker and
+new versions can be published while queries are answered (see
+src/snapshot.py).
+"""
+
+import asyncio
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.engines import choose_engine
+from src.queries import answer_query, prepare_for_queries
+from src.snapshot import VersionedGraph
+
+
+# Graph and engine held by each worker process, set once by the pool initializer
+_worker_graph = None
+_worker_engine = None
+
+
+def _init_worker(graph, engine):
+    """Store the graph and its engine in a worker process"""
+    global _worker_graph, _worker_engine
+    _worker_graph = graph
+    _worker_engine = engine
+    prepare_for_queries(graph)
+
+
+def _resolve_vertex(vertices, name):
+    """Get the vertex a request names
+    
+    JSON graphs may have integer vertex names, while edge lists always have
+    strings, so a name is taken as given if the graph has it and as a
+    string otherwise.
+    """
+    try:
+        if not isinstance(name, bool) and name in vertices:
+            return name
+    except TypeError:
+        # Lists and objects are not hashable
+        pass
+    return str(name)
+
+
+def _run_query(start, end, bounds):
+    """Answer a query inside a worker process"""
+    return answer_query(_worker_graph, start, end, _worker_engine, **bounds)
+
+
+class QueryServer:
+    """Answers shortest path queries for one loaded graph"""
+    
+    def __init__(self, graph, workers=None, engine='auto', threads=False):
+        """Initialize server
+        
+        Args:
+            graph: Graph object
+            workers: Number of worker processes or threads (default: number of CPUs)
+            engine: Shortest path engine, see shortest_paths
+            threads (bool): Answer queries on a thread pool from snapshots of
+                            self.versions instead of on worker processes
+        """
+        self.graph = graph
+        self.versions = None
+        
+        if engine == 'auto':
+            engine = choose_engine(graph)
+        self.engine = engine
+        
+        if threads:
+            self.versions = VersionedGraph(graph)
+            prepare_for_queries(self.versions.snapshot)
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+            return
+        
+        # Workers are started lazily; forked workers would inherit open client
+        # sockets and keep connections alive after the server closes them
+        self.executor = ProcessPoolExecutor(max_workers=workers,
+                                            mp_context=multiprocessing.get_context('spawn'),
+                                            initializer=_init_worker,
+                                            initargs=(graph, engine))
+    
+    async def handle_request(self, line):
+        """Answer one request line
+        
+        Args:
+            line: JSON encoded request
+            
+        Returns:
+            Response dictionary; the request id is echoed back in every
+            response, errors included
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {'error': f"Invalid JSON: {e}"}
+        
+        response = await self._answer(request)
+        
+        if isinstance(request, dict) and 'id' in request:
+            response = {'id': request['id'], **response}
+        
+        return response
+    
+    async def _answer(self, request):
+        """Validate a decoded request and answer it on the executor"""
+        if not isinstance(request, dict) or 'start' not in request:
+            return {'error': "Request must be an object with a 'start' vertex"}
+        
+        # Each query searches the snapshot published when it arrived
+        graph = self.graph if self.versions is None else self.versions.snapshot
+        
+        start = _resolve_vertex(graph.vertices, request['start'])
+        end = request.get('end')
+        if end is not None:
+            end = _resolve_vertex(graph.vertices, end)
+        
+        # Optional limits of the search
+        bounds = {key: request[key] for key in ('max_distance', 'k_nearest') if key in request}
+        for key, value in bounds.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return {'error': f"'{key}' must be a number"}
+        if 'targets' in request:
+            if not isinstance(request['targets'], list):
+                return {'error': "'targets' must be a list of vertices"}
+            bounds['targets'] = [_resolve_vertex(graph.vertices, vertex)
+                                 for vertex in request['targets']]
+        
+        loop = asyncio.get_running_loop()
+        if self.versions is None:
+            return await loop.run_in_executor(self.executor, _run_query, start, end, bounds)
+        
+        return await loop.run_in_executor(
+            self.executor, lambda: answer_query(graph, start, end, self.engine, **bounds))
+    
+    async def handle_client(self, reader, writer):
+        """Serve one TCP client until it disconnects"""
+        write_lock = asyncio.Lock()
+        pending = set()
+        
+        async def respond(line):
+            response = await self.handle_request(line)
+            async with write_lock:
+                writer.write((json.dumps(response) + '\n').encode())
+                await writer.drain()
+        
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                
+                # Answer requests concurrently; responses carry the request id
+                task = asyncio.create_task(respond(line.decode()))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            
+            if pending:
+                await asyncio.gather(*pending)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def serve_tcp(self, host, port):
+        """Serve clients on a local TCP socket until cancelled"""
+        server = await asyncio.start_server(self.handle_client, host, port)
+        address = server.sockets[0].getsockname()
+        print(f"Serving on {address[0]}:{address[1]}", file=sys.stderr)
+        
+        async with server:
+            await server.serve_forever()
+    
+    async def serve_stdio(self):
+        """Serve requests from stdin, writing responses to stdout"""
+        loop = asyncio.get_running_loop()
+        pending = set()
+        
+        async def respond(line):
+            response = await self.handle_request(line)
+            sys.stdout.write(json.dumps(response) + '\n')
+            sys.stdout.flush()
+        
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            if not line.strip():
+                continue
+            
+            task = asyncio.create_task(respond(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        
+        if pending:
+            await asyncio.gather(*pending)
+    
+    def close(self):
+        """Shut down the worker pool"""
+        self.executor.shutdown(cancel_futures=True)
+
+
+def run_server(graph, host='127.0.0.1', port=None, workers=None, engine='auto', threads=False):
+    """Run the query server
+    
+    Args:
+        graph: Graph object
+        host: Host to bind when serving over TCP
+        port: TCP port, or None to serve on stdin/stdout
+        workers: Number of worker processes or threads (default: number of CPUs)
+        engine: Shortest path engine, see shortest_paths
+        threads (bool): Answer queries on threads sharing a graph snapshot
+    """
+    server = QueryServer(graph, workers, engine, threads)
+    
+    try:
+        if port is None:
+            asyncio.run(server.serve_stdio())
+        else:
+            asyncio.run(server.serve_tcp(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
@@ -0,0 +1,199 @@
+"""
+Sharded shortest path queries over partitioned graphs
+
+Every shard written by src/partition.py is loaded by its own worker
+process, so no process holds the whole graph. The coordinator keeps only
+the region of each vertex and the overlay graph of boundary vertices. A
+query searches the start region and the end region in their workers,
+joins the two searches through the overlay and finally asks the workers
+for the pieces of the path inside each region it crosses.
+"""
+
+import heapq
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.dijkstra import dijkstra, dijkstra_path
+from src.file_handler import load_graph_from_file
+from src.graph import Graph
+from src.partition import shard_filename
+
+
+# Shard graph held by each worker process, and its reversed graph
+_shard = None
+_reversed_shard = None
+
+
+def _load_shard(filename):
+    """Load one shard in a worker process"""
+    global _shard, _reversed_shard
+    _shard = load_graph_from_file(filename)
+    _reversed_shard = _shard.reversed()
+
+
+def _shard_distances(source, targets, reverse):
+    """Distances from source to targets inside the shard (to source if reverse)"""
+    graph = _reversed_shard if reverse else _shard
+    others = [target for target in targets if target != source]
+    
+    # Vertices with only edges to other regions are missing from the shard
+    if source not in graph.vertices or not others:
+        return {source: 0} if source in targets else {}
+    
+    distances, _ = dijkstra(graph, source, k_nearest=len(others), targets=others)
+    return {target: distances[target] for target in targets if target in distances}
+
+
+def _shard_path(start, end):
+    """Shortest path between two vertices inside the shard"""
+    if start == end:
+        return [start]
+    path, _ = dijkstra_path(_shard, start, end)
+    return path
+
+
+class ShardCoordinator:
+    """Answers shortest path queries from a directory of shards"""
+    
+    def __init__(self, directory):
+        """Load the overlay and start one worker process per shard
+        
+        Args:
+            directory: Directory written by build_shards
+        """
+        with open(os.path.join(directory, 'meta.json'), 'r') as f:
+            meta = json.load(f)
+        
+        self.parts = meta['parts']
+        self.boundary = meta['boundary']
+        
+        # Overlay edges remember the region whose shard can expand them,
+        # or -1 for edges between regions
+        self.overlay = Graph(directed=True)
+        self.edge_parts = {}
+        for u, v, weight, part in meta['overlay']:
+            self.overlay.add_edge(u, v, weight)
+            known = self.edge_parts.get((u, v))
+            if known is None or weight < known[0]:
+                self.edge_parts[(u, v)] = (weight, part)
+        
+        self.executors = [
+            ProcessPoolExecutor(max_workers=1, initializer=_load_shard,
+                                initargs=(shard_filename(directory, part),))
+            for part in range(meta['num_parts'])
+        ]
+    
+    def close(self):
+        """Stop the worker processes"""
+        for executor in self.executors:
+            executor.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def shortest_path(self, start, end):
+        """Find the shortest path between two vertices
+        
+        Args:
+            start: Starting vertex
+            end: Ending vertex
+            
+        Returns:
+            Tuple of (path, distance), or (None, float('inf')) if no path exists
+        """
+        if start not in self.parts or end not in self.parts:
+            return None, float('inf')
+        if start == end:
+            return [start], 0
+        
+        start_part, end_part = self.parts[start], self.parts[end]
+        
+        # Searches inside the start and end regions run in parallel
+        start_targets = list(self.boundary[start_part])
+        if start_part == end_part:
+            start_targets.append(end)
+        from_start = self.executors[start_part].submit(_shard_distances, start,
+                                                       start_targets, False)
+        to_end = self.executors[end_part].submit(_shard_distances, end,
+                                                 self.boundary[end_part], True)
+        from_start, to_end = from_start.result(), to_end.result()
+        
+        best, last, predecessors = self._search_overlay(start, end, from_start, to_end)
+        if best == float('inf'):
+            return None, float('inf')
+        
+        # Pieces of the path: (region or -1, from, to)
+        pieces = []
+        if last is None:
+            pieces.append((start_part, start, end))
+        else:
+            pieces.append((end_part, last, end))
+            vertex = last
+            while predecessors[vertex] is not None:
+                previous, part = predecessors[vertex]
+                pieces.append((part, previous, vertex))
+                vertex = previous
+            pieces.append((start_part, start, vertex))
+            pieces.reverse()
+        
+        futures = [self.executors[part].submit(_shard_path, u, v) if part >= 0 else None
+                   for part, u, v in pieces]
+        
+        path = [start]
+        for (part, u, v), future in zip(pieces, futures):
+            segment = future.result() if future else [u, v]
+            path.extend(segment[1:])
+        
+        return path, best
+    
+    def _search_overlay(self, start, end, from_start, to_end):
+        """Dijkstra's algorithm on the overlay, seeded by the start region search
+        
+        Returns:
+            Tuple of (distance, last overlay vertex or None for a path inside
+            one region, predecessors as (vertex, region) tuples)
+        """
+        best = from_start.get(end, float('inf'))
+        last = None
+        
+        distances = {}
+        predecessors = {}
+        priority_queue = []
+        for vertex, distance in from_start.items():
+            if vertex != end or vertex in to_end:
+                distances[vertex] = distance
+                predecessors[vertex] = None
+                priority_queue.append((distance, vertex))
+        heapq.heapify(priority_queue)
+        
+        visited = set()
+        
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            
+            # Every remaining path is at least this long
+            if current_distance >= best:
+                break
+            if current_vertex in visited:
+                continue
+            visited.add(current_vertex)
+            
+            if current_vertex in to_end and current_distance + to_end[current_vertex] < best:
+                best = current_distance + to_end[current_vertex]
+                last = current_vertex
+            
+            for neighbor, _ in self.overlay.get_neighbors(current_vertex):
+                if neighbor in visited:
+                    continue
+                weight, part = self.edge_parts[(current_vertex, neighbor)]
+                new_distance = current_distance + weight
+                if new_distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = (current_vertex, part)
+                    heapq.heappush(priority_queue, (new_distance, neighbor))
+        
+        return best, last, predecessors
@@ -0,0 +1,205 @@
+"""
+Immutable graph snapshots for concurrent readers
+
+A Graph is built for a single thread: its adjacency lists are mutable and
+its caches (strong components, CSR arrays, path compression of the
+component index) are written while answering queries. A GraphSnapshot
+freezes one version of a graph: adjacency lists become tuples in a
+read-only mapping, vertices a frozenset and components a plain mapping of
+representatives, so any number of threads can run dijkstra() and the
+other searches on it at once. The remaining caches are filled at most
+once, under a lock.
+
+VersionedGraph is the update path. A writer adds edges to its private
+working Graph and calls publish() to make them visible; readers switch to
+the new snapshot simply by reading the snapshot attribute again. A
+publish is not free: the new snapshot shares the adjacency tuples of every
+vertex the writer did not touch with the previous one, but it copies the
+mapping of vertices to tuples, which is O(V) (a copy of references in C,
+about 60 ms per million vertices). The vertex set and the component roots
+are shared too, unless the new edges add vertices or join components;
+then they are rebuilt in O(V) Python steps, about 1 s per million
+vertices.
+"""
+
+import threading
+from types import MappingProxyType
+
+from src.graph import Graph
+
+
+class GraphSnapshot:
+    """Read-only version of a graph, safe to search from many threads
+    
+    Offers the read methods of Graph (get_neighbors, get_edges,
+    cannot_reach, reconstruct_path, ...), so it can be passed wherever the
+    searches expect a graph. Edge attributes are not part of snapshots, and
+    searches that change the graph they run on (masked() in the k shortest
+    paths search, Johnson's reweighting) need a Graph.
+    """
+    
+    # Caches that may be filled after creation, under the lock
+    _CACHES = ('_strong_components', '_csr')
+    
+    def __init__(self, graph, previous=None, changed=None, version=0, joined=True):
+        """Freeze the current state of a graph
+        
+        Args:
+            graph: Graph object to copy
+            previous: Earlier snapshot of the same graph (optional)
+            changed: Vertices whose edges changed since previous; the
+                     adjacency of all other vertices is shared with it
+            version: Version number of the snapshot
+            joined (bool): Whether the changes since previous added vertices
+                           or joined components; if not, the vertex set and
+                           component roots of previous are shared
+        """
+        if previous is not None and changed is not None:
+            adjacency = dict(previous._adjacency)
+            for vertex in changed:
+                adjacency[vertex] = tuple(graph.adj_list.get(vertex, ()))
+        else:
+            adjacency = {vertex: tuple(neighbors) for vertex, neighbors in graph.adj_list.items()}
+        
+        if previous is not None and not joined:
+            vertices = previous.vertices
+            roots = previous._roots
+        else:
+            components = graph.components
+            vertices = frozenset(graph.vertices)
+            roots = MappingProxyType({vertex: components.find(vertex) for vertex in vertices})
+        
+        set_attribute = object.__setattr__
+        set_attribute(self, '_adjacency', adjacency)
+        set_attribute(self, 'adj_list', MappingProxyType(adjacency))
+        set_attribute(self, 'vertices', vertices)
+        set_attribute(self, 'directed', graph.directed)
+        set_attribute(self, 'version', version)
+        set_attribute(self, '_roots', roots)
+        set_attribute(self, 'edge_attributes', None)
+        set_attribute(self, 'edge_ids', None)
+        set_attribute(self, '_strong_components', None)
+        set_attribute(self, '_csr', None)
+        set_attribute(self, '_lock', threading.Lock())
+    
+    def __setattr__(self, name, value):
+        if name not in self._CACHES:
+            raise AttributeError("GraphSnapshot is read-only")
+        object.__setattr__(self, name, value)
+    
+    def get_neighbors(self, vertex):
+        """Get all neighbors of a vertex
+        
+        Returns:
+            Tuple of (neighbor, weight) tuples, empty for unknown vertices
+        """
+        return self._adjacency.get(vertex, ())
+    
+    def same_component(self, u, v):
+        """Check if two vertices are in the same (weakly) connected component"""
+        return self._roots.get(u, u) == self._roots.get(v, v)
+    
+    def strong_components(self):
+        """Get the strongly connected components, computed once under the lock"""
+        if self._strong_components is None:
+            with self._lock:
+                if self._strong_components is None:
+                    Graph.strong_components(self)
+        return self._strong_components
+    
+    def csr(self):
+        """Get the CSR arrays, built once under the lock"""
+        if self._csr is None:
+            with self._lock:
+                if self._csr is None:
+                    Graph.csr(self)
+        return self._csr
+    
+    def reversed(self):
+        """Get a snapshot with every edge reversed"""
+        if not self.directed:
+            return self
+        
+        reverse = Graph(directed=True)
+        reverse.vertices = set(self.vertices)
+        for u, neighbors in self._adjacency.items():
+            for v, weight in neighbors:
+                reverse.add_edge(v, u, weight)
+        return GraphSnapshot(reverse, version=self.version)
+    
+    # Read-only methods shared with Graph
+    cannot_reach = Graph.cannot_reach
+    get_edges = Graph.get_edges
+    has_negative_edges = Graph.has_negative_edges
+    get_edge_weight = Graph.get_edge_weight
+    weighted_by = Graph.weighted_by
+    reconstruct_path = Graph.reconstruct_path
+    build_path_tree = Graph.build_path_tree
+    iter_tree_paths = Graph.iter_tree_paths
+    get_graph_stats = Graph.get_graph_stats
+
+
+class VersionedGraph:
+    """A graph that one writer changes while readers search snapshots
+    
+    Readers take the snapshot attribute and search it; it never changes
+    under them. The writer calls add_edge any number of times and then
+    publish() to make the changes visible to readers that take the
+    snapshot afterwards.
+    """
+    
+    def __init__(self, graph=None, directed=False):
+        """Initialize with a graph to copy or an empty one
+        
+        Args:
+            graph: Initial Graph object, owned by the writer from now on (optional)
+            directed (bool): Whether an empty initial graph is directed
+        """
+        self._graph = graph if graph is not None else Graph(directed=directed)
+        self._changed = set()
+        self._joined = False
+        self._lock = threading.Lock()
+        self.snapshot = GraphSnapshot(self._graph)
+    
+    @property
+    def version(self):
+        """Version number of the published snapshot"""
+        return self.snapshot.version
+    
+    def add_edge(self, u, v, weight):
+        """Add an edge to the next version
+        
+        Args:
+            u: Start vertex
+            v: End vertex
+            weight: Edge weight
+        """
+        with self._lock:
+            graph = self._graph
+            if (u not in graph.vertices or v not in graph.vertices
+                    or not graph.same_component(u, v)):
+                self._joined = True
+            
+            graph.add_edge(u, v, weight)
+            self._changed.add(u)
+            if not self._graph.directed:
+                self._changed.add(v)
+    
+    def publish(self):
+        """Publish the edges added since the last version
+        
+        Takes O(V) time even for a single new edge, see the module
+        docstring; batch edges into fewer publishes where possible.
+        
+        Returns:
+            The new GraphSnapshot
+        """
+        with self._lock:
+            snapshot = GraphSnapshot(self._graph, self.snapshot, self._changed,
+                                     self.snapshot.version + 1, self._joined)
+            self._changed = set()
+            self._joined = False
+            
+            # Readers see either the old or the new snapshot, never a mix
+            self.snapshot = snapshot
+            return snapshot
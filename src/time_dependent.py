@@ -0,0 +1,286 @@
+"""
+Time-dependent edge weights and time-dependent Dijkstra's algorithm
+
+The travel time of an edge is a piecewise-linear function of the
+departure time, given by breakpoints (time, travel time); before the first
+and after the last breakpoint it stays constant. All functions of a graph
+are stored in two flat arrays shared by every edge, and an edge keeps only
+the number of its function. Identical functions (for example all edges
+with a constant weight of 1) are stored once. Evaluating a weight is a
+binary search into the shared arrays followed by linear interpolation.
+
+Functions must be FIFO: leaving later never means arriving earlier, i.e.
+no segment falls faster than time passes. Then the earliest arrival at a
+vertex is always the best one to continue from and Dijkstra's algorithm
+stays exact with arrival times in place of distances.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+
+from src.graph import Graph
+
+
+class TravelTimeProfiles:
+    """Piecewise-linear travel time functions in shared breakpoint arrays"""
+    
+    def __init__(self):
+        """Initialize empty storage"""
+        # Function i has its breakpoints at positions offsets[i]..offsets[i + 1] - 1
+        self.offsets = array('q', [0])
+        self.times = array('d')
+        self.values = array('d')
+        self._ids = {}
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    def add(self, times, travel_times):
+        """Store a travel time function, reusing an identical stored one
+        
+        Args:
+            times: Increasing departure times of the breakpoints
+            travel_times: Non-negative travel time at each breakpoint
+            
+        Returns:
+            Number of the function
+            
+        Raises:
+            ValueError: If the breakpoints do not describe a valid FIFO function
+        """
+        key = (tuple(map(float, times)), tuple(map(float, travel_times)))
+        if key in self._ids:
+            return self._ids[key]
+        
+        times, travel_times = key
+        if not times or len(times) != len(travel_times):
+            raise ValueError("A travel time function needs as many times as travel times")
+        if min(travel_times) < 0:
+            raise ValueError("Travel times must be non-negative")
+        
+        for i in range(1, len(times)):
+            if times[i] <= times[i - 1]:
+                raise ValueError("Breakpoint times must be increasing")
+            # Arrival time t + f(t) must not decrease
+            if times[i] + travel_times[i] < times[i - 1] + travel_times[i - 1]:
+                raise ValueError("Travel time falls faster than time passes (not FIFO)")
+        
+        self.times.extend(times)
+        self.values.extend(travel_times)
+        self.offsets.append(len(self.times))
+        
+        profile = len(self.offsets) - 2
+        self._ids[key] = profile
+        return profile
+    
+    def evaluate(self, profile, time):
+        """Get the travel time of a function for a departure time
+        
+        Args:
+            profile: Number of the function
+            time: Departure time
+            
+        Returns:
+            Travel time
+        """
+        lo, hi = self.offsets[profile], self.offsets[profile + 1]
+        i = bisect_right(self.times, time, lo, hi)
+        
+        if i == lo:
+            return self.values[lo]
+        if i == hi:
+            return self.values[hi - 1]
+        
+        t0, t1 = self.times[i - 1], self.times[i]
+        v0 = self.values[i - 1]
+        return v0 + (self.values[i] - v0) * (time - t0) / (t1 - t0)
+    
+    def min_value(self, profile):
+        """Get the smallest travel time of a function"""
+        return min(self.values[self.offsets[profile]:self.offsets[profile + 1]])
+
+
+class TimeDependentGraph(Graph):
+    """Graph whose edge weights depend on the departure time
+    
+    The static adjacency lists inherited from Graph hold the smallest
+    travel time of every edge, so all static algorithms still work on the
+    graph (as a lower bound); time-dependent searches use the functions.
+    """
+    
+    def __init__(self, directed=False, edge_attributes=False):
+        """Initialize graph
+        
+        Args:
+            directed (bool): True for directed graph, False for undirected
+            edge_attributes (bool): Keep edge ids and named attribute columns
+        """
+        super().__init__(directed, edge_attributes)
+        self.profiles = TravelTimeProfiles()
+        self.profile_adj = defaultdict(list)
+    
+    def add_edge(self, u, v, weight, attributes=None):
+        """Add an edge with a constant travel time"""
+        self.add_profile_edge(u, v, [0.0], [weight], attributes)
+    
+    def add_profile_edge(self, u, v, times, travel_times, attributes=None):
+        """Add an edge with a piecewise-linear travel time function
+        
+        Args:
+            u: Start vertex
+            v: End vertex
+            times: Increasing departure times of the breakpoints
+            travel_times: Travel time at each breakpoint
+            attributes: Dictionary of named edge attributes (optional)
+        """
+        profile = self.profiles.add(times, travel_times)
+        super().add_edge(u, v, self.profiles.min_value(profile), attributes)
+        
+        self.profile_adj[u].append((v, profile))
+        if not self.directed:
+            self.profile_adj[v].append((u, profile))
+    
+    def travel_time(self, u, v, time):
+        """Get the smallest travel time of the edges from u to v
+        
+        Args:
+            u: Start vertex
+            v: End vertex
+            time: Departure time from u
+            
+        Returns:
+            Travel time, or None if there is no such edge
+        """
+        travel_times = [self.profiles.evaluate(profile, time)
+                        for neighbor, profile in self.profile_adj.get(u, ()) if neighbor == v]
+        return min(travel_times) if travel_times else None
+
+
+def time_dependent_dijkstra(graph, start, departure=0.0, stats=None, target=None):
+    """
+    Dijkstra's algorithm for earliest arrival times.
+    
+    Time Complexity: O((V + E) log V + E log B) for B breakpoints per function
+    Space Complexity: O(V)
+    
+    Args:
+        graph: TimeDependentGraph object
+        start: Starting vertex
+        departure: Departure time from start
+        stats: SearchStats object to collect counters and timings (optional)
+        target: Stop as soon as this vertex is settled (optional)
+        
+    Returns:
+        arrivals: Dictionary mapping each settled vertex to its earliest arrival time
+        predecessors: Dictionary mapping each settled vertex to its predecessor
+    """
+    if stats is not None:
+        return _time_dependent_instrumented(graph, start, departure, stats, target)
+    
+    evaluate = graph.profiles.evaluate
+    profile_adj = graph.profile_adj
+    
+    arrivals = {start: departure}
+    predecessors = {start: None}
+    settled = {}
+    
+    priority_queue = [(departure, start)]
+    
+    while priority_queue:
+        current_time, current_vertex = heapq.heappop(priority_queue)
+        
+        if current_vertex in settled:
+            continue
+        
+        settled[current_vertex] = current_time
+        
+        if current_vertex == target:
+            break
+        
+        for neighbor, profile in profile_adj.get(current_vertex, ()):
+            if neighbor in settled:
+                continue
+            
+            new_time = current_time + evaluate(profile, current_time)
+            
+            if new_time < arrivals.get(neighbor, float('inf')):
+                arrivals[neighbor] = new_time
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (new_time, neighbor))
+    
+    return settled, {vertex: predecessors[vertex] for vertex in settled}
+
+
+def _time_dependent_instrumented(graph, start, departure, stats, target):
+    """time_dependent_dijkstra, counting its work into a SearchStats object"""
+    with stats.phase('initialize'):
+        evaluate = graph.profiles.evaluate
+        profile_adj = graph.profile_adj
+        
+        arrivals = {start: departure}
+        predecessors = {start: None}
+        settled = {}
+        
+        scanned = relaxed = stale = 0
+        pushes = peak = 1
+        
+        priority_queue = [(departure, start)]
+    
+    with stats.phase('search'):
+        while priority_queue:
+            current_time, current_vertex = heapq.heappop(priority_queue)
+            
+            if current_vertex in settled:
+                stale += 1
+                continue
+            
+            settled[current_vertex] = current_time
+            
+            if current_vertex == target:
+                break
+            
+            for neighbor, profile in profile_adj.get(current_vertex, ()):
+                scanned += 1
+                if neighbor in settled:
+                    continue
+                
+                new_time = current_time + evaluate(profile, current_time)
+                
+                if new_time < arrivals.get(neighbor, float('inf')):
+                    relaxed += 1
+                    arrivals[neighbor] = new_time
+                    predecessors[neighbor] = current_vertex
+                    heapq.heappush(priority_queue, (new_time, neighbor))
+                    pushes += 1
+                    if len(priority_queue) > peak:
+                        peak = len(priority_queue)
+    
+    stats.record(len(settled), scanned, relaxed, pushes, stale, peak)
+    
+    return settled, {vertex: predecessors[vertex] for vertex in settled}
+
+def time_dependent_path(graph, start, end, departure=0.0, stats=None):
+    """
+    Find the fastest path between two vertices for a departure time.
+    
+    Args:
+        graph: TimeDependentGraph object
+        start: Starting vertex
+        end: Ending vertex
+        departure: Departure time from start
+        stats: SearchStats object to collect counters and timings (optional)
+        
+    Returns:
+        Tuple of (path, arrival time), or (None, float('inf')) if no path exists
+    """
+    if graph.cannot_reach(start, end):
+        return None, float('inf')
+    
+    arrivals, predecessors = time_dependent_dijkstra(graph, start, departure, stats, target=end)
+    
+    if end not in arrivals:
+        return None, float('inf')
+    
+    return graph.reconstruct_path(predecessors, start, end), arrivals[end]
@@ -2,14 +2,35 @@
 Graph visualization for Dijkstra's algorithm
 """
 
-import matplotlib.pyplot as plt
-import networkx as nx
-from matplotlib.patches import Patch
+import hashlib
+import heapq
+import json
+import os
 import textwrap
 
+# matplotlib and networkx are imported inside the drawing functions, so that
+# importing this module (and running the CLI without --visualize) stays cheap.
+
+# Graphs with more vertices are drawn as a subgraph by default
+LARGE_GRAPH_THRESHOLD = 500
+
+# Node and edge labels are drawn only up to this many nodes
+LABEL_LIMIT = 100
+
+# Larger layouts use the spectral instead of the spring layout
+SPRING_LAYOUT_LIMIT = 2000
+
+# Vertices drawn in the shortest path tree of a large graph
+DEFAULT_MAX_NODES = 2000
+
+# Cached node positions, one JSON file per graph hash
+DEFAULT_LAYOUT_CACHE_DIR = os.path.join('.cache', 'layouts')
+
 
 def create_figure_with_text():
     """Create a figure with graph and text areas"""
+    import matplotlib.pyplot as plt
+    
     fig = plt.figure(figsize=(16, 10))
     
     # Create grid layout: left side for graph, right side for text
@@ -40,7 +61,239 @@ def add_text_to_plot(ax_text, text_content, title="Results"):
                 family='monospace', wrap=True)
 
 
-def visualize_graph_with_info(graph, results_text, title="Graph", highlight_edges=None, save_path=None):
+def graph_hash(G):
+    """Compute a stable hash of a NetworkX graph's nodes and edges
+    
+    Args:
+        G: NetworkX graph
+        
+    Returns:
+        Hex digest identifying the graph structure
+    """
+    digest = hashlib.sha1()
+    digest.update(b'directed' if G.is_directed() else b'undirected')
+    
+    for node in sorted(map(str, G.nodes())):
+        digest.update(node.encode() + b'\0')
+    
+    edges = [(str(u), str(v)) for u, v in G.edges()]
+    if not G.is_directed():
+        # Undirected edges may come out in either orientation
+        edges = [tuple(sorted(edge)) for edge in edges]
+    
+    for u, v in sorted(edges):
+        digest.update(u.encode() + b'\0' + v.encode() + b'\n')
+    
+    return digest.hexdigest()
+
+
+def compute_layout(G, cache_dir=DEFAULT_LAYOUT_CACHE_DIR):
+    """Compute node positions, reusing positions cached on disk
+    
+    Positions are stored per graph hash, so a graph is laid out only once.
+    
+    Args:
+        G: NetworkX graph
+        cache_dir: Directory for cached layouts (None disables caching)
+        
+    Returns:
+        Dictionary mapping node to (x, y) position
+    """
+    import networkx as nx
+    
+    cache_file = None
+    if cache_dir:
+        cache_file = os.path.join(cache_dir, f"{graph_hash(G)}.json")
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            
+            # JSON keys are strings, map them back to the graph's nodes
+            nodes = {str(node): node for node in G.nodes()}
+            return {nodes[key]: tuple(xy) for key, xy in cached.items() if key in nodes}
+    
+    # Spring layout is the bottleneck on big graphs, fewer iterations there
+    # and a spectral layout once it gets quadratic
+    if G.number_of_nodes() <= LABEL_LIMIT:
+        pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    elif G.number_of_nodes() <= SPRING_LAYOUT_LIMIT:
+        pos = nx.spring_layout(G, k=2, iterations=20, seed=42)
+    else:
+        try:
+            pos = nx.spectral_layout(G)
+        except ImportError:
+            # Sparse spectral layout needs scipy
+            pos = nx.spring_layout(G, k=2, iterations=5, seed=42)
+    
+    if cache_file:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({str(node): [float(x), float(y)] for node, (x, y) in pos.items()}, f)
+    
+    return pos
+
+
+def k_hop_neighborhood(graph, vertices, hops=1):
+    """Find all vertices within a number of edges from given vertices
+    
+    Args:
+        graph: Graph object
+        vertices: Iterable of vertices to start from
+        hops: Maximum number of edges (following edge direction)
+        
+    Returns:
+        Set of vertices in the neighborhood
+    """
+    neighborhood = set(vertices)
+    frontier = list(neighborhood)
+    
+    for _ in range(hops):
+        next_frontier = []
+        for vertex in frontier:
+            for neighbor, _ in graph.get_neighbors(vertex):
+                if neighbor not in neighborhood:
+                    neighborhood.add(neighbor)
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    
+    return neighborhood
+
+
+def nearest_tree_vertices(distances, max_nodes):
+    """Select the reachable vertices closest to the start
+    
+    Every predecessor is closer than its successor, so the selection
+    always forms a connected part of the shortest path tree.
+    
+    Args:
+        distances: Dictionary of distances from Dijkstra
+        max_nodes: Maximum number of vertices to select
+        
+    Returns:
+        Set of selected vertices
+    """
+    reachable = [(d, vertex) for vertex, d in distances.items() if d != float('inf')]
+    return {vertex for _, vertex in heapq.nsmallest(max_nodes, reachable)}
+
+
+def build_nx_graph(graph, vertices=None, edges=None):
+    """Create a NetworkX graph for drawing
+    
+    Args:
+        graph: Graph object
+        vertices: Only include edges between these vertices (optional)
+        edges: Only include these (u, v) edges (optional)
+        
+    Returns:
+        NetworkX graph with 'weight' edge attributes
+    """
+    import networkx as nx
+    
+    G = nx.DiGraph() if graph.directed else nx.Graph()
+    
+    if edges is not None:
+        for u, v in edges:
+            for neighbor, weight in graph.get_neighbors(u):
+                if neighbor == v:
+                    G.add_edge(u, v, weight=weight)
+                    break
+    elif vertices is not None:
+        for u in vertices:
+            for v, weight in graph.get_neighbors(u):
+                if v in vertices and not G.has_edge(u, v):
+                    G.add_edge(u, v, weight=weight)
+    else:
+        for u, v, weight in graph.get_edges():
+            G.add_edge(u, v, weight=weight)
+    
+    return G
+
+
+def draw_graph_edges(G, pos, ax, edge_colors, edge_widths, directed):
+    """Draw edges, rasterized and without arrow patches on large graphs"""
+    import networkx as nx
+    
+    if G.number_of_nodes() > LABEL_LIMIT:
+        # Highlighted (wider) edges last, drawn above the nodes so they stay visible
+        order = sorted(range(len(edge_widths)), key=lambda i: edge_widths[i])
+        edges = list(G.edges())
+        
+        # A single rasterized line collection instead of one patch per edge
+        collection = nx.draw_networkx_edges(G, pos, edgelist=[edges[i] for i in order],
+                                            edge_color=[edge_colors[i] for i in order],
+                                            width=[edge_widths[i] for i in order],
+                                            alpha=0.7, arrows=False, ax=ax)
+        collection.set_rasterized(True)
+        collection.set_zorder(3)
+    elif directed:
+        nx.draw_networkx_edges(G, pos, edge_color=edge_colors, 
+                             width=edge_widths, alpha=0.7,
+                             arrowsize=20, arrowstyle='->', ax=ax)
+    else:
+        nx.draw_networkx_edges(G, pos, edge_color=edge_colors, 
+                             width=edge_widths, alpha=0.7, ax=ax)
+
+
+def use_headless_backend():
+    """Switch matplotlib to the non-interactive Agg backend"""
+    import matplotlib
+    
+    matplotlib.use('Agg', force=True)
+
+
+def finish_figure(fig, save_path=None, show=True, dpi=300, fmt=None):
+    """Save and/or show a finished figure
+    
+    Args:
+        fig: Matplotlib figure
+        save_path: Path to save the figure (optional)
+        show: Show the figure window; when False the figure is closed instead
+        dpi: Resolution of the saved figure
+        fmt: File format of the saved figure (default: from save_path extension)
+    """
+    import matplotlib.pyplot as plt
+    
+    if save_path:
+        fig.savefig(save_path, dpi=dpi, format=fmt, bbox_inches='tight')
+    
+    if show:
+        plt.show()
+    else:
+        # Free the figure, batch jobs render many of them
+        plt.close(fig)
+
+
+def select_path_subgraph(graph, highlight_edges, subgraph=None, hops=1):
+    """Create the NetworkX graph drawn around highlighted edges
+    
+    Args:
+        graph: Graph object
+        highlight_edges: Set of (u, v) tuples to highlight
+        subgraph: 'full', 'tree' (highlighted edges only) or 'neighborhood'
+                  (k hops around highlighted edges); default picks 'full' for
+                  small graphs and 'neighborhood' for large ones
+        hops: Number of hops for the neighborhood subgraph
+        
+    Returns:
+        NetworkX graph
+    """
+    if subgraph is None:
+        large = len(graph.vertices) > LARGE_GRAPH_THRESHOLD
+        subgraph = 'neighborhood' if large and highlight_edges else 'full'
+    
+    if subgraph == 'tree' and highlight_edges:
+        return build_nx_graph(graph, edges=highlight_edges)
+    
+    if subgraph == 'neighborhood' and highlight_edges:
+        path_vertices = {vertex for edge in highlight_edges for vertex in edge}
+        return build_nx_graph(graph, vertices=k_hop_neighborhood(graph, path_vertices, hops))
+    
+    return build_nx_graph(graph)
+
+
+def visualize_graph_with_info(graph, results_text, title="Graph", highlight_edges=None, save_path=None,
+                              subgraph=None, hops=1, layout_cache_dir=DEFAULT_LAYOUT_CACHE_DIR,
+                              pos=None, show=True, dpi=300, fmt=None):
     """Visualize the graph with information panel
     
     Args:
@@ -49,53 +302,57 @@ def visualize_graph_with_info(graph, results_text, title="Graph", highlight_edge
         title: Title for the plot
         highlight_edges: List of (u, v) tuples to highlight
         save_path: Path to save the figure (optional)
+        subgraph: 'full', 'tree' (highlighted edges only) or 'neighborhood'
+                  (k hops around highlighted edges); default picks 'full' for
+                  small graphs and 'neighborhood' for large ones
+        hops: Number of hops for the neighborhood subgraph
+        layout_cache_dir: Directory for cached layouts (None disables caching)
+        pos: Precomputed node positions covering the drawn graph (optional)
+        show: Show the figure window; when False the figure is only saved
+        dpi: Resolution of the saved figure
+        fmt: File format of the saved figure (default: from save_path extension)
     """
-    fig, ax_graph, ax_text = create_figure_with_text()
+    import networkx as nx
+    
+    highlight_edges = set(highlight_edges or [])
     
     # Create NetworkX graph
-    if graph.directed:
-        G = nx.DiGraph()
-    else:
-        G = nx.Graph()
+    G = select_path_subgraph(graph, highlight_edges, subgraph, hops)
     
-    # Add edges
-    for u, v, weight in graph.get_edges():
-        G.add_edge(u, v, weight=weight)
+    fig, ax_graph, ax_text = create_figure_with_text()
     
     # Use spring layout for better visualization
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    if pos is None:
+        pos = compute_layout(G, layout_cache_dir)
+    
+    show_labels = G.number_of_nodes() <= LABEL_LIMIT
     
     # Draw nodes
     nx.draw_networkx_nodes(G, pos, node_color='lightblue', 
-                          node_size=1500, alpha=0.9, ax=ax_graph)
+                          node_size=1500 if show_labels else 10, alpha=0.9, ax=ax_graph)
     
     # Draw node labels
-    nx.draw_networkx_labels(G, pos, font_size=16, font_weight='bold', ax=ax_graph)
+    if show_labels:
+        nx.draw_networkx_labels(G, pos, font_size=16, font_weight='bold', ax=ax_graph)
     
     # Draw edges
     edge_colors = []
     edge_widths = []
     
     for u, v in G.edges():
-        if highlight_edges and ((u, v) in highlight_edges or 
-                               (v, u) in highlight_edges):
+        if (u, v) in highlight_edges or (v, u) in highlight_edges:
             edge_colors.append('red')
             edge_widths.append(3)
         else:
             edge_colors.append('gray')
             edge_widths.append(1)
     
-    if graph.directed:
-        nx.draw_networkx_edges(G, pos, edge_color=edge_colors, 
-                             width=edge_widths, alpha=0.7,
-                             arrowsize=20, arrowstyle='->', ax=ax_graph)
-    else:
-        nx.draw_networkx_edges(G, pos, edge_color=edge_colors, 
-                             width=edge_widths, alpha=0.7, ax=ax_graph)
+    draw_graph_edges(G, pos, ax_graph, edge_colors, edge_widths, graph.directed)
     
     # Draw edge labels
-    edge_labels = nx.get_edge_attributes(G, 'weight')
-    nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=12, ax=ax_graph)
+    if show_labels:
+        edge_labels = nx.get_edge_attributes(G, 'weight')
+        nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=12, ax=ax_graph)
     
     ax_graph.set_title(title, fontsize=16, fontweight='bold', pad=20)
     ax_graph.axis('off')
@@ -103,15 +360,14 @@ def visualize_graph_with_info(graph, results_text, title="Graph", highlight_edge
     # Add text to the right panel
     add_text_to_plot(ax_text, results_text, "Algorithm Output")
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
+    finish_figure(fig, save_path, show, dpi, fmt)
 
 
-def visualize_path_with_info(graph, path, results_text, title="Dijkstra's Shortest Path", save_path=None):
+def visualize_path_with_info(graph, path, results_text, title="Dijkstra's Shortest Path", save_path=None,
+                             subgraph=None, hops=1, layout_cache_dir=DEFAULT_LAYOUT_CACHE_DIR,
+                             pos=None, show=True, dpi=300, fmt=None):
     """Visualize a specific path in the graph with information panel
     
     Args:
@@ -120,6 +376,13 @@ def visualize_path_with_info(graph, path, results_text, title="Dijkstra's Shorte
         results_text: Text to display in the info panel
         title: Title for the plot
         save_path: Path to save the figure (optional)
+        subgraph: 'full', 'tree' (path only) or 'neighborhood' (k hops around the path)
+        hops: Number of hops for the neighborhood subgraph
+        layout_cache_dir: Directory for cached layouts (None disables caching)
+        pos: Precomputed node positions covering the drawn graph (optional)
+        show: Show the figure window; when False the figure is only saved
+        dpi: Resolution of the saved figure
+        fmt: File format of the saved figure (default: from save_path extension)
     """
     if not path or len(path) < 2:
         print("Cannot visualize path with less than 2 vertices")
@@ -130,10 +393,14 @@ def visualize_path_with_info(graph, path, results_text, title="Dijkstra's Shorte
     for i in range(len(path) - 1):
         highlight_edges.append((path[i], path[i + 1]))
     
-    visualize_graph_with_info(graph, results_text, title, highlight_edges, save_path)
+    visualize_graph_with_info(graph, results_text, title, highlight_edges, save_path,
+                              subgraph, hops, layout_cache_dir, pos, show, dpi, fmt)
 
 
-def visualize_dijkstra_complete(graph, start, distances, predecessors, results_text, save_path=None):
+def visualize_dijkstra_complete(graph, start, distances, predecessors, results_text, save_path=None,
+                                subgraph=None, hops=1, max_nodes=DEFAULT_MAX_NODES,
+                                layout_cache_dir=DEFAULT_LAYOUT_CACHE_DIR,
+                                pos=None, show=True, dpi=300, fmt=None):
     """Visualize the complete result of Dijkstra's algorithm with all information
     
     Args:
@@ -143,55 +410,75 @@ def visualize_dijkstra_complete(graph, start, distances, predecessors, results_t
         predecessors: Dictionary of predecessors from Dijkstra
         results_text: Text to display in the info panel
         save_path: Path to save the figure (optional)
+        subgraph: 'full', 'tree' (shortest path tree of the max_nodes closest
+                  vertices) or 'neighborhood' (k hops around start); default
+                  picks 'full' for small graphs and 'tree' for large ones
+        hops: Number of hops for the neighborhood subgraph
+        max_nodes: Maximum number of vertices drawn in the tree subgraph
+        layout_cache_dir: Directory for cached layouts (None disables caching)
+        pos: Precomputed node positions covering the drawn graph (optional)
+        show: Show the figure window; when False the figure is only saved
+        dpi: Resolution of the saved figure
+        fmt: File format of the saved figure (default: from save_path extension)
     """
-    fig, ax_graph, ax_text = create_figure_with_text()
+    import networkx as nx
+    from matplotlib.patches import Patch
+    
+    if subgraph is None:
+        subgraph = 'tree' if len(graph.vertices) > LARGE_GRAPH_THRESHOLD else 'full'
+    
+    shortest_path_edges = set()
+    for vertex, predecessor in predecessors.items():
+        if predecessor is not None:
+            shortest_path_edges.add((predecessor, vertex))
     
     # Create NetworkX graph
-    if graph.directed:
-        G = nx.DiGraph()
+    if subgraph == 'tree':
+        nearest = nearest_tree_vertices(distances, max_nodes)
+        G = build_nx_graph(graph, edges=[(u, v) for u, v in shortest_path_edges if v in nearest])
+        G.add_node(start)
+    elif subgraph == 'neighborhood':
+        G = build_nx_graph(graph, vertices=k_hop_neighborhood(graph, [start], hops))
     else:
-        G = nx.Graph()
+        G = build_nx_graph(graph)
     
-    # Add edges
-    for u, v, weight in graph.get_edges():
-        G.add_edge(u, v, weight=weight)
+    fig, ax_graph, ax_text = create_figure_with_text()
     
     # Use spring layout
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    if pos is None:
+        pos = compute_layout(G, layout_cache_dir)
     
     # Color nodes based on distance
     node_colors = []
     for vertex in G.nodes():
         if vertex == start:
             node_colors.append('green')  # Start node
-        elif distances[vertex] == float('inf'):
+        elif distances.get(vertex, float('inf')) == float('inf'):
             node_colors.append('red')     # Unreachable
         else:
             node_colors.append('lightblue')  # Reachable
     
+    show_labels = G.number_of_nodes() <= LABEL_LIMIT
+    
     # Draw nodes
     nx.draw_networkx_nodes(G, pos, node_color=node_colors, 
-                          node_size=1500, alpha=0.9, ax=ax_graph)
+                          node_size=1500 if show_labels else 10, alpha=0.9, ax=ax_graph)
     
     # Create node labels with distances
-    node_labels = {}
-    for vertex in G.nodes():
-        if distances[vertex] == float('inf'):
-            node_labels[vertex] = f"{vertex}\n(∞)"
-        else:
-            node_labels[vertex] = f"{vertex}\n({distances[vertex]})"
-    
-    nx.draw_networkx_labels(G, pos, node_labels, font_size=12, ax=ax_graph)
+    if show_labels:
+        node_labels = {}
+        for vertex in G.nodes():
+            if distances.get(vertex, float('inf')) == float('inf'):
+                node_labels[vertex] = f"{vertex}\n(∞)"
+            else:
+                node_labels[vertex] = f"{vertex}\n({distances[vertex]})"
+        
+        nx.draw_networkx_labels(G, pos, node_labels, font_size=12, ax=ax_graph)
     
     # Highlight shortest path tree edges
     edge_colors = []
     edge_widths = []
     
-    shortest_path_edges = set()
-    for vertex in G.nodes():
-        if predecessors[vertex] is not None:
-            shortest_path_edges.add((predecessors[vertex], vertex))
-    
     for u, v in G.edges():
         if (u, v) in shortest_path_edges or (v, u) in shortest_path_edges:
             edge_colors.append('blue')
@@ -200,17 +487,12 @@ def visualize_dijkstra_complete(graph, start, distances, predecessors, results_t
             edge_colors.append('gray')
             edge_widths.append(1)
     
-    if graph.directed:
-        nx.draw_networkx_edges(G, pos, edge_color=edge_colors, 
-                             width=edge_widths, alpha=0.7,
-                             arrowsize=20, arrowstyle='->', ax=ax_graph)
-    else:
-        nx.draw_networkx_edges(G, pos, edge_color=edge_colors, 
-                             width=edge_widths, alpha=0.7, ax=ax_graph)
+    draw_graph_edges(G, pos, ax_graph, edge_colors, edge_widths, graph.directed)
     
     # Draw edge labels
-    edge_labels = nx.get_edge_attributes(G, 'weight')
-    nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=10, ax=ax_graph)
+    if show_labels:
+        edge_labels = nx.get_edge_attributes(G, 'weight')
+        nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=10, ax=ax_graph)
     
     ax_graph.set_title(f"Dijkstra's Algorithm from '{start}'", fontsize=16, fontweight='bold', pad=20)
     ax_graph.axis('off')
@@ -226,12 +508,9 @@ def visualize_dijkstra_complete(graph, start, distances, predecessors, results_t
     # Add text to the right panel
     add_text_to_plot(ax_text, results_text, "Dijkstra's Results")
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    fig.tight_layout()
     
-    plt.show()
+    finish_figure(fig, save_path, show, dpi, fmt)
 
 
 # Keep old functions for backward compatibility but mark as deprecated
@@ -0,0 +1,73 @@
+"""
+Tests of the asyncio query interface (src/async_router.py)
+"""
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.async_router import AsyncRouter
+from src.file_handler import load_graph_from_file
+from src.queries import answer_query
+
+
+class AsyncRouterTest(unittest.TestCase):
+    """Answers, batching and cancellation of AsyncRouter"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.graph = load_graph_from_file('tests/directed_graph.txt')
+    
+    def test_answers_match_answer_query(self):
+        vertices = sorted(self.graph.vertices)
+        queries = [(start, end) for start in vertices for end in vertices + [None, 'Z']]
+        queries.append(('Z', 'A'))
+        
+        async def ask_all():
+            async with AsyncRouter(self.graph) as router:
+                answers = await asyncio.gather(*(router.query(start, end)
+                                                 for start, end in queries))
+                return answers, router.counters
+        
+        answers, counters = asyncio.run(ask_all())
+        for (start, end), answer in zip(queries, answers):
+            self.assertEqual(answer, answer_query(self.graph, start, end))
+        
+        # One search per start vertex that has a query needing one
+        self.assertLessEqual(counters['searches'], len(vertices))
+    
+    def test_requery_after_cancel(self):
+        # The only executor thread is held, so the search of the first
+        # query is dispatched but cannot finish before it is cancelled
+        executor = ThreadPoolExecutor(max_workers=1)
+        gate = threading.Event()
+        executor.submit(gate.wait)
+        
+        async def cancel_and_requery():
+            router = AsyncRouter(self.graph, executor=executor)
+            first = asyncio.create_task(router.query('A', 'F'))
+            while not router._running:
+                await asyncio.sleep(0)
+            
+            # The retry runs before the cancelled search is cleaned up
+            first.cancel()
+            retry = asyncio.create_task(router.query('A', 'F'))
+            await asyncio.sleep(0)
+            gate.set()
+            
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            return await asyncio.wait_for(retry, timeout=10)
+        
+        try:
+            answer = asyncio.run(cancel_and_requery())
+        finally:
+            gate.set()
+            executor.shutdown()
+        
+        self.assertEqual(answer, answer_query(self.graph, 'A', 'F'))
+
+
+if __name__ == '__main__':
+    unittest.main()
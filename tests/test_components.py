@@ -0,0 +1,52 @@
+"""
+Tests of the component index of Graph (src/graph.py)
+"""
+
+import unittest
+
+from src.file_handler import load_graph_from_file
+from src.graph import Graph
+
+
+class ComponentIndexTest(unittest.TestCase):
+    """The index is built on first use and then follows add_edge"""
+    
+    def two_parts(self, directed):
+        graph = Graph(directed=directed)
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('C', 'B', 2)
+        graph.add_edge('D', 'E', 3)
+        return graph
+    
+    def test_built_on_first_use(self):
+        for directed in (True, False):
+            with self.subTest(directed=directed):
+                graph = self.two_parts(directed)
+                self.assertIsNone(graph._components)
+                self.assertTrue(graph.same_component('A', 'C'))
+                self.assertFalse(graph.same_component('A', 'D'))
+                self.assertTrue(graph.cannot_reach('E', 'A'))
+    
+    def test_add_edge_after_first_use(self):
+        graph = self.two_parts(directed=False)
+        self.assertTrue(graph.cannot_reach('A', 'E'))
+        graph.add_edge('C', 'D', 4)
+        self.assertFalse(graph.cannot_reach('A', 'E'))
+    
+    def test_masked_graph_keeps_components(self):
+        graph = load_graph_from_file('tests/image_graph.txt')
+        with graph.masked(vertices=['1']):
+            self.assertTrue(graph.same_component('1', '5'))
+        self.assertFalse(graph.cannot_reach('1', '5'))
+    
+    def test_reversed_and_csr_graphs(self):
+        graph = self.two_parts(directed=True)
+        self.assertTrue(graph.reversed().same_component('A', 'C'))
+        
+        loaded = graph.csr().to_graph()
+        self.assertTrue(loaded.same_component('C', 'A'))
+        self.assertFalse(loaded.same_component('A', 'E'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests of graphs seen through a selected edge weight (src/edge_attributes.py)
+"""
+
+import unittest
+
+from src.dijkstra import dijkstra
+from src.engines import choose_engine
+from src.file_handler import load_from_json
+
+
+class WeightedViewTest(unittest.TestCase):
+    """A WeightedView uses the selected costs everywhere"""
+    
+    def setUp(self):
+        # Negative stored weights, non-negative tolls
+        self.graph = load_from_json({'directed': True, 'edges': [
+            {'from': 'A', 'to': 'B', 'weight': -1, 'toll': 4},
+            {'from': 'B', 'to': 'C', 'weight': 2, 'toll': 1},
+            {'from': 'A', 'to': 'C', 'weight': 9, 'toll': 6},
+        ]})
+        self.view = self.graph.weighted_by('toll')
+    
+    def test_edges_and_stats(self):
+        self.assertEqual(sorted(self.view.get_edges()),
+                         [('A', 'B', 4.0), ('A', 'C', 6.0), ('B', 'C', 1.0)])
+        stats = self.view.get_graph_stats()
+        self.assertEqual(stats['total_weight'], 11.0)
+        self.assertFalse(stats['has_negative_edges'])
+    
+    def test_engine_choice(self):
+        self.assertEqual(choose_engine(self.graph), 'bellman_ford')
+        self.assertEqual(choose_engine(self.view), 'dijkstra')
+    
+    def test_neighbors_built_once(self):
+        neighbors = self.view.get_neighbors('A')
+        self.assertEqual(neighbors, [('B', 4.0), ('C', 6.0)])
+        self.assertIs(self.view.get_neighbors('A'), neighbors)
+        self.assertEqual(self.view.get_edge_weight('A', 'C'), 6.0)
+    
+    def test_search_and_csr(self):
+        distances, _ = dijkstra(self.graph, 'A', weight='toll')
+        self.assertEqual(distances['C'], 5.0)
+        self.assertEqual(self.view.csr().weights.tolist(), [4.0, 6.0, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Equivalence of the shortest path engines with dijkstra() on random graphs
+"""
+
+import random
+import unittest
+
+from src.bellman_ford import bellman_ford
+from src.dijkstra import dijkstra
+from src.engines import NUMBA_AVAILABLE, SCIPY_AVAILABLE
+from src.graph import Graph
+
+
+def random_graph(seed, num_vertices=60, num_edges=150, directed=True):
+    """Random graph with parallel edges, self-loops and unreachable vertices
+    
+    Weights are random floats, so shortest paths (and predecessors) are unique.
+    """
+    rng = random.Random(seed)
+    graph = Graph(directed=directed)
+    names = [f"v{i}" for i in range(num_vertices)]
+    
+    for _ in range(num_edges):
+        graph.add_edge(rng.choice(names), rng.choice(names), rng.uniform(0.1, 10.0))
+    
+    # Every name is a vertex, plus one that has no edges at all
+    graph.vertices.update(names)
+    graph.vertices.add('isolated')
+    return graph
+
+
+def shifted_graph(graph, potentials):
+    """Reweight edges by w + p(u) - p(v), keeping shortest paths but adding negative edges"""
+    shifted = Graph(directed=True)
+    shifted.vertices.update(graph.vertices)
+    for u in graph.vertices:
+        for v, weight in graph.get_neighbors(u):
+            shifted.add_edge(u, v, weight + potentials[u] - potentials[v])
+    return shifted
+
+
+class EngineEquivalenceTest(unittest.TestCase):
+    """Every engine returns the distances and predecessors of dijkstra()"""
+    
+    def assert_same_result(self, expected, actual):
+        expected_distances, expected_predecessors = expected
+        distances, predecessors = actual
+        
+        self.assertEqual(distances.keys(), expected_distances.keys())
+        for vertex, distance in expected_distances.items():
+            self.assertAlmostEqual(distances[vertex], distance, places=9, msg=vertex)
+        self.assertEqual(predecessors, expected_predecessors)
+    
+    def check_engine(self, search):
+        for seed in range(10):
+            for directed in (True, False):
+                graph = random_graph(seed, directed=directed)
+                for start in ['v0', 'v1', 'isolated']:
+                    with self.subTest(seed=seed, directed=directed, start=start):
+                        self.assert_same_result(dijkstra(graph, start), search(graph, start))
+    
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+    def test_numba(self):
+        from src.numba_engine import numba_dijkstra
+        
+        self.check_engine(numba_dijkstra)
+    
+    @unittest.skipUnless(SCIPY_AVAILABLE, "SciPy is not installed")
+    def test_scipy(self):
+        from src.scipy_backend import scipy_dijkstra
+        
+        self.check_engine(scipy_dijkstra)
+    
+    def test_bellman_ford(self):
+        self.check_engine(bellman_ford)
+    
+    def test_bellman_ford_negative_edges(self):
+        for seed in range(10):
+            graph = random_graph(seed)
+            rng = random.Random(seed)
+            potentials = {vertex: rng.uniform(-20.0, 20.0) for vertex in graph.vertices}
+            shifted = shifted_graph(graph, potentials)
+            self.assertTrue(shifted.has_negative_edges())
+            
+            distances, predecessors = dijkstra(graph, 'v0')
+            shifted_distances, shifted_predecessors = bellman_ford(shifted, 'v0')
+            
+            for vertex, distance in distances.items():
+                if distance != float('inf'):
+                    distance += potentials['v0'] - potentials[vertex]
+                self.assertAlmostEqual(shifted_distances[vertex], distance, places=9)
+            self.assertEqual(shifted_predecessors, predecessors)
+
+
+if __name__ == '__main__':
+    unittest.main()
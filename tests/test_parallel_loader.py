@@ -0,0 +1,52 @@
+"""
+Tests of the parallel edge list loader (src/parallel_loader.py)
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.dijkstra import dijkstra
+from src.file_handler import load_from_edge_list
+from src.parallel_loader import load_edge_list_parallel
+
+
+# Parallel edges, a self-loop and equal weights, so ties depend on row order
+EDGE_LIST = """undirected
+# comment
+A B 1
+B C 1
+A C 2
+C A 2
+D D 3
+B D 1
+C D 1
+A B 4
+"""
+
+
+class ParallelLoaderTest(unittest.TestCase):
+    """The parallel loader builds the graph of load_from_edge_list"""
+    
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as f:
+            f.write(EDGE_LIST)
+    
+    def tearDown(self):
+        os.remove(self.filename)
+    
+    def test_same_adjacency_as_sequential(self):
+        expected = load_from_edge_list(EDGE_LIST)
+        for workers, chunks_per_worker in [(1, 1), (2, 3)]:
+            with self.subTest(workers=workers, chunks_per_worker=chunks_per_worker):
+                graph = load_edge_list_parallel(self.filename, workers,
+                                                chunks_per_worker).to_graph()
+                self.assertEqual(graph.vertices, expected.vertices)
+                for vertex in expected.vertices:
+                    self.assertEqual(graph.adj_list[vertex], expected.adj_list[vertex])
+                self.assertEqual(dijkstra(graph, 'A'), dijkstra(expected, 'A'))
+
+
+if __name__ == '__main__':
+    unittest.main()
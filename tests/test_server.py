@@ -0,0 +1,82 @@
+"""
+Tests of the JSON-lines query server (src/server.py)
+"""
+
+import asyncio
+import json
+import unittest
+
+from src.file_handler import load_graph_from_file
+from src.server import QueryServer
+
+
+class HandleRequestTest(unittest.TestCase):
+    """Responses of QueryServer.handle_request"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.graph = load_graph_from_file('tests/test_data.txt')
+    
+    def setUp(self):
+        self.server = QueryServer(self.graph, workers=2, threads=True)
+    
+    def tearDown(self):
+        self.server.close()
+    
+    def ask(self, request):
+        return asyncio.run(self.server.handle_request(json.dumps(request)))
+    
+    def test_answer_echoes_id(self):
+        response = self.ask({'id': 7, 'start': 'A', 'end': 'F'})
+        self.assertEqual(response['id'], 7)
+        self.assertEqual(response['distance'], 13.0)
+    
+    def test_bounded_answer_echoes_id(self):
+        response = self.ask({'id': 'r1', 'start': 'A', 'max_distance': 5})
+        self.assertEqual(response['id'], 'r1')
+        self.assertTrue(all(distance <= 5 for distance in response['distances'].values()))
+    
+    def test_invalid_bounds_echo_id(self):
+        for request in [{'id': 1, 'start': 'A', 'max_distance': 'far'},
+                        {'id': 2, 'start': 'A', 'k_nearest': True},
+                        {'id': 3, 'start': 'A', 'k_nearest': 2, 'targets': 'D'}]:
+            response = self.ask(request)
+            self.assertEqual(response['id'], request['id'])
+            self.assertIn('error', response)
+    
+    def test_invalid_requests_echo_id(self):
+        for request in [{'id': 4, 'end': 'F'},
+                        {'id': 5, 'start': 'Z', 'end': 'F'},
+                        {'id': 6, 'start': 'A', 'end': 'Z'}]:
+            response = self.ask(request)
+            self.assertEqual(response['id'], request['id'])
+            self.assertIn('error', response)
+    
+    def test_request_without_id(self):
+        self.assertNotIn('id', self.ask({'start': 'A', 'end': 'F'}))
+        self.assertIn('error', asyncio.run(self.server.handle_request('not json')))
+
+    def test_integer_vertex_names(self):
+        from src.file_handler import load_from_json
+        
+        graph = load_from_json({'edges': [{'from': 1, 'to': 2, 'weight': 3},
+                                          {'from': 2, 'to': 3, 'weight': 4}]})
+        server = QueryServer(graph, workers=1, threads=True)
+        try:
+            response = asyncio.run(server.handle_request('{"start": 1, "end": 3}'))
+        finally:
+            server.close()
+        self.assertEqual(response['path'], [1, 2, 3])
+    
+    def test_numbers_name_string_vertices(self):
+        graph = load_graph_from_file('tests/image_graph.txt')
+        server = QueryServer(graph, workers=1, threads=True)
+        try:
+            response = asyncio.run(server.handle_request('{"start": 1, "end": 5}'))
+        finally:
+            server.close()
+        self.assertEqual(response['path'], ['1', '2', '5'])
+
+
+if __name__ == '__main__':
+    unittest.main()